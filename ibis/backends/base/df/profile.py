@@ -0,0 +1,247 @@
+"""Profiling of the operations executed by the pandas and dask backends.
+
+Within a `profile` block, every `execute_node` dispatch of the pandas and dask
+executors is recorded with its wall time, the number of rows it consumed and
+produced, and the change in traced memory. The records can be aggregated by
+operation type, exported as JSON, or exported in the folded stack format read
+by flame graph tools like `flamegraph.pl` or speedscope.
+
+For example:
+
+import ibis
+from ibis.backends.base.df.profile import profile
+
+con = ibis.pandas.connect({"t": df})
+t = con.table("t")
+expr = t.group_by("key").aggregate(total=t.value.sum())
+
+with profile() as report:
+    expr.execute()
+
+report.by_op()["Aggregation"].wall_time
+report.to_json("profile.json")
+with open("profile.folded", "w") as f:
+    f.write(report.to_flamegraph())
+
+Times measured for the dask backend cover building the task graph, the graph
+is only computed by the outermost node. Rows of dask collections are unknown
+without computing them and aren't counted.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import time
+import tracemalloc
+from collections import defaultdict, namedtuple
+from typing import Any, Callable, Iterator
+
+import pandas as pd
+from pandas.core.groupby import DataFrameGroupBy, SeriesGroupBy
+
+from ibis.expr.operations import Node
+
+NodeRecord = namedtuple(
+    'NodeRecord',
+    ['op', 'stack', 'wall_time', 'self_time', 'rows_in', 'rows_out', 'memory_delta'],
+)
+NodeRecord.__doc__ = """\
+A single `execute_node` dispatch.
+
+`stack` holds the names of the operations being computed when `op` was
+dispatched, from the outermost one down to `op`. `self_time` is `wall_time`
+without the time spent in the dispatches nested in this one, e.g. the ones of
+the expressions evaluated by a selection. Row counts are `None` when none of
+the values has a known number of rows and `memory_delta` is `None` when memory
+isn't profiled.
+"""
+
+OpStats = namedtuple(
+    'OpStats',
+    ['calls', 'wall_time', 'self_time', 'rows_in', 'rows_out', 'memory_delta'],
+)
+OpStats.__doc__ = "Totals of the dispatches of an operation type."
+
+
+def _num_rows(value: Any) -> int | None:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    elif isinstance(value, (DataFrameGroupBy, SeriesGroupBy)):
+        return len(value.obj)
+    return None
+
+
+def _sum_rows(values) -> int | None:
+    rows = [n for n in map(_num_rows, values) if n is not None]
+    return sum(rows) if rows else None
+
+
+class Profiler:
+    """Records the operations dispatched to `execute_node`.
+
+    Use `profile` to create one.
+
+    Parameters
+    ----------
+    memory
+        Whether to measure the change of the memory traced by `tracemalloc`.
+    """
+
+    current = contextvars.ContextVar('profiler', default=None)
+
+    def __init__(self, memory: bool = True) -> None:
+        self.memory = memory
+        self.records: list[NodeRecord] = []
+        self._stack: list[str] = []
+        self._nested: list[float] = []
+
+    def enter(self, node: Node) -> int:
+        """Mark the start of the computation of `node` and its arguments."""
+        depth = len(self._stack)
+        self._stack.append(type(node).__name__)
+        return depth
+
+    def exit(self, depth: int) -> None:
+        """Mark the end of the computation started by the matching `enter`."""
+        del self._stack[depth:]
+
+    def reset(self) -> None:
+        """Discard the state left over by an execution that failed."""
+        self._stack.clear()
+        self._nested.clear()
+
+    def run(self, func: Callable, node: Node, *args: Any, **kwargs: Any) -> Any:
+        """Call `func(node, *args, **kwargs)` and record the dispatch."""
+        memory = tracemalloc.get_traced_memory()[0] if self.memory else None
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            result = func(node, *args, **kwargs)
+        finally:
+            wall_time = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += wall_time
+
+        if memory is not None:
+            memory = tracemalloc.get_traced_memory()[0] - memory
+        self.records.append(
+            NodeRecord(
+                op=type(node).__name__,
+                stack=tuple(self._stack) or (type(node).__name__,),
+                wall_time=wall_time,
+                self_time=wall_time - nested,
+                rows_in=_sum_rows(args),
+                rows_out=_num_rows(result),
+                memory_delta=memory,
+            )
+        )
+        return result
+
+    def by_op(self) -> dict[str, OpStats]:
+        """Aggregate the records by operation type.
+
+        Returns
+        -------
+        dict[str, OpStats]
+            Totals keyed by operation name, sorted by decreasing self time
+        """
+        totals = defaultdict(list)
+        for record in self.records:
+            totals[record.op].append(record)
+
+        def total(records, field):
+            values = [getattr(r, field) for r in records]
+            values = [v for v in values if v is not None]
+            return sum(values) if values else None
+
+        stats = {
+            op: OpStats(
+                calls=len(records),
+                wall_time=total(records, 'wall_time'),
+                self_time=total(records, 'self_time'),
+                rows_in=total(records, 'rows_in'),
+                rows_out=total(records, 'rows_out'),
+                memory_delta=total(records, 'memory_delta'),
+            )
+            for op, records in totals.items()
+        }
+        return dict(sorted(stats.items(), key=lambda item: -item[1].self_time))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the records and their aggregation by operation type."""
+        return {
+            'ops': {op: stats._asdict() for op, stats in self.by_op().items()},
+            'records': [
+                {**record._asdict(), 'stack': list(record.stack)}
+                for record in self.records
+            ],
+        }
+
+    def to_json(self, path: str | None = None, **kwargs: Any) -> str:
+        """Serialize `to_dict` to JSON.
+
+        Parameters
+        ----------
+        path
+            Optional file to write the JSON document to
+        kwargs
+            Keyword arguments passed to `json.dumps`
+
+        Returns
+        -------
+        str
+            The JSON document
+        """
+        result = json.dumps(self.to_dict(), **kwargs)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(result)
+        return result
+
+    def to_flamegraph(self) -> str:
+        """Return the self times in the folded stack format of flame graphs.
+
+        Each line holds a semicolon separated stack of operation names
+        followed by the total self time of that stack in microseconds.
+        """
+        totals = defaultdict(float)
+        for record in self.records:
+            totals[';'.join(record.stack)] += record.self_time
+        return ''.join(
+            f'{stack} {round(seconds * 1e6):d}\n' for stack, seconds in totals.items()
+        )
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(records={len(self.records):d})'
+
+
+@contextlib.contextmanager
+def profile(memory: bool = True) -> Iterator[Profiler]:
+    """Profile the pandas and dask executions run within the block.
+
+    Parameters
+    ----------
+    memory
+        Whether to measure the change in allocated memory of each operation.
+        This starts `tracemalloc` for the duration of the block when it isn't
+        already tracing, which slows down execution.
+
+    Yields
+    ------
+    Profiler
+        The recorded operations
+    """
+    profiler = Profiler(memory=memory)
+    start_tracing = memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    token = Profiler.current.set(profiler)
+    try:
+        yield profiler
+    finally:
+        Profiler.current.reset(token)
+        if start_tracing:
+            tracemalloc.stop()
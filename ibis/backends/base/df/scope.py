@@ -36,12 +36,16 @@ different time contexts.
 """
 from __future__ import annotations
 
-from collections import namedtuple
-from typing import Any, Iterable, Tuple
+import contextvars
+import sys
+from collections import Counter, namedtuple
+from typing import Any, Iterable, MutableMapping, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ibis.backends.base.df.timecontext import TimeContextRelation, compare_timecontext
+from ibis.common.graph import Graph
 from ibis.expr.operations import Node
 
 TimeContext = Tuple[pd.Timestamp, pd.Timestamp]
@@ -205,3 +209,130 @@ class Scope:
         for s in other_scopes:
             result = result.merge_scope(s, overwrite)
         return result
+
+
+def _sizeof(value: Any) -> int:
+    """Estimate the memory held by an intermediate result without copying it."""
+    value = getattr(value, 'obj', value)  # grouped data
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    elif isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+    elif isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+class ScopeTracker:
+    """Track the intermediate results of executing an expression.
+
+    Results computed by the executor are handed over to the node consuming
+    them and released once that node is computed. Results stored in the
+    execution `cache` (e.g. UDF results) are released once their node has
+    been executed as many times as it is reached from the root of the
+    expression, instead of being held until the whole expression finishes.
+    The number of times each node is reached is only computed once the cache
+    holds results, so executions that don't cache anything don't traverse
+    the expression.
+
+    Optionally the number and estimated size of the live results are measured
+    to report the peak memory held by the execution.
+
+    Parameters
+    ----------
+    node
+        Root node of the execution.
+    cache
+        Cache shared by the executed nodes, keyed by `(node, timecontext)`.
+    measure
+        Whether to measure the size of the live results.
+    """
+
+    __slots__ = (
+        'node',
+        'cache',
+        'measure',
+        '_expected',
+        'executed',
+        'frames',
+        'live',
+        'peak_entries',
+        'peak_bytes',
+    )
+
+    current = contextvars.ContextVar('current', default=None)
+
+    def __init__(
+        self, node: Node, cache: MutableMapping, measure: bool = False
+    ) -> None:
+        self.node = node
+        self.cache = cache
+        self.measure = measure
+        self._expected = None
+        self.executed = Counter()
+        self.frames = []
+        self.live = {}
+        self.peak_entries = 0
+        self.peak_bytes = 0
+
+    @property
+    def expected(self) -> Counter:
+        """The number of times each node is reached from the root."""
+        if self._expected is None:
+            graph = Graph.from_bfs(self.node).toposort()
+            expected = Counter({self.node: 1})
+            for parent in reversed(graph):
+                for child in graph[parent]:
+                    expected[child] += expected[parent]
+            self._expected = expected
+        return self._expected
+
+    def enter(self) -> int:
+        """Start computing a node, returns the frame to pass to `exit`."""
+        self.frames.append([])
+        return len(self.frames) - 1
+
+    def exit(self, frame: int, node: Node, value: Any) -> None:
+        """Record the result of `node` and release the results it consumed."""
+        if self.measure:
+            self._acquire(value)
+            self._update_peak()
+            # frames left behind by failed executions are released too
+            for values in self.frames[frame:]:
+                for consumed in values:
+                    self._release(consumed)
+            del self.frames[frame:]
+            if self.frames:
+                self.frames[-1].append(value)
+        else:
+            del self.frames[frame:]
+
+        self.executed[node] += 1
+        if not self.cache:
+            return
+        expected = self.expected
+        if node in expected and self.executed[node] >= expected[node]:
+            # every consumer has executed, drop the cached results
+            for key in [key for key in self.cache if key[0] == node]:
+                del self.cache[key]
+
+    def _acquire(self, value: Any) -> None:
+        size, count = self.live.get(id(value), (None, 0))
+        self.live[id(value)] = (_sizeof(value) if size is None else size, count + 1)
+
+    def _release(self, value: Any) -> None:
+        key = id(value)
+        if (entry := self.live.get(key)) is not None:
+            size, count = entry
+            if count > 1:
+                self.live[key] = (size, count - 1)
+            else:
+                del self.live[key]
+
+    def _update_peak(self) -> None:
+        sizes = {key: size for key, (size, _) in self.live.items()}
+        for value in self.cache.values():
+            if id(value) not in sizes:
+                sizes[id(value)] = _sizeof(value)
+        self.peak_entries = max(self.peak_entries, len(sizes))
+        self.peak_bytes = max(self.peak_bytes, sum(sizes.values()))
@@ -3,8 +3,9 @@ from __future__ import annotations
 import abc
 import contextlib
 import os
-from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Iterable, Mapping
+import sys
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping
 
 import toolz
 
@@ -16,6 +17,8 @@ import ibis.expr.types as ir
 from ibis import util
 from ibis.backends.base import BaseBackend
 from ibis.backends.base.sql.compiler import Compiler
+from ibis.common.caching import CacheInfo, LRUCache
+from ibis.config import options
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -143,8 +146,8 @@ class BaseSQLBackend(BaseBackend):
         chunk_size: int = 1_000_000,
     ) -> Iterable[list]:
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        with self._compiling_for_execution(expr):
+            _, sql = self._compile_query(expr, limit=limit, params=params)
 
         with self._safe_raw_sql(sql) as cursor:
             while batch := cursor.fetchmany(chunk_size):
@@ -184,17 +187,16 @@ class BaseSQLBackend(BaseBackend):
         """
         pa = self._import_pyarrow()
 
-        schema = expr.as_table().schema()
-        array_type = schema.as_struct().to_pyarrow()
-        arrays = (
-            pa.array(map(tuple, batch), type=array_type)
+        from ibis.formats.pyarrow import record_batch_from_rows
+
+        schema = expr.as_table().schema().to_pyarrow()
+        batches = (
+            record_batch_from_rows(batch, schema)
             for batch in self._cursor_batches(
                 expr, params=params, limit=limit, chunk_size=chunk_size
             )
         )
-        batches = map(pa.RecordBatch.from_struct_array, arrays)
-
-        return pa.ipc.RecordBatchReader.from_batches(schema.to_pyarrow(), batches)
+        return pa.ipc.RecordBatchReader.from_batches(schema, batches)
 
     def execute(
         self,
@@ -234,8 +236,8 @@ class BaseSQLBackend(BaseBackend):
         # feature than all this magic.
         # we don't want to pass `timecontext` to `raw_sql`
         kwargs.pop('timecontext', None)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        with self._compiling_for_execution(expr):
+            query_ast, sql = self._compile_query(expr, limit=limit, params=params)
         self._log(sql)
 
         schema = self.ast_schema(query_ast, **kwargs)
@@ -250,6 +252,92 @@ class BaseSQLBackend(BaseBackend):
 
         return result
 
+    @contextlib.contextmanager
+    def _compiling_for_execution(self, expr: ir.Expr) -> Iterator[None]:
+        """Prepare the backend for compiling `expr` in order to execute it.
+
+        Queries compiled within the block are only valid for executing them
+        with this backend, unlike the output of `compile`.
+        """
+        yield
+
+    @cached_property
+    def _compile_cache(self) -> LRUCache:
+        return LRUCache(sizeof=lambda entry: self._compiled_sizeof(entry[1]))
+
+    def _compiled_sizeof(self, sql: Any) -> int:
+        """Return the size in bytes of the compiled query `sql`."""
+        return sys.getsizeof(sql if isinstance(sql, str) else str(sql))
+
+    def _compile_cache_key(
+        self,
+        expr: ir.Expr,
+        limit: int | str | None,
+        params: Mapping[ir.Scalar, Any] | None,
+    ) -> tuple | None:
+        default_limit = options.sql.default_limit if limit == 'default' else None
+        try:
+            key = (
+                expr.op(),
+                limit,
+                default_limit,
+                frozenset(
+                    (param.op(), value) for param, value in (params or {}).items()
+                ),
+            )
+            hash(key)
+        except TypeError:
+            # unhashable parameter values can't be part of the key
+            return None
+        return key
+
+    def _compile_query(
+        self,
+        expr: ir.Expr,
+        limit: int | str | None = None,
+        params: Mapping[ir.Scalar, Any] | None = None,
+    ) -> tuple[Any, Any]:
+        """Compile `expr` and return its query AST along with the query.
+
+        When `ibis.options.sql.compile_cache_size` is set, the compiled queries
+        are cached per backend instance, keyed on the expression's operation,
+        the requested limit and the bound parameters, so executing the same
+        expression repeatedly skips compilation.
+        """
+        if maxsize := options.sql.compile_cache_size:
+            cache = self._compile_cache
+            cache.maxsize = maxsize
+            cache.maxbytes = options.sql.compile_cache_bytes
+            # the bounds may have been lowered since the last call
+            cache.evict()
+            if (key := self._compile_cache_key(expr, limit, params)) is not None:
+                try:
+                    return cache[key]
+                except KeyError:
+                    pass
+        else:
+            key = None
+
+        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
+        result = query_ast, query_ast.compile()
+        if key is not None:
+            cache[key] = result
+        return result
+
+    def compile_cache_info(self) -> CacheInfo:
+        """Return statistics of the compiled query cache.
+
+        The cache is disabled unless `ibis.options.sql.compile_cache_size` is
+        set.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple of hits, misses, maximum and current number of
+            entries, maximum and current size in bytes.
+        """
+        return self._compile_cache.info()
+
     def _register_in_memory_table(self, _: ops.InMemoryTable) -> None:
         raise NotImplementedError(self.name)
 
@@ -334,7 +422,8 @@ class BaseSQLBackend(BaseBackend):
             The output of compilation. The type of this value depends on the
             backend.
         """
-        return self.compiler.to_ast_ensure_limit(expr, limit, params=params).compile()
+        _, compiled = self._compile_query(expr, limit=limit, params=params)
+        return compiled
 
     def _to_sql(self, expr: ir.Expr, **kwargs) -> str:
         return str(self.compile(expr, **kwargs))
@@ -4,9 +4,10 @@ import abc
 import atexit
 import contextlib
 import getpass
+import time
 import warnings
 from operator import methodcaller
-from typing import TYPE_CHECKING, Any, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping
 
 import sqlalchemy as sa
 from sqlalchemy.ext.compiler import compiles
@@ -15,6 +16,7 @@ from sqlalchemy.sql.expression import ClauseElement, Executable
 
 import ibis
 import ibis.common.exceptions as com
+import ibis.expr.analysis as an
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
@@ -22,7 +24,10 @@ import ibis.expr.types as ir
 from ibis import util
 from ibis.backends.base.sql import BaseSQLBackend
 from ibis.backends.base.sql.alchemy.geospatial import geospatial_supported
-from ibis.backends.base.sql.alchemy.query_builder import AlchemyCompiler
+from ibis.backends.base.sql.alchemy.query_builder import (
+    AlchemyCompiler,
+    loaded_memtables,
+)
 from ibis.backends.base.sql.alchemy.registry import (
     fixed_arity,
     get_sqla_table,
@@ -37,9 +42,11 @@ from ibis.backends.base.sql.alchemy.translator import (
     AlchemyContext,
     AlchemyExprTranslator,
 )
+from ibis.config import options
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 
 __all__ = (
@@ -122,6 +129,11 @@ class BaseAlchemyBackend(BaseSQLBackend):
         self._inspector = None
         self._schemas: dict[str, sch.Schema] = {}
         self._temp_views: set[str] = set()
+        self._sqla_tables: dict[tuple, tuple[float, sa.Table]] = {}
+        # the tables holding the data of large in-memory tables, keyed by the
+        # names of the in-memory tables
+        self._temp_memtables: dict[str, str] = {}
+        self._persistent_memtables: dict[str, str] = {}
 
     @property
     def version(self):
@@ -163,6 +175,62 @@ class BaseAlchemyBackend(BaseSQLBackend):
         with self.begin() as con:
             yield con.execute(*args, **kwargs)
 
+    def _bind_param_values(
+        self, params: Mapping[ir.Scalar, Any] | None
+    ) -> dict[str, Any]:
+        """Return the driver bind parameter values of `params`."""
+        translator = self.compiler.translator_class
+        values = {}
+        for param, value in (params or {}).items():
+            op = param.op()
+            if isinstance(op, ops.Alias):
+                op = op.arg
+            if translator._can_bind_param(dtype := op.output_dtype):
+                values[translator._bind_param_name(op)] = dt.normalize(dtype, value)
+        return values
+
+    def _compiled_sizeof(self, sql: Any) -> int:
+        # the shallow size of a statement doesn't depend on the query, measure
+        # the SQL rendered for the backend's dialect instead
+        if isinstance(sql, sa.sql.ClauseElement):
+            sql = sql.compile(dialect=self.con.dialect)
+        return super()._compiled_sizeof(sql)
+
+    def _compile_cache_key(
+        self,
+        expr: ir.Expr,
+        limit: int | str | None,
+        params: Mapping[ir.Scalar, Any] | None,
+    ) -> tuple | None:
+        bind_params = options.sql.bind_params
+        if bind_params and params:
+            # bound values are substituted after compilation, so statements
+            # compiled for different values can be shared
+            can_bind = self.compiler.translator_class._can_bind_param
+            params = {
+                param: None if can_bind(param.op().output_dtype) else value
+                for param, value in params.items()
+            }
+        if (key := super()._compile_cache_key(expr, limit, params)) is None:
+            return None
+        # statements compiled with inlined values can't be bound and vice versa,
+        # and large in-memory tables are inlined unless they have been loaded
+        loaded = loaded_memtables.get() or {}
+        return (*key, bind_params, frozenset(loaded.items()))
+
+    def _compile_query(
+        self,
+        expr: ir.Expr,
+        limit: int | str | None = None,
+        params: Mapping[ir.Scalar, Any] | None = None,
+    ) -> tuple[Any, Any]:
+        query_ast, sql = super()._compile_query(expr, limit=limit, params=params)
+        if options.sql.bind_params and (values := self._bind_param_values(params)):
+            # the statement may come from the compile cache, bound with the
+            # values of a previous call
+            sql = sql.params(values)
+        return query_ast, sql
+
     @staticmethod
     def _to_geodataframe(df, schema):
         """Convert `df` to a `GeoDataFrame`.
@@ -185,13 +253,45 @@ class BaseAlchemyBackend(BaseSQLBackend):
             df = gpd.GeoDataFrame(df, geometry=geom_col)
         return df
 
+    def _fetch_arrow_table(self, cursor) -> pa.Table | None:
+        """Fetch the results of `cursor` as a pyarrow Table.
+
+        Backends whose drivers can produce Arrow data directly override this
+        method so that results are never materialized as Python tuples.
+        Returning `None` falls back to fetching rows from the cursor.
+        """
+        return None
+
+    @staticmethod
+    def _arrow_to_pandas(table: pa.Table, schema: sch.Schema) -> pd.DataFrame:
+        import pandas as pd
+        import pyarrow.types as pat
+
+        from ibis.formats.pandas import pyarrow_to_pylist
+
+        def convert(col):
+            if pat.is_nested(col.type):
+                return pyarrow_to_pylist(col)
+            elif len(col) and col.null_count == len(col):
+                # pyarrow / duckdb type null literals columns as int32, which
+                # pandas would turn into NaN instead of None
+                return pd.Series([None] * len(col), dtype=object)
+            return col.to_pandas(timestamp_as_object=True)
+
+        return pd.DataFrame(
+            {name: convert(col) for name, col in zip(schema.names, table.columns)}
+        )
+
     def fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
         import pandas as pd
 
         try:
-            df = pd.DataFrame.from_records(
-                cursor, columns=schema.names, coerce_float=True
-            )
+            if (table := self._fetch_arrow_table(cursor)) is not None:
+                df = self._arrow_to_pandas(table, schema)
+            else:
+                df = pd.DataFrame.from_records(
+                    cursor, columns=schema.names, coerce_float=True
+                )
         except Exception:
             # clean up the cursor if we fail to create the DataFrame
             #
@@ -276,6 +376,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
             schema = obj.schema()
 
         self._schemas[self._fully_qualified_name(name, database)] = schema
+        self._invalidate_sqla_table(name, schema=database)
 
         if has_expr := obj is not None:
             # this has to happen outside the `begin` block, so that in-memory
@@ -288,9 +389,13 @@ class BaseAlchemyBackend(BaseSQLBackend):
 
         if has_expr:
             if self.supports_create_or_replace:
+                # the data is copied, so temporary tables can hold the data of
+                # large in-memory tables
+                with self._in_memory_tables_loaded(obj):
+                    compiled = self.compile(obj)
                 ctas = CreateTableAs(
                     name,
-                    self.compile(obj),
+                    compiled,
                     temp=temp,
                     overwrite=overwrite,
                     quote=self.compiler.translator_class._quote_table_names,
@@ -304,7 +409,8 @@ class BaseAlchemyBackend(BaseSQLBackend):
                     # some backends don't support temporary tables
                     temp=self.supports_temporary_tables,
                 )
-                method = self._get_insert_method(obj)
+                with self._in_memory_tables_loaded(obj):
+                    method = self._get_insert_method(obj)
                 insert = table.insert().from_select(tmptable.columns, tmptable.select())
 
                 with self.begin() as bind:
@@ -333,6 +439,63 @@ class BaseAlchemyBackend(BaseSQLBackend):
                 table.create(bind=bind)
         return self.table(name, database=database)
 
+    @contextlib.contextmanager
+    def _in_memory_tables_loaded(
+        self, expr: ir.Expr, temp: bool = True
+    ) -> Iterator[None]:
+        """Compile the large in-memory tables of `expr` as loaded tables.
+
+        In-memory tables with more than `ibis.options.sql.memtable_inline_limit`
+        rows are bulk loaded into a table, which the statements compiled within
+        the block reference instead of compiling the rows to literals.
+
+        Parameters
+        ----------
+        expr
+            The expression to compile
+        temp
+            Whether to load the data into temporary tables, which only suits
+            statements executed right away. Statements outliving the session,
+            such as views, need persistent tables.
+        """
+        limit = options.sql.memtable_inline_limit
+        names = {}
+        if (
+            limit is not None
+            and not self.compiler.cheap_in_memory_tables
+            and self.compiler.supports_temp_in_memory_tables
+        ):
+            loaded = self._temp_memtables if temp else self._persistent_memtables
+            for memtable in an.find_memtables(expr.op()):
+                if len(memtable.data) <= limit:
+                    continue
+                if (name := loaded.get(memtable.name)) is None:
+                    name = self._load_in_memory_table(memtable, temp=temp)
+                    loaded[memtable.name] = name
+                names[memtable.name] = name
+
+        token = loaded_memtables.set(names)
+        try:
+            yield
+        finally:
+            loaded_memtables.reset(token)
+
+    def _compiling_for_execution(self, expr: ir.Expr):
+        return self._in_memory_tables_loaded(expr)
+
+    def _load_in_memory_table(self, op: ops.InMemoryTable, temp: bool = True) -> str:
+        """Bulk load the data of `op` into a table and return its name.
+
+        Temporary tables are named after `op`. Persistent tables get a new
+        name, so that they can't be shadowed by the temporary ones.
+        """
+        name = op.name if temp else util.gen_name("memtable")
+        table = self._table_from_schema(name, op.schema, temp=temp)
+        with self.begin() as bind:
+            table.create(bind=bind)
+            self._bulk_insert(bind, table, op.data.to_frame())
+        return name
+
     def _get_insert_method(self, expr):
         compiled = self.compile(expr)
 
@@ -409,6 +572,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         t = self._get_sqla_table(name, schema=database, autoload=False)
         with self.begin() as bind:
             t.drop(bind=bind, checkfirst=force)
+        self._invalidate_sqla_table(name, schema=database)
 
         qualified_name = self._fully_qualified_name(name, database)
 
@@ -453,8 +617,40 @@ class BaseAlchemyBackend(BaseSQLBackend):
     def _new_sa_metadata():
         return sa.MetaData()
 
+    def _invalidate_sqla_table(
+        self, name: str | None = None, schema: str | None = None
+    ) -> None:
+        """Drop cached reflections of `name`, or of every table if `name` is `None`."""
+        cache = self._sqla_tables
+        if name is None:
+            cache.clear()
+            return
+        for key in [key for key in cache if key[0] == name]:
+            if schema is None or key[1] in (schema, None):
+                del cache[key]
+
     def _get_sqla_table(
-        self, name: str, schema: str | None = None, autoload: bool = True, **_: Any
+        self, name: str, schema: str | None = None, autoload: bool = True, **kwargs: Any
+    ) -> sa.Table:
+        if not autoload or (ttl := options.sql.schema_cache_ttl) is None:
+            return self._reflect_sqla_table(name, schema=schema, autoload=autoload)
+
+        key = name, schema, tuple(sorted(kwargs.items()))
+        now = time.monotonic()
+        try:
+            expires_at, table = self._sqla_tables[key]
+        except KeyError:
+            pass
+        else:
+            if now < expires_at:
+                return table
+
+        table = self._reflect_sqla_table(name, schema=schema, autoload=autoload)
+        self._sqla_tables[key] = now + ttl, table
+        return table
+
+    def _reflect_sqla_table(
+        self, name: str, schema: str | None = None, autoload: bool = True
     ) -> sa.Table:
         meta = self._new_sa_metadata()
         with warnings.catch_warnings():
@@ -553,6 +749,8 @@ class BaseAlchemyBackend(BaseSQLBackend):
         query
             DDL or DML statement
         """
+        # the statement may have changed any table's definition
+        self._invalidate_sqla_table()
         return self.con.connect().execute(
             sa.text(query) if isinstance(query, str) else query
         )
@@ -612,7 +810,22 @@ class BaseAlchemyBackend(BaseSQLBackend):
         with self.con.begin() as con:
             if overwrite:
                 con.execute(t.delete())
-            con.execute(t.insert(), df.to_dict(orient="records"))
+            self._bulk_insert(con, t, df)
+
+    def _bulk_insert(
+        self, con: sa.engine.Connection, table: sa.Table, df: pd.DataFrame
+    ) -> None:
+        """Insert the rows of `df` into `table` using the connection `con`.
+
+        Backends with a native bulk loading mechanism override this; the
+        default executes the insert statement for batches of
+        `ibis.options.sql.insert_batch_size` rows at a time.
+        """
+        batch_size = options.sql.insert_batch_size or len(df)
+        insert = table.insert()
+        for start in range(0, len(df), batch_size or 1):
+            batch = df.iloc[start : start + batch_size]
+            con.execute(insert, batch.to_dict(orient="records"))
 
     def insert(
         self,
@@ -674,9 +887,10 @@ class BaseAlchemyBackend(BaseSQLBackend):
 
             from_table_expr = obj
 
-            with self.begin() as bind:
+            # the in-memory tables are loaded before the transaction begins
+            with self._in_memory_tables_loaded(obj), self.begin() as bind:
                 if from_table_expr is not None:
-                    compiled = from_table_expr.compile()
+                    compiled = self.compile(from_table_expr)
                     columns = [
                         self.con.dialect.normalize_name(c)
                         for c in from_table_expr.columns
@@ -745,6 +959,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
             for line in lines:
                 con.exec_driver_sql(line, parameters=params or ())
         self._temp_views.add(raw_name)
+        self._invalidate_sqla_table(raw_name)
         self._register_temp_view_cleanup(name, raw_name)
 
     @abc.abstractmethod
@@ -771,7 +986,10 @@ class BaseAlchemyBackend(BaseSQLBackend):
     ) -> ir.Table:
         import sqlalchemy_views as sav
 
-        source = self.compile(obj)
+        # the view outlives the session, large in-memory tables can't be held
+        # by temporary tables
+        with self._in_memory_tables_loaded(obj, temp=False):
+            source = self.compile(obj)
         view = sav.CreateView(
             sa.Table(
                 name,
@@ -784,6 +1002,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         )
         with self.begin() as con:
             con.execute(view)
+        self._invalidate_sqla_table(name, schema=database)
         return self.table(name, database=database)
 
     def drop_view(
@@ -803,3 +1022,4 @@ class BaseAlchemyBackend(BaseSQLBackend):
 
         with self.begin() as con:
             con.execute(view)
+        self._invalidate_sqla_table(name, schema=database)
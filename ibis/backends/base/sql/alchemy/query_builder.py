@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextvars
 import functools
 
 import sqlalchemy as sa
@@ -20,6 +21,10 @@ from ibis.backends.base.sql.compiler import (
 )
 from ibis.backends.base.sql.compiler.base import SetOp
 
+# the names of the tables holding the data of the in-memory tables of the
+# statement being compiled, keyed by the names of the in-memory tables
+loaded_memtables = contextvars.ContextVar('loaded_memtables', default=None)
+
 
 class _AlchemyTableSetFormatter(TableSetFormatter):
     def get_result(self):
@@ -145,9 +150,10 @@ class _AlchemyTableSetFormatter(TableSetFormatter):
 
     def _format_in_memory_table(self, op, ref_op, translator):
         columns = translator._schema_to_sqlalchemy_columns(ref_op.schema)
-        if self.context.compiler.cheap_in_memory_tables:
+        loaded = loaded_memtables.get() or {}
+        if self.context.compiler.cheap_in_memory_tables or ref_op.name in loaded:
             result = sa.Table(
-                ref_op.name,
+                loaded.get(ref_op.name, ref_op.name),
                 sa.MetaData(),
                 *columns,
                 quote=translator._quote_table_names,
@@ -378,6 +384,8 @@ class AlchemyCompiler(Compiler):
     difference_class = AlchemyDifference
 
     supports_indexed_grouping_keys = True
+    # whether in-memory tables can be loaded into temporary tables
+    supports_temp_in_memory_tables = True
 
     @classmethod
     def to_sql(cls, expr, context=None, params=None, exists=False):
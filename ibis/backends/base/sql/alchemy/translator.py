@@ -18,6 +18,7 @@ from ibis.backends.base.sql.alchemy.registry import (
     sqlalchemy_operation_registry,
 )
 from ibis.backends.base.sql.compiler import ExprTranslator, QueryContext
+from ibis.config import options
 
 _DEFAULT_DIALECT = DefaultDialect()
 
@@ -84,6 +85,32 @@ class AlchemyExprTranslator(ExprTranslator):
         dialect_cls = sa.dialects.registry.load(name)
         return dialect_cls()
 
+    @staticmethod
+    def _can_bind_param(dtype: dt.DataType) -> bool:
+        return (
+            dtype.is_boolean()
+            or dtype.is_integer()
+            or dtype.is_floating()
+            or dtype.is_string()
+            or dtype.is_date()
+            or dtype.is_timestamp()
+        )
+
+    @staticmethod
+    def _bind_param_name(op: ops.ScalarParameter) -> str:
+        # avoid clashing with the names sqlalchemy generates for literals
+        return f"ibis_{op.name}"
+
+    def _trans_param(self, op):
+        dtype = op.output_dtype
+        if not (options.sql.bind_params and self._can_bind_param(dtype)):
+            return super()._trans_param(op)
+        return sa.bindparam(
+            self._bind_param_name(op),
+            dt.normalize(dtype, self.context.params[op]),
+            type_=self.get_sqla_type(dtype),
+        )
+
     def _schema_to_sqlalchemy_columns(self, schema):
         return [
             sa.Column(name, self.get_sqla_type(dtype), quote=self._quote_column_names)
@@ -321,8 +321,7 @@ class Backend(BaseSQLBackend):
         """
         # TODO: upstream needs to pass params to raw_sql, I think.
         kwargs.pop("timecontext", None)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        query_ast, sql = self._compile_query(expr, limit=limit, params=params)
         self._log(sql)
         cursor = self.raw_sql(sql, params=params, **kwargs)
         schema = self.ast_schema(query_ast, **kwargs)
@@ -372,8 +371,7 @@ class Backend(BaseSQLBackend):
         **kwargs: Any,
     ) -> pa.Table:
         self._import_pyarrow()
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        _, sql = self._compile_query(expr, limit=limit, params=params)
         cursor = self.raw_sql(sql, params=params, **kwargs)
         table = self._cursor_to_arrow(cursor)
         if isinstance(expr, ir.Scalar):
@@ -398,8 +396,7 @@ class Backend(BaseSQLBackend):
 
         schema = expr.as_table().schema()
 
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        _, sql = self._compile_query(expr, limit=limit, params=params)
         cursor = self.raw_sql(sql, params=params, **kwargs)
         batch_iter = self._cursor_to_arrow(
             cursor,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any, Mapping, MutableMapping
 
 import dask
@@ -15,9 +16,11 @@ import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis.backends.dask.core import execute_and_reset
+from ibis.backends.dask.parquet import pruned_tables, pushdown
 from ibis.backends.pandas import BasePandasBackend
 from ibis.backends.pandas.core import _apply_schema
 from ibis.formats.dask import schema_from_dask_dataframe
+from ibis.util import gen_name, normalize_filename
 
 # Make sure that the pandas backend options have been loaded
 ibis.pandas  # noqa: B018
@@ -61,6 +64,8 @@ class Backend(BasePandasBackend):
                     f" got an instance of '{type(v).__name__}' instead."
                 )
         super().do_connect(dictionary)
+        # the arguments of the tables registered with `read_parquet`
+        self._parquet_sources: dict[str, tuple[str, dict, dd.DataFrame]] = {}
 
     @property
     def version(self):
@@ -108,7 +113,44 @@ class Backend(BasePandasBackend):
             for k, v in ({} if params is None else params).items()
         }
 
-        return execute_and_reset(query.op(), params=params, **kwargs)
+        node = query.op()
+        # read the parquet tables with only the needed columns and rows
+        tables = pushdown(node) if self._parquet_sources else {}
+        with pruned_tables(tables):
+            return execute_and_reset(node, params=params, **kwargs)
+
+    def read_parquet(
+        self, path: str | Path, table_name: str | None = None, **kwargs: Any
+    ) -> ir.Table:
+        """Register a parquet file as a table in the current backend.
+
+        The data is read lazily. When executing an expression, only the
+        columns it references are read and the simple comparisons filtering
+        the table are passed to `dd.read_parquet` to skip row groups and
+        partitions.
+
+        Parameters
+        ----------
+        path
+            The data source. May be a path to a file or directory of parquet
+            files.
+        table_name
+            An optional name to use for the created table. This defaults to
+            a sequentially generated name.
+        **kwargs
+            Additional keyword arguments passed to `dd.read_parquet`.
+
+        Returns
+        -------
+        ir.Table
+            The just-registered table
+        """
+        path = normalize_filename(path)
+        table_name = table_name or gen_name("read_parquet")
+        df = dd.read_parquet(path, **kwargs)
+        self.dictionary[table_name] = df
+        self._parquet_sources[table_name] = path, kwargs, df
+        return self.table(table_name)
 
     def table(self, name: str, schema: sch.Schema = None):
         df = self.dictionary[name]
@@ -116,9 +116,11 @@ from typing import Any, Mapping
 import dask.dataframe as dd
 from multipledispatch import Dispatcher
 
+import ibis
 import ibis.common.exceptions as com
 import ibis.expr.operations as ops
-from ibis.backends.base.df.scope import Scope
+from ibis.backends.base.df.profile import Profiler
+from ibis.backends.base.df.scope import Scope, ScopeTracker
 from ibis.backends.base.df.timecontext import TimeContext, canonicalize_context
 from ibis.backends.dask import aggcontext as agg_ctx
 from ibis.backends.dask.dispatch import (
@@ -292,6 +294,12 @@ def execute_until_in_scope(
             f'for type:\n{type(node).__name__}.'
         )
 
+    # track the results consumed while computing this node
+    if (tracker := ScopeTracker.current.get()) is not None:
+        frame = tracker.enter()
+    if (profiler := Profiler.current.get()) is not None:
+        depth = profiler.enter(node)
+
     scopes = [
         execute_until_in_scope(
             arg,
@@ -320,7 +328,12 @@ def execute_until_in_scope(
         new_scope.get_value(arg, timecontext) if isinstance(arg, ops.Node) else arg
         for (arg, timecontext) in zip(computable_args, arg_timecontexts)
     ]
-    result = execute_node(
+    run = (
+        execute_node
+        if profiler is None
+        else functools.partial(profiler.run, execute_node)
+    )
+    result = run(
         node,
         *data,
         scope=scope,
@@ -330,6 +343,10 @@ def execute_until_in_scope(
         **kwargs,
     )
     computed = post_execute_(node, result, timecontext=timecontext)
+    if tracker is not None:
+        tracker.exit(frame, node, computed)
+    if profiler is not None:
+        profiler.exit(depth)
     return Scope({node: computed}, timecontext)
 
 
@@ -395,14 +412,40 @@ def main_execute(
     # calls everywhere
     params = {k.op() if isinstance(k, ir.Expr) else k: v for k, v in params.items()}
     scope = scope.merge_scope(Scope(params, timecontext))
-    return execute_with_scope(
-        node,
-        scope,
-        timecontext=timecontext,
-        aggcontext=aggcontext,
-        cache=cache,
-        **kwargs,
-    )
+    if ScopeTracker.current.get() is not None:
+        # nested execution, tracked by the outermost one
+        return execute_with_scope(
+            node,
+            scope,
+            timecontext=timecontext,
+            aggcontext=aggcontext,
+            cache=cache,
+            **kwargs,
+        )
+
+    report = getattr(ibis.options.dask, 'report_scope_size', False)
+    tracker = ScopeTracker(node, cache, measure=report)
+    token = ScopeTracker.current.set(tracker)
+    try:
+        result = execute_with_scope(
+            node,
+            scope,
+            timecontext=timecontext,
+            aggcontext=aggcontext,
+            cache=cache,
+            **kwargs,
+        )
+    finally:
+        ScopeTracker.current.reset(token)
+        if (profiler := Profiler.current.get()) is not None:
+            profiler.reset()
+
+    if report:
+        (ibis.options.verbose_log or print)(
+            f"peak scope size: {tracker.peak_entries:d} results, "
+            f"{tracker.peak_bytes:d} bytes"
+        )
+    return result
 
 
 def execute_and_reset(
@@ -20,6 +20,7 @@ import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
 import ibis.util
+from ibis.backends.base.df.timecontext import TimeContext
 from ibis.backends.dask import Backend as DaskBackend
 from ibis.backends.dask.core import execute
 from ibis.backends.dask.dispatch import execute_node
@@ -30,6 +31,7 @@ from ibis.backends.dask.execution.util import (
     register_types_to_dispatcher,
     rename_index,
 )
+from ibis.backends.dask.parquet import get_pruned_table
 from ibis.backends.pandas.core import (
     date_types,
     integer_types,
@@ -168,7 +170,14 @@ DASK_DISPATCH_TYPES: TypeRegistrationDict = {
 
 register_types_to_dispatcher(execute_node, DASK_DISPATCH_TYPES)
 
-execute_node.register(ops.DatabaseTable, DaskBackend)(execute_database_table_client)
+
+@execute_node.register(ops.DatabaseTable, DaskBackend)
+def execute_database_table_client_dask(
+    op, client, timecontext: TimeContext | None, **kwargs
+):
+    if not timecontext and (df := get_pruned_table(op)) is not None:
+        return df
+    return execute_database_table_client(op, client, timecontext=timecontext, **kwargs)
 
 
 @execute_node.register(ops.Alias, object)
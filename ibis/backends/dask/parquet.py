@@ -0,0 +1,89 @@
+"""Push projections and predicates into the reads of parquet sources.
+
+Tables registered with `Backend.read_parquet` are read lazily. Before an
+expression is executed, the columns it references and the simple comparisons
+filtering the table are collected, and the table is read with
+`dd.read_parquet(columns=..., filters=...)` so that dask skips the unused
+columns, row groups and partitions.
+
+The pushed down filters only prune data, the predicates are still evaluated
+by the executor.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from typing import Iterator
+
+import dask.dataframe as dd
+
+import ibis.expr.operations as ops
+from ibis.backends.pandas.scan import pushed_filters, referenced_columns
+from ibis.common.graph import Graph
+
+# the pruned tables of the expression being executed
+_pruned_tables = contextvars.ContextVar('pruned_tables', default=None)
+
+
+def pushdown(node: ops.Node) -> dict[ops.Node, dd.DataFrame]:
+    """Read the parquet tables of `node` with the pushed down operations.
+
+    Parameters
+    ----------
+    node
+        The operation to execute
+
+    Returns
+    -------
+    dict[ops.Node, dd.DataFrame]
+        Mapping of the parquet tables of `node` to their pruned data
+    """
+    graph = Graph.from_bfs(node)
+    parents = graph.invert()
+
+    result = {}
+    for table in graph:
+        if not isinstance(table, ops.DatabaseTable):
+            continue
+        client = table.source
+        source = getattr(client, '_parquet_sources', {}).get(table.name)
+        # the table may have been replaced since it was registered
+        if source is None or client.dictionary.get(table.name) is not source[2]:
+            continue
+
+        path, kwargs, _ = source
+        columns = referenced_columns(table, parents[table])
+        # the filters passed to `read_parquet` are kept as they are
+        if 'filters' in kwargs:
+            filters = []
+        else:
+            filters = pushed_filters(node, table, parents[table])
+        if columns is None and not filters:
+            continue
+
+        read_kwargs = dict(kwargs)
+        if columns is not None:
+            read_kwargs['columns'] = [
+                name for name in table.schema.names if name in columns
+            ]
+        if filters:
+            read_kwargs['filters'] = filters
+        result[table] = dd.read_parquet(path, **read_kwargs)
+    return result
+
+
+@contextlib.contextmanager
+def pruned_tables(tables: dict[ops.Node, dd.DataFrame]) -> Iterator[None]:
+    """Read the tables in `tables` from the given data within the block."""
+    token = _pruned_tables.set(tables)
+    try:
+        yield
+    finally:
+        _pruned_tables.reset(token)
+
+
+def get_pruned_table(op: ops.DatabaseTable) -> dd.DataFrame | None:
+    """Return the pruned data of `op`, `None` if it must be fully read."""
+    tables = _pruned_tables.get()
+    return None if tables is None else tables.get(op)
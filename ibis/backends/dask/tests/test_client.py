@@ -124,3 +124,67 @@ def test_invalid_connection_parameter_types(npartitions):
     con = ibis.dask.connect()
     with pytest.raises(TypeError, match=expeced_msg):
         con.from_dataframe("file.csv")
+
+
+@pytest.fixture
+def parquet_table(tmp_path):
+    df = pd.DataFrame(
+        {
+            "a": np.arange(100),
+            "b": np.arange(100) * 1.5,
+            "c": list("xy") * 50,
+        }
+    )
+    path = tmp_path / "t.parquet"
+    df.to_parquet(path, row_group_size=10)
+    return ibis.dask.connect().read_parquet(path, table_name="t"), df
+
+
+def test_read_parquet_pushdown(parquet_table):
+    from ibis.backends.dask.parquet import pushdown
+
+    t, df = parquet_table
+    expr = t.filter([t.a >= 90, t.c.isin(["x"])])[["a", "b"]]
+
+    (pruned,) = pushdown(expr.op()).values()
+    assert list(pruned.columns) == ["a", "b", "c"]
+    assert len(pruned.compute()) == 5
+
+    result = expr.execute()
+    expected = df.loc[(df.a >= 90) & (df.c == "x"), ["a", "b"]].reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_parquet_projection_only(parquet_table):
+    from ibis.backends.dask.parquet import pushdown
+
+    t, df = parquet_table
+    expr = t.group_by("c").aggregate(total=t.b.sum()).order_by("c")
+
+    (pruned,) = pushdown(expr.op()).values()
+    assert list(pruned.columns) == ["b", "c"]
+
+    result = expr.execute()
+    expected = df.groupby("c").b.sum().rename("total").reset_index()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_parquet_no_unsafe_filters(parquet_table):
+    from ibis.backends.dask.parquet import pushdown
+
+    t, df = parquet_table
+    # the mean has to be computed over the whole table
+    expr = t.filter(t.a > t.a.mean()).count()
+    assert not pushdown(expr.op())
+    assert expr.execute() == (df.a > df.a.mean()).sum()
+
+
+def test_read_parquet_user_filters(tmp_path):
+    df = pd.DataFrame({"a": np.arange(10), "b": np.arange(10) % 2})
+    path = tmp_path / "t.parquet"
+    df.to_parquet(path)
+    t = ibis.dask.connect().read_parquet(path, filters=[("a", ">=", 5)])
+
+    result = t.filter(t.b == 1).execute()
+    expected = df[(df.a >= 5) & (df.b == 1)].reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
@@ -4,6 +4,7 @@ from dask.dataframe.utils import tm
 import ibis
 import ibis.common.exceptions as com
 import ibis.expr.operations as ops
+from ibis.backends.base.df.profile import profile
 from ibis.backends.base.df.scope import Scope
 from ibis.backends.pandas.dispatch import execute_node as pandas_execute_node
 
@@ -107,3 +108,16 @@ def test_new_dispatcher():
     types = (ops.TableColumn, dd.DataFrame)
     assert execute_node.dispatch(*types) is not None
     assert pandas_execute_node.dispatch(*types).__name__ == 'raise_unknown_op'
+
+
+def test_profile(ibis_table):
+    expr = ibis_table.mutate(a=ibis_table.plain_int64 + 1)
+    with profile(memory=False) as report:
+        result = expr.execute()
+    assert len(result) == 3
+
+    stats = report.by_op()
+    assert stats['Add'].calls >= 1
+    # rows of dask collections aren't known without computing them
+    assert stats['Add'].rows_out is None
+    assert report.to_flamegraph()
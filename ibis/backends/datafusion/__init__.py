@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import os
 import re
+import shutil
+import tempfile
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
 
 import pyarrow as pa
 
+import ibis
 import ibis.common.exceptions as com
 import ibis.expr.analysis as an
 import ibis.expr.operations as ops
@@ -14,7 +18,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis.backends.base import BaseBackend
 from ibis.backends.datafusion.compiler import translate
-from ibis.util import gen_name, normalize_filename
+from ibis.util import experimental, gen_name, normalize_filename
 
 try:
     from datafusion import ExecutionContext as SessionContext
@@ -250,6 +254,11 @@ class Backend(BaseBackend):
         limit: int | str | None = None,
         **kwargs: Any,
     ) -> datafusion.DataFrame:
+        if limit == "default":
+            limit = ibis.options.sql.default_limit
+        if limit is not None and not isinstance(expr, ir.Scalar):
+            return self._get_frame(expr, params, **kwargs).limit(limit)
+
         if isinstance(expr, ir.Table):
             return self.compile(expr, params, **kwargs)
         elif isinstance(expr, ir.Column):
@@ -281,9 +290,134 @@ class Backend(BaseBackend):
         chunk_size: int = 1_000_000,
         **kwargs: Any,
     ) -> pa.ipc.RecordBatchReader:
+        """Execute expression and return a RecordBatchReader.
+
+        The batches are yielded as DataFusion produces them, from a single
+        stream of the whole plan.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        results
+            RecordBatchReader
+        """
         pa = self._import_pyarrow()
         frame = self._get_frame(expr, params, limit, **kwargs)
-        return pa.ipc.RecordBatchReader.from_batches(frame.schema(), frame.collect())
+        if not hasattr(self._context, "execute"):
+            batches = frame.collect()
+        else:
+            batches = self._execute_stream(frame)
+        return pa.ipc.RecordBatchReader.from_batches(
+            frame.schema(), _rechunk(batches, chunk_size)
+        )
+
+    def _execute_stream(self, frame: datafusion.DataFrame) -> Iterator[pa.RecordBatch]:
+        plan = frame.execution_plan()
+        if plan.partition_count > 1:
+            # merge the partitions into a single stream, executing them one
+            # after the other would buffer the output of the ones not read yet
+            plan = frame.repartition(1).execution_plan()
+        stream = self._context.execute(plan, 0)
+        while (batch := stream.next()) is not None:
+            yield batch.to_pyarrow()
+
+    @experimental
+    def to_parquet(
+        self,
+        expr: ir.Table,
+        path: str | Path,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Write the results of executing the given expression to a parquet file.
+
+        The file is written by DataFusion's parquet writer.
+
+        Parameters
+        ----------
+        expr
+            The ibis expression to execute and persist to parquet.
+        path
+            The data source. A string or Path to the parquet file.
+        params
+            Mapping of scalar parameter expressions to value.
+        **kwargs
+            Additional keyword arguments passed to `DataFrame.write_parquet`
+        """
+        frame = self._get_frame(expr, params)
+        if not hasattr(frame, "write_parquet"):
+            super().to_parquet(expr, path, params=params, **kwargs)
+            return
+        self._write_single_file(frame.write_parquet, frame, path, **kwargs)
+
+    @experimental
+    def to_csv(
+        self,
+        expr: ir.Table,
+        path: str | Path,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Write the results of executing the given expression to a CSV file.
+
+        The file is written by DataFusion's CSV writer.
+
+        Parameters
+        ----------
+        expr
+            The ibis expression to execute and persist to CSV.
+        path
+            The data source. A string or Path to the CSV file.
+        params
+            Mapping of scalar parameter expressions to value.
+        **kwargs
+            Additional keyword arguments passed to `DataFrame.write_csv`
+        """
+        frame = self._get_frame(expr, params)
+        if not hasattr(frame, "write_csv"):
+            super().to_csv(expr, path, params=params, **kwargs)
+            return
+        self._write_single_file(frame.write_csv, frame, path, **kwargs)
+
+        if not os.path.getsize(path):
+            # DataFusion doesn't write the header of empty results
+            import pyarrow.csv as pcsv
+
+            pcsv.write_csv(frame.schema().empty_table(), path)
+
+    @staticmethod
+    def _write_single_file(
+        write, frame: datafusion.DataFrame, path: str | Path, **kwargs: Any
+    ) -> None:
+        # DataFusion writes a directory with a file per partition, write a
+        # single partition next to `path` and move its file into place
+        if frame.execution_plan().partition_count > 1:
+            frame = frame.repartition(1)
+            write = getattr(frame, write.__name__)
+        path = Path(path)
+        tmpdir = tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}-")
+        try:
+            # the writer refuses to write into an existing directory
+            write(os.path.join(tmpdir, "out"), **kwargs)
+            (part,) = Path(tmpdir, "out").iterdir()
+            os.replace(part, path)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
 
     def execute(
         self,
@@ -337,3 +471,11 @@ class Backend(BaseBackend):
 
     def drop_view(self, *_, **__) -> ir.Table:
         raise NotImplementedError(self.name)
+
+
+def _rechunk(
+    batches: Iterator[pa.RecordBatch], chunk_size: int
+) -> Iterator[pa.RecordBatch]:
+    for batch in batches:
+        for offset in range(0, batch.num_rows, chunk_size):
+            yield batch.slice(offset, chunk_size)
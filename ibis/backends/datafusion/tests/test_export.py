@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+import ibis
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+pcsv = pytest.importorskip("pyarrow.csv")
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "a": np.arange(100),
+            "b": np.arange(100) % 3,
+            "s": [f"s{i:d}" for i in range(100)],
+        }
+    )
+
+
+@pytest.fixture
+def con(df, tmp_path):
+    # the files may be scanned by several partitions
+    for i in range(4):
+        pq.write_table(pa.Table.from_pandas(df[i::4]), tmp_path / f"{i:d}.parquet")
+    con = ibis.datafusion.connect({})
+    con.register(pa.Table.from_pandas(df), table_name="t")
+    con.read_parquet(tmp_path / "*.parquet", table_name="parts")
+    return con
+
+
+@pytest.mark.parametrize("table", ["t", "parts"])
+def test_to_pyarrow_batches(con, df, table):
+    t = con.table(table)
+    expr = t.filter(t.a >= 10)
+    reader = con.to_pyarrow_batches(expr, chunk_size=7)
+    assert reader.schema == expr.schema().to_pyarrow()
+
+    batches = list(reader)
+    assert batches
+    assert all(len(batch) <= 7 for batch in batches)
+    result = pa.Table.from_batches(batches).to_pandas()
+    tm.assert_frame_equal(
+        result.sort_values("a", ignore_index=True),
+        df[df.a >= 10].reset_index(drop=True),
+    )
+
+
+@pytest.mark.parametrize("table", ["t", "parts"])
+def test_to_pyarrow_batches_limit(con, table):
+    t = con.table(table)
+    assert con.to_pyarrow_batches(t, limit=5).read_all().num_rows == 5
+    assert con.to_pyarrow_batches(t.a, limit=5).read_all().num_rows == 5
+
+
+def test_to_pyarrow_batches_scalar(con):
+    t = con.table("t")
+    result = con.to_pyarrow_batches(t.a.sum()).read_all()
+    assert result.num_rows == 1
+    assert result.column(0)[0].as_py() == 4950
+
+
+@pytest.mark.parametrize("table", ["t", "parts"])
+def test_to_parquet(con, df, tmp_path, table):
+    t = con.table(table)
+    path = tmp_path / "out.parquet"
+    con.to_parquet(t.filter(t.a >= 10), path)
+    assert path.is_file()
+
+    result = pq.read_table(path).to_pandas()
+    tm.assert_frame_equal(
+        result.sort_values("a", ignore_index=True),
+        df[df.a >= 10].reset_index(drop=True),
+    )
+    # nothing is left behind next to the written file
+    assert {p.name for p in tmp_path.iterdir() if p.name.startswith(".")} == set()
+
+
+def test_to_csv(con, df, tmp_path):
+    t = con.table("t")
+    path = tmp_path / "out.csv"
+    con.to_csv(t.filter(t.a >= 10), path)
+
+    result = pcsv.read_csv(path).to_pandas()
+    tm.assert_frame_equal(
+        result.sort_values("a", ignore_index=True),
+        df[df.a >= 10].reset_index(drop=True),
+    )
+
+
+def test_to_csv_empty(con, tmp_path):
+    t = con.table("t")
+    path = tmp_path / "out.csv"
+    con.to_csv(t.filter(t.a < 0), path)
+    assert pcsv.read_csv(path).column_names == ["a", "b", "s"]
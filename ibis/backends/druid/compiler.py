@@ -15,3 +15,4 @@ rewrites = DruidExprTranslator.rewrites
 
 class DruidCompiler(AlchemyCompiler):
     translator_class = DruidExprTranslator
+    supports_temp_in_memory_tables = False
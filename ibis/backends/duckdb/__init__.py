@@ -18,7 +18,6 @@ from packaging.version import parse as vparse
 
 import ibis.common.exceptions as exc
 import ibis.expr.datatypes as dt
-import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends.base.sql.alchemy import BaseAlchemyBackend
@@ -270,6 +269,8 @@ class Backend(BaseAlchemyBackend):
         )
 
     def _compile_temp_view(self, table_name, source):
+        # the view is about to be (re)created, forget any previous reflection
+        self._invalidate_sqla_table(table_name)
         raw_source = source.compile(
             dialect=self.con.dialect, compile_kwargs=dict(literal_binds=True)
         )
@@ -441,6 +442,7 @@ class Backend(BaseAlchemyBackend):
             # by the time we execute against this so we register it
             # explicitly.
             con.connection.register(table_name, dataset)
+        self._invalidate_sqla_table(table_name)
 
     def read_in_memory(
         self,
@@ -465,6 +467,7 @@ class Backend(BaseAlchemyBackend):
         table_name = table_name or util.gen_name("read_in_memory")
         with self.begin() as con:
             con.connection.register(table_name, source)
+        self._invalidate_sqla_table(table_name)
 
         if isinstance(source, pa.RecordBatchReader):
             # Ensure the reader isn't marked as started, in case the name is
@@ -637,8 +640,7 @@ class Backend(BaseAlchemyBackend):
             !!! warning "DuckDB returns 1024 size batches regardless of what argument is passed."
         """
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        _, sql = self._compile_query(expr, limit=limit, params=params)
 
         # handle the argument name change in duckdb 0.8.0
         fetch_record_batch = (
@@ -667,8 +669,7 @@ class Backend(BaseAlchemyBackend):
         **_: Any,
     ) -> pa.Table:
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        _, sql = self._compile_query(expr, limit=limit, params=params)
 
         with self.begin() as con:
             cursor = con.execute(sql)
@@ -777,31 +778,8 @@ class Backend(BaseAlchemyBackend):
         with self.begin() as con:
             con.exec_driver_sql(copy_cmd)
 
-    def fetch_from_cursor(
-        self, cursor: duckdb.DuckDBPyConnection, schema: sch.Schema
-    ) -> pd.DataFrame:
-        import pandas as pd
-        import pyarrow.types as pat
-
-        table = cursor.cursor.fetch_arrow_table()
-
-        df = pd.DataFrame(
-            {
-                name: (
-                    col.to_pylist()
-                    if (
-                        pat.is_nested(col.type)
-                        or
-                        # pyarrow / duckdb type null literals columns as int32?
-                        # but calling `to_pylist()` will render it as None
-                        col.null_count
-                    )
-                    else col.to_pandas(timestamp_as_object=True)
-                )
-                for name, col in zip(table.column_names, table.columns)
-            }
-        )
-        return schema.apply_to(df)
+    def _fetch_arrow_table(self, cursor: sa.engine.CursorResult) -> pa.Table:
+        return cursor.cursor.fetch_arrow_table()
 
     def _metadata(self, query: str) -> Iterator[tuple[str, dt.DataType]]:
         with self.begin() as con:
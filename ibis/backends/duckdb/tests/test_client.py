@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+import ibis
+
+pytest.importorskip("duckdb")
+pytest.importorskip("duckdb_engine")
+
+
+def test_execute_fetches_arrow(mocker):
+    con = ibis.duckdb.connect()
+    t = ibis.memtable(
+        {
+            "a": [1, 2, None],
+            "b": ["x", None, "z"],
+            "c": [[1], [2, 3], []],
+            "d": [1.0, 2.0, 3.0],
+        }
+    )
+    spy = mocker.spy(con, "_fetch_arrow_table")
+
+    result = con.execute(t)
+
+    spy.assert_called_once()
+    expected = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, None],
+            "b": ["x", None, "z"],
+            "c": [[1], [2, 3], []],
+            "d": [1.0, 2.0, 3.0],
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_arrow_to_pandas_keeps_flat_columns(mocker):
+    con = ibis.duckdb.connect()
+    t = ibis.memtable({"a": [1.5, None, 3.5]})
+    expr = t.mutate(n=ibis.NA)
+    pylist = mocker.spy(ibis.formats.pandas, "pyarrow_to_pylist")
+
+    result = con.execute(expr)
+
+    # only nested columns are converted through Python objects
+    pylist.assert_not_called()
+    assert result.a.dtype == "float64"
+    assert result.n.tolist() == [None, None, None]
+
+
+@pytest.mark.parametrize(("fingerprint", "expected"), [(False, 2), (True, 1)])
+def test_memtable_fingerprint_registers_once(fingerprint, expected):
+    con = ibis.duckdb.connect()
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    with ibis.config.option_context("memtable_fingerprint", fingerprint):
+        for _ in range(2):
+            assert con.execute(ibis.memtable(df).a.sum()) == 6
+
+    assert len(con.list_tables(like="memtable")) == expected
@@ -36,3 +36,5 @@ class MsSqlCompiler(AlchemyCompiler):
     translator_class = MsSqlExprTranslator
 
     supports_indexed_grouping_keys = False
+    # temporary tables are spelled with a `#` prefix
+    supports_temp_in_memory_tables = False
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import importlib
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Mapping, MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Mapping, MutableMapping, Optional
 
 import pandas as pd
 
@@ -12,7 +13,10 @@ import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis.backends.base import BaseBackend
+from ibis.backends.pandas.scan import FileSource, read_tables, scanned_tables
+from ibis.config import PosInt
 from ibis.formats.pandas import schema_from_pandas_dataframe, schema_to_pandas
+from ibis.util import gen_name, normalize_filename
 
 if TYPE_CHECKING:
     import pyarrow as pa
@@ -26,6 +30,7 @@ class BasePandasBackend(BaseBackend):
 
     class Options(ibis.config.Config):
         enable_trace: bool = False
+        report_scope_size: bool = False
 
     def do_connect(
         self,
@@ -234,6 +239,115 @@ class BasePandasBackend(BaseBackend):
 class Backend(BasePandasBackend):
     name = 'pandas'
 
+    class Options(BasePandasBackend.Options):
+        """Options for the pandas backend.
+
+        Attributes
+        ----------
+        enable_trace : bool
+            Log the execution time of each node.
+        dtype_backend : str
+            Column types the expressions are computed on. `"numpy"` uses
+            NumPy and object dtypes, `"pyarrow"` converts the tables to
+            `pd.ArrowDtype` columns, computes on them with `pyarrow.compute`
+            kernels where possible and returns pyarrow backed results. Store
+            pyarrow backed DataFrames in the backend to avoid converting them
+            on every execution.
+        report_scope_size : bool
+            Report the peak number and estimated size of the intermediate
+            results held while executing an expression.
+        udf_executor : str | None
+            Pool used to evaluate analytic and reduction UDFs on many groups
+            in parallel, either `"thread"` or `"process"`. The process pool
+            requires `cloudpickle` to send the UDFs to the workers.
+            [`None`][None] evaluates the groups one by one.
+        udf_max_workers : int | None
+            Maximum number of workers of the UDF pool, defaults to the number
+            of CPUs.
+        udf_chunk_size : int | None
+            Number of groups handed to a worker at once. Defaults to spreading
+            the groups over four chunks per worker.
+        """
+
+        dtype_backend: Literal["numpy", "pyarrow"] = "numpy"
+        udf_executor: Optional[Literal["thread", "process"]] = None
+        udf_max_workers: Optional[PosInt] = None
+        udf_chunk_size: Optional[PosInt] = None
+
+    def do_connect(
+        self,
+        dictionary: MutableMapping[str, pd.DataFrame] | None = None,
+    ) -> None:
+        super().do_connect(dictionary)
+        # the files registered with `read_parquet` and `read_csv`
+        self._file_sources: dict[str, FileSource] = {}
+
+    def read_parquet(
+        self, path: str | Path, table_name: str | None = None, **kwargs: Any
+    ) -> ir.Table:
+        """Register a parquet file as a table in the current backend.
+
+        The data is read lazily. When executing an expression, only the
+        columns it references are read and the simple comparisons filtering
+        the table are passed to `pd.read_parquet` to skip row groups.
+
+        Parameters
+        ----------
+        path
+            The data source. May be a path to a file or directory of parquet
+            files.
+        table_name
+            An optional name to use for the created table. This defaults to
+            a sequentially generated name.
+        **kwargs
+            Additional keyword arguments passed to `pd.read_parquet`.
+
+        Returns
+        -------
+        ir.Table
+            The just-registered table
+        """
+        return self._register_file(
+            "parquet", path, table_name or gen_name("read_parquet"), kwargs
+        )
+
+    def read_csv(
+        self, path: str | Path, table_name: str | None = None, **kwargs: Any
+    ) -> ir.Table:
+        """Register a CSV file as a table in the current backend.
+
+        The data is read lazily. When executing an expression, only the
+        columns it references are read. The types of the columns are inferred
+        from the first rows of the file.
+
+        Parameters
+        ----------
+        path
+            The data source. A string or Path to the CSV file.
+        table_name
+            An optional name to use for the created table. This defaults to
+            a sequentially generated name.
+        **kwargs
+            Additional keyword arguments passed to `pd.read_csv`.
+
+        Returns
+        -------
+        ir.Table
+            The just-registered table
+        """
+        return self._register_file(
+            "csv", path, table_name or gen_name("read_csv"), kwargs
+        )
+
+    def _register_file(
+        self, format: str, path: str | Path, table_name: str, kwargs: dict[str, Any]
+    ) -> ir.Table:
+        source = FileSource(format, normalize_filename(path), kwargs)
+        self.dictionary[table_name] = source.placeholder
+        self.schemas[table_name] = source.schema
+        self._file_sources[table_name] = source
+        return self.table(table_name)
+
     def to_pyarrow(
         self,
         expr: ir.Expr,
@@ -242,6 +356,9 @@ class Backend(BasePandasBackend):
         **kwargs: Any,
     ) -> pa.Table:
         pa = self._import_pyarrow()
+        if (table := self._execute_arrow(expr, params, limit)) is not None:
+            return table
+
         output = self.execute(expr, params=params, limit=limit)
 
         if isinstance(output, pd.DataFrame):
@@ -261,10 +378,44 @@ class Backend(BasePandasBackend):
         **kwargs: Any,
     ) -> pa.ipc.RecordBatchReader:
         pa = self._import_pyarrow()
-        pa_table = self.to_pyarrow(expr, params=params, limit=limit)
-        return pa.RecordBatchReader.from_batches(
-            pa_table.schema, pa_table.to_batches(max_chunksize=chunk_size)
-        )
+        if (table := self._execute_arrow(expr, params, limit)) is not None:
+            return pa.RecordBatchReader.from_batches(
+                table.schema, table.to_batches(max_chunksize=chunk_size)
+            )
+
+        output = self.execute(expr, params=params, limit=limit)
+        if isinstance(output, pd.Series):
+            output = output.to_frame()
+        elif not isinstance(output, pd.DataFrame):
+            output = pd.DataFrame({expr.get_name(): [output]})
+
+        # convert the result lazily, one batch at a time
+        schema = pa.Schema.from_pandas(output, preserve_index=False)
+
+        def batches():
+            for offset in range(0, len(output), chunk_size):
+                yield pa.RecordBatch.from_pandas(
+                    output.iloc[offset : offset + chunk_size],
+                    schema=schema,
+                    preserve_index=False,
+                )
+
+        return pa.RecordBatchReader.from_batches(schema, batches())
+
+    @staticmethod
+    def _execute_arrow(
+        expr: ir.Expr,
+        params: Mapping[ir.Scalar, Any] | None,
+        limit: int | str | None,
+    ) -> pa.Table | None:
+        """Compute projections and filters of Arrow memtables without pandas."""
+        # parameters and limits are handled, or rejected, by `execute`
+        if not isinstance(expr, ir.Table) or params or limit not in (None, "default"):
+            return None
+
+        from ibis.backends.pandas.arrow import execute_arrow
+
+        return execute_arrow(expr.op())
 
     def execute(self, query, params=None, limit='default', **kwargs):
         from ibis.backends.pandas.core import execute_and_reset
@@ -291,7 +442,10 @@ class Backend(BasePandasBackend):
                 k.op() if isinstance(k, ir.Expr) else k: v for k, v in params.items()
             }
 
-        return execute_and_reset(node, params=params, **kwargs)
+        # read the file tables with only the needed columns and rows
+        tables = read_tables(node) if self._file_sources else {}
+        with scanned_tables(tables):
+            return execute_and_reset(node, params=params, **kwargs)
 
     def _load_into_cache(self, name, expr):
         self.create_table(name, expr.execute())
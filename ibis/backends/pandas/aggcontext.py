@@ -217,10 +217,13 @@ Ibis
 from __future__ import annotations
 
 import abc
+import concurrent.futures
 import functools
 import itertools
 import operator
-from typing import Any, Callable, Iterator
+import os
+import pickle
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 import numpy as np
 import pandas as pd
@@ -360,6 +363,77 @@ def wrap_for_agg(
     return wrapped_func
 
 
+def _call_chunk(function: Callable | bytes, chunk: Sequence[tuple]) -> list:
+    if isinstance(function, bytes):
+        function = pickle.loads(function)
+    return [function(*inputs) for inputs in chunk]
+
+
+def map_groups(
+    function: Callable, groups: Iterable[tuple[Any, tuple[Any, ...]]], **kwargs: Any
+) -> dict[Any, Any]:
+    """Call `function` with the inputs of every group.
+
+    The groups are fanned out to the thread or process pool configured by the
+    `udf_executor` pandas backend option, in chunks of `udf_chunk_size`
+    groups. Without an executor the groups are processed one by one as they
+    are produced.
+
+    Parameters
+    ----------
+    function
+        Function to call with the inputs of each group.
+    groups
+        Pairs of group key and positional arguments to call `function` with.
+    kwargs
+        Keyword arguments passed to every call of `function`.
+
+    Returns
+    -------
+    dict
+        Mapping of group key to the result of `function`.
+    """
+    options = ibis.options.pandas
+    executor = getattr(options, 'udf_executor', None)
+    if kwargs:
+        function = functools.partial(function, **kwargs)
+
+    if executor is None:
+        return {key: function(*inputs) for key, inputs in groups}
+
+    groups = list(groups)
+    keys = [key for key, _ in groups]
+    groups = [inputs for _, inputs in groups]
+    max_workers = options.udf_max_workers or os.cpu_count() or 1
+    # by default aim at a few chunks per worker to even out the load
+    chunk_size = options.udf_chunk_size or -(-len(groups) // (4 * max_workers))
+    chunks = [
+        groups[start : start + chunk_size]
+        for start in range(0, len(groups), chunk_size)
+    ]
+    if len(chunks) < 2:
+        return dict(zip(keys, _call_chunk(function, groups)))
+
+    if executor == 'thread':
+        pool = concurrent.futures.ThreadPoolExecutor
+    else:
+        # user defined functions are usually closures which the standard
+        # library pickle can't serialize, the inputs are pickled as usual
+        try:
+            import cloudpickle
+        except ImportError:
+            raise ModuleNotFoundError(
+                "The 'process' UDF executor requires `cloudpickle` but it is "
+                "not installed"
+            )
+        pool = concurrent.futures.ProcessPoolExecutor
+        function = cloudpickle.dumps(function)
+
+    with pool(max_workers=min(max_workers, len(chunks))) as pool:
+        results = pool.map(_call_chunk, itertools.repeat(function), chunks)
+        return dict(zip(keys, itertools.chain.from_iterable(results)))
+
+
 class Summarize(AggregationContext):
     __slots__ = ()
 
@@ -376,11 +450,11 @@ class Summarize(AggregationContext):
             # `SeriesGroupBy.agg` does not allow np.arrays to be returned
             # from UDFs. To avoid `SeriesGroupBy.agg`, we will call the
             # aggregation function manually on each group. (#2768)
-            aggs = {}
-            for k, v in grouped_data:
-                func_args = [d.get_group(k) for d in args]
-                aggs[k] = function(v, *func_args, **kwargs)
-                grouped_col_name = v.name
+            groups = (
+                (k, (v, *(d.get_group(k) for d in args))) for k, v in grouped_data
+            )
+            aggs = map_groups(function, groups, **kwargs)
+            grouped_col_name = grouped_data.obj.name
             return (
                 pd.Series(aggs)
                 .rename(grouped_col_name)
@@ -390,10 +464,48 @@ class Summarize(AggregationContext):
             return grouped_data.agg(wrap_for_agg(function, args, kwargs))
 
 
+def _zip_groups(function: Callable, args: tuple[SeriesGroupBy, ...]) -> Callable:
+    iters = [(data for _, data in arg) for arg in args]
+
+    def aggregator(first, **kwargs):
+        return function(first, *map(next, iters), **kwargs)
+
+    return aggregator
+
+
 class Transform(AggregationContext):
     __slots__ = ()
 
     def agg(self, grouped_data, function, *args, **kwargs):
+        if (
+            callable(function)
+            and isinstance(grouped_data, SeriesGroupBy)
+            and all(isinstance(arg, SeriesGroupBy) for arg in args)
+        ):
+            if getattr(ibis.options.pandas, 'udf_executor', None) is not None:
+                # Evaluate the function on the groups of all the input
+                # columns upfront in parallel, and let pandas put the results
+                # back in place below. The groups of every column are yielded
+                # in the same order since they share the grouping keys.
+                results = map_groups(
+                    function,
+                    (
+                        (key, (first, *(data for _, data in rest)))
+                        for (key, first), *rest in zip(grouped_data, *args)
+                    ),
+                    **kwargs,
+                )
+
+                def function(group):
+                    return results[group.name]
+
+                args, kwargs = (), {}
+            elif args:
+                # pandas iterates over the groups of the first column, pull
+                # the groups of the other columns from generators
+                function = _zip_groups(function, args)
+                args = ()
+
         # If this is a multi column UDF, then we cannot use
         # "transform" here (Data must be 1-dimensional)
         # Instead, we need to use "apply", which can return a non
@@ -486,6 +598,63 @@ def create_window_input_iter(
         yield data[lower_index:upper_index]
 
 
+# upper bound on the number of elements materialized at once when gathering
+# the windows of a vectorized UDF into a two dimensional array
+_MAX_WINDOW_BATCH_ELEMENTS = 1 << 22
+
+
+def window_agg_udf_vectorized(
+    inputs: tuple[Any, ...],
+    function: Callable,
+    lower_indices: np.ndarray,
+    upper_indices: np.ndarray,
+) -> np.ndarray:
+    """Apply a vectorized UDF to windows batched by their length.
+
+    Windows of the same length are gathered from a strided view of each input
+    column into a two dimensional array with one window per row, so the UDF is
+    called once per distinct window length (and batch) instead of once per
+    window. The UDF must reduce along the last axis and return one value per
+    row. Inputs that aren't columns are passed through unchanged.
+    """
+    columns = [
+        np.asarray(getattr(arg, 'obj', arg))
+        if isinstance(arg, (pd.Series, SeriesGroupBy))
+        else None
+        for arg in inputs
+    ]
+    sizes = upper_indices - lower_indices
+
+    positions, values = [], []
+    for size in np.unique(sizes):
+        (where,) = np.nonzero(sizes == size)
+        views = [
+            None
+            if column is None
+            else np.lib.stride_tricks.sliding_window_view(column, size)
+            for column in columns
+        ]
+        step = max(_MAX_WINDOW_BATCH_ELEMENTS // max(size, 1), 1)
+        for start in range(0, len(where), step):
+            batch = where[start : start + step]
+            starts = lower_indices[batch]
+            result = function(
+                *(
+                    arg if view is None else view[starts]
+                    for arg, view in zip(inputs, views)
+                )
+            )
+            positions.append(batch)
+            values.append(np.asarray(result))
+
+    if not values:
+        return np.array([])
+
+    # restore the original order of the windows
+    order = np.argsort(np.concatenate(positions), kind='stable')
+    return np.concatenate(values)[order]
+
+
 def window_agg_udf(
     grouped_data: SeriesGroupBy,
     function: Callable,
@@ -506,6 +675,9 @@ def window_agg_udf(
     using pandas's rolling function.
     This is because pandas's rolling function doesn't support
     multi param UDFs.
+
+    UDFs marked as vectorized are called with batches of windows, see
+    `window_agg_udf_vectorized`.
     """
     assert len(window_lower_indices) == len(window_upper_indices)
     assert len(window_lower_indices) == len(mask)
@@ -530,21 +702,30 @@ def window_agg_udf(
     masked_window_lower_indices = window_lower_indices[mask].astype('i8')
     masked_window_upper_indices = window_upper_indices[mask].astype('i8')
 
-    input_iters = [
-        create_window_input_iter(
-            arg, masked_window_lower_indices, masked_window_upper_indices
+    if getattr(function, 'vectorized', False):
+        valid_result = pd.Series(
+            window_agg_udf_vectorized(
+                inputs,
+                function,
+                masked_window_lower_indices.values,
+                masked_window_upper_indices.values,
+            )
+        )
+    else:
+        input_iters = [
+            create_window_input_iter(
+                arg, masked_window_lower_indices, masked_window_upper_indices
+            )
+            if isinstance(arg, (pd.Series, SeriesGroupBy))
+            else itertools.repeat(arg)
+            for arg in inputs
+        ]
+
+        valid_result = pd.Series(
+            function(*(next(gen) for gen in input_iters))
+            for i in range(len(masked_window_lower_indices))
         )
-        if isinstance(arg, (pd.Series, SeriesGroupBy))
-        else itertools.repeat(arg)
-        for arg in inputs
-    ]
-
-    valid_result = pd.Series(
-        function(*(next(gen) for gen in input_iters))
-        for i in range(len(masked_window_lower_indices))
-    )
 
-    valid_result = pd.Series(valid_result)
     valid_result.index = masked_window_lower_indices.index
     result = pd.Series(index=mask.index, dtype=dtype)
     result[mask] = valid_result
@@ -622,8 +803,10 @@ class Window(AggregationContext):
             #     https://github.com/pandas-dev/pandas/issues/23002
             # To deal with this, we create a _placeholder column
 
-            windowed_frame = self.construct_window(grouped_frame)
-            window_sizes = windowed_frame['_placeholder'].count().reset_index(drop=True)
+            # window only the placeholder column, pandas validates the
+            # ordering keys of every group each time a rolling object is built
+            windowed = self.construct_window(grouped_frame['_placeholder'])
+            window_sizes = windowed.count().reset_index(drop=True)
             mask = ~(window_sizes.isna())
             window_upper_indices = pd.Series(range(len(window_sizes))) + 1
             window_lower_indices = window_upper_indices - window_sizes
@@ -0,0 +1,134 @@
+"""Evaluate projections and filters of Arrow backed tables without pandas.
+
+Expressions selecting and filtering the columns of an in-memory table that
+wraps a `pyarrow.Table` are computed on the Arrow data directly, avoiding the
+round trip through a pandas DataFrame. Any other expression is left to the
+pandas executor.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import ibis.expr.operations as ops
+from ibis.expr.operations.relations import PyArrowTableProxy
+
+# `!=` isn't translated, pandas keeps the rows where the column is missing
+# while pyarrow drops them
+_COMPARISONS = {
+    ops.Equals: operator.eq,
+    ops.Greater: operator.gt,
+    ops.GreaterEqual: operator.ge,
+    ops.Less: operator.lt,
+    ops.LessEqual: operator.le,
+}
+
+_LOGICAL = {ops.And: operator.and_, ops.Or: operator.or_}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def execute_arrow(op: ops.TableNode) -> pa.Table | None:
+    """Compute `op` on Arrow data if it only projects and filters an Arrow table.
+
+    Returns
+    -------
+    pa.Table | None
+        The result, or `None` when `op` needs the pandas executor.
+    """
+    try:
+        return _execute(op)
+    except _Unsupported:
+        return None
+
+
+@functools.singledispatch
+def _execute(op):
+    raise _Unsupported()
+
+
+@_execute.register
+def _in_memory_table(op: ops.InMemoryTable):
+    if not isinstance(op.data, PyArrowTableProxy):
+        raise _Unsupported()
+    return op.data.to_pyarrow(op.schema)
+
+
+@_execute.register
+def _selection(op: ops.Selection):
+    if op.sort_keys:
+        raise _Unsupported()
+
+    # translate everything before computing the parent table
+    predicates = [_predicate(pred, op.table) for pred in op.predicates]
+    columns = {}
+    for selection in op.selections or (op.table,):
+        if selection == op.table:
+            columns.update((name, name) for name in op.table.schema.names)
+        elif isinstance(selection, ops.Alias) and _is_column(selection.arg, op.table):
+            columns[selection.name] = selection.arg.name
+        elif _is_column(selection, op.table):
+            columns[selection.name] = selection.name
+        else:
+            raise _Unsupported()
+
+    table = _execute(op.table)
+    if predicates:
+        table = table.filter(functools.reduce(operator.and_, predicates))
+    return pa.Table.from_arrays(
+        [table[source] for source in columns.values()], names=list(columns)
+    )
+
+
+@_execute.register
+def _limit(op: ops.Limit):
+    table = _execute(op.table)
+    return table.slice(op.offset, op.n)
+
+
+def _is_column(op, table):
+    return isinstance(op, ops.TableColumn) and op.table == table
+
+
+def _predicate(op, table) -> pc.Expression:
+    if _is_column(op, table):
+        return pc.field(op.name)
+    elif isinstance(op, ops.Literal):
+        try:
+            return pc.scalar(pa.scalar(op.value, type=op.output_dtype.to_pyarrow()))
+        except (pa.ArrowException, TypeError, ValueError):
+            raise _Unsupported()
+    elif (func := _COMPARISONS.get(type(op))) is not None:
+        return func(_predicate(op.left, table), _predicate(op.right, table))
+    elif (func := _LOGICAL.get(type(op))) is not None:
+        # pyarrow's three-valued logic drops the same rows as pandas' masks,
+        # this doesn't hold for negations so those aren't translated
+        return func(_predicate(op.left, table), _predicate(op.right, table))
+    elif isinstance(op, ops.IsNull):
+        # pandas treats NaN as missing
+        return _predicate(op.arg, table).is_null(nan_is_null=True)
+    elif isinstance(op, ops.NotNull):
+        return ~_predicate(op.arg, table).is_null(nan_is_null=True)
+    elif isinstance(op, ops.Between):
+        arg = _predicate(op.arg, table)
+        return (arg >= _predicate(op.lower_bound, table)) & (
+            arg <= _predicate(op.upper_bound, table)
+        )
+    elif isinstance(op, ops.Contains) and all(
+        isinstance(option, ops.Literal) for option in op.options
+    ):
+        try:
+            values = pa.array(
+                [option.value for option in op.options],
+                type=op.value.output_dtype.to_pyarrow(),
+            )
+        except (pa.ArrowException, TypeError, ValueError):
+            raise _Unsupported()
+        return _predicate(op.value, table).isin(values)
+    raise _Unsupported()
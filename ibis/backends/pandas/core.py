@@ -121,7 +121,8 @@ import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.util
 from ibis.backends.base import BaseBackend
-from ibis.backends.base.df.scope import Scope
+from ibis.backends.base.df.profile import Profiler
+from ibis.backends.base.df.scope import Scope, ScopeTracker
 from ibis.backends.base.df.timecontext import TimeContext, canonicalize_context
 from ibis.backends.pandas import aggcontext as agg_ctx
 from ibis.backends.pandas.dispatch import (
@@ -131,6 +132,7 @@ from ibis.backends.pandas.dispatch import (
     pre_execute,
 )
 from ibis.backends.pandas.trace import trace
+from ibis.formats.pandas import to_arrow_dtypes
 
 integer_types = np.integer, int
 floating_types = (numbers.Real,)
@@ -319,6 +321,12 @@ def execute_until_in_scope(
             f'for type:\n{type(node).__name__}.'
         )
 
+    # track the results consumed while computing this node
+    if (tracker := ScopeTracker.current.get()) is not None:
+        frame = tracker.enter()
+    if (profiler := Profiler.current.get()) is not None:
+        depth = profiler.enter(node)
+
     scopes = [
         execute_until_in_scope(
             arg,
@@ -347,7 +355,12 @@ def execute_until_in_scope(
         new_scope.get_value(arg, timecontext) if isinstance(arg, ops.Node) else arg
         for (arg, timecontext) in zip(computable_args, arg_timecontexts)
     ]
-    result = execute_node(
+    run = (
+        execute_node
+        if profiler is None
+        else functools.partial(profiler.run, execute_node)
+    )
+    result = run(
         node,
         *data,
         scope=scope,
@@ -359,6 +372,10 @@ def execute_until_in_scope(
     computed = post_execute_(
         node, result, timecontext=timecontext, aggcontext=aggcontext, **kwargs
     )
+    if tracker is not None:
+        tracker.exit(frame, node, computed)
+    if profiler is not None:
+        profiler.exit(depth)
     return Scope({node: computed}, timecontext)
 
 
@@ -425,14 +442,40 @@ def main_execute(
         cache = {}
 
     scope = scope.merge_scope(Scope(params, timecontext))
-    return execute_with_scope(
-        node,
-        scope,
-        timecontext=timecontext,
-        aggcontext=aggcontext,
-        cache=cache,
-        **kwargs,
-    )
+    if ScopeTracker.current.get() is not None:
+        # nested execution, tracked by the outermost one
+        return execute_with_scope(
+            node,
+            scope,
+            timecontext=timecontext,
+            aggcontext=aggcontext,
+            cache=cache,
+            **kwargs,
+        )
+
+    report = getattr(ibis.options.pandas, 'report_scope_size', False)
+    tracker = ScopeTracker(node, cache, measure=report)
+    token = ScopeTracker.current.set(tracker)
+    try:
+        result = execute_with_scope(
+            node,
+            scope,
+            timecontext=timecontext,
+            aggcontext=aggcontext,
+            cache=cache,
+            **kwargs,
+        )
+    finally:
+        ScopeTracker.current.reset(token)
+        if (profiler := Profiler.current.get()) is not None:
+            profiler.reset()
+
+    if report:
+        (ibis.options.verbose_log or print)(
+            f"peak scope size: {tracker.peak_entries:d} results, "
+            f"{tracker.peak_bytes:d} bytes"
+        )
+    return result
 
 
 def execute_and_reset(
@@ -487,18 +530,26 @@ def execute_and_reset(
         aggcontext=aggcontext,
         **kwargs,
     )
-    return _apply_schema(node, result)
+    return _apply_schema(node, result, arrow=use_arrow_dtypes())
+
+
+def use_arrow_dtypes() -> bool:
+    """Return whether the pandas backend computes on pyarrow backed columns."""
+    return getattr(ibis.options.pandas, "dtype_backend", None) == "pyarrow"
 
 
-def _apply_schema(op: ops.Node, result: pd.DataFrame | pd.Series):
+def _apply_schema(op: ops.Node, result: pd.DataFrame | pd.Series, arrow: bool = False):
     assert isinstance(op, ops.Node), type(op)
     if isinstance(result, pd.DataFrame):
         df = result.reset_index()
         schema = op.schema
-        return schema.apply_to(df.loc[:, list(schema.names)])
+        df = df.loc[:, list(schema.names)]
+        return to_arrow_dtypes(df, schema) if arrow else schema.apply_to(df)
     elif isinstance(result, pd.Series):
         schema = op.to_expr().as_table().schema()
-        return schema.apply_to(result.to_frame()).iloc[:, 0].reset_index(drop=True)
+        df = result.to_frame()
+        df = to_arrow_dtypes(df, schema) if arrow else schema.apply_to(df)
+        return df.iloc[:, 0].reset_index(drop=True)
     return result
 
 
@@ -14,6 +14,7 @@ from collections.abc import Mapping, Sized
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytz
 import toolz
 from pandas.core.groupby import DataFrameGroupBy, SeriesGroupBy
@@ -38,10 +39,17 @@ from ibis.backends.pandas.core import (
     simple_types,
     timedelta_types,
     timestamp_types,
+    use_arrow_dtypes,
 )
 from ibis.backends.pandas.dispatch import execute_literal, execute_node
 from ibis.backends.pandas.execution import constants
-from ibis.backends.pandas.execution.util import coerce_to_output, get_grouping
+from ibis.backends.pandas.execution.util import (
+    coerce_to_output,
+    get_grouping,
+    is_arrow_backed,
+)
+from ibis.backends.pandas.scan import get_scanned_table, get_source
+from ibis.formats.pandas import to_arrow_dtypes
 
 
 # By default return the literal value
@@ -988,8 +996,10 @@ def _execute_binary_op_impl(op, left, right, **_):
         raise com.OperationNotDefinedError(
             f'Binary operation {op_type.__name__} not implemented'
         )
-    else:
-        return operation(left, right)
+    if op_type is ops.Modulus and (is_arrow_backed(left) or is_arrow_backed(right)):
+        # pandas doesn't implement the modulus of pyarrow backed data
+        return left - (left // right) * right
+    return operation(left, right)
 
 
 @execute_node.register(ops.Binary, pd.Series, pd.Series)
@@ -1100,6 +1110,12 @@ def execute_string_split(op, data, delimiter, **kwargs):
     (pd.Series, numbers.Real, str, datetime.datetime),
 )
 def execute_between(op, data, lower, upper, **kwargs):
+    if is_arrow_backed(data) and pa.types.is_timestamp(data.dtype.pyarrow_dtype):
+        # pyarrow backed timestamps aren't compared with strings
+        lower, upper = (
+            pd.Timestamp(bound) if isinstance(bound, str) else bound
+            for bound in (lower, upper)
+        )
     return data.between(lower, upper)
 
 
@@ -1296,7 +1312,13 @@ for typ in (str, *scalar_types):
 def execute_database_table_client(
     op, client, timecontext: TimeContext | None, **kwargs
 ):
-    df = client.dictionary[op.name]
+    df = None if timecontext else get_scanned_table(op)
+    if df is None:
+        df = client.dictionary[op.name]
+        if (source := get_source(client, op.name)) is not None:
+            df = source.read()
+    if isinstance(client, PandasBackend) and use_arrow_dtypes():
+        df = to_arrow_dtypes(df, op.schema)
     if timecontext:
         begin, end = timecontext
         time_col = get_time_col()
@@ -1483,7 +1505,11 @@ def _build_select(op, whens, thens, otherwise, func=None, **kwargs):
     if otherwise is None:
         otherwise = np.nan
 
-    raw = np.select(func(whens_), thens_, otherwise)
+    conditions = [
+        cond.to_numpy(dtype=bool, na_value=False) if is_arrow_backed(cond) else cond
+        for cond in func(whens_)
+    ]
+    raw = np.select(conditions, thens_, otherwise)
 
     if grouped:
         return pd.Series(raw).groupby(get_grouping(res.grouper.groupings))
@@ -1539,7 +1565,10 @@ def execute_zero_if_null_series(op, data, **kwargs):
 
 @execute_node.register(ops.InMemoryTable)
 def execute_in_memory_table(op, **kwargs):
-    return op.data.to_frame()
+    df = op.data.to_frame()
+    if use_arrow_dtypes():
+        return to_arrow_dtypes(df, op.schema)
+    return df
 
 
 @execute_node.register(
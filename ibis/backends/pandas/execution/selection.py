@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import functools
 import operator
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Any, Iterable
 
 import pandas as pd
@@ -19,6 +19,7 @@ from ibis.backends.pandas.core import execute
 from ibis.backends.pandas.dispatch import execute_node
 from ibis.backends.pandas.execution import constants, util
 from ibis.backends.pandas.execution.util import coerce_to_output
+from ibis.common.graph import Graph
 
 
 def compute_projection(
@@ -199,6 +200,101 @@ def _compute_predicates(
         yield execute(predicate, scope=scope, **kwargs)
 
 
+# nodes whose arguments may be executed against different data than the
+# selected table, e.g. grouped data for window functions
+_SCOPE_CHANGING_NODES = (ops.WindowFunction, ops.Analytic, ops.TableNode)
+
+# nodes that are cheaper to execute again than to cache
+_TRIVIAL_NODES = (ops.TableColumn, ops.Literal, ops.ScalarParameter, ops.Alias)
+
+
+def find_shared_subexpressions(roots: Iterable[ops.Node]) -> list[ops.Value]:
+    """Find the subexpressions referenced more than once by `roots`.
+
+    Expressions nested below nodes which may execute their arguments against
+    other data, like window functions, are never shared.
+
+    Parameters
+    ----------
+    roots
+        The selections and predicates of a `Selection`.
+
+    Returns
+    -------
+    list[ops.Value]
+        The shared subexpressions, each one listed after its own arguments.
+    """
+    counts = Counter()
+    nested = set()
+    order = []
+    visited = set()
+
+    for root in roots:
+        counts[root] += 1
+        # iterative post-order traversal, arguments come before their parents
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if node in visited:
+                continue
+            visited.add(node)
+            stack.append((node, True))
+            children = node.__children__()
+            if isinstance(node, _SCOPE_CHANGING_NODES):
+                for child in children:
+                    nested.update(Graph.from_bfs(child))
+            else:
+                counts.update(children)
+                stack.extend((child, False) for child in reversed(children))
+
+    return [
+        node
+        for node in order
+        if counts[node] > 1
+        and node not in nested
+        and isinstance(node, ops.Value)
+        and not isinstance(node, _TRIVIAL_NODES)
+    ]
+
+
+def execute_shared_subexpressions(
+    op: ops.Selection,
+    data: pd.DataFrame,
+    scope: Scope,
+    timecontext: TimeContext | None,
+    **kwargs: Any,
+) -> Scope:
+    """Execute the subexpressions shared by the columns and predicates of `op`.
+
+    Returns `scope` extended with the results, so that executing the columns
+    and predicates afterwards computes every shared subexpression only once.
+    """
+    roots = [node for node in op.selections if isinstance(node, ops.Value)]
+    shared = find_shared_subexpressions(roots + list(op.predicates))
+    if not shared:
+        return scope
+
+    data_columns = frozenset(data.columns)
+    scope = scope.merge_scopes(
+        Scope(
+            {
+                t: map_new_column_names_to_data(
+                    remap_overlapping_column_names(op.table, t, data_columns), data
+                )
+            },
+            timecontext,
+        )
+        for t in an.find_immediate_parent_tables(shared)
+    )
+    for node in shared:
+        result = execute(node, scope=scope, timecontext=timecontext, **kwargs)
+        scope = scope.merge_scope(Scope({node: result}, timecontext))
+    return scope
+
+
 def build_df_from_selection(
     selections: list[ops.Value],
     data: pd.DataFrame,
@@ -263,6 +359,9 @@ def build_df_from_projection(
     # If cardinality changes (e.g. unnest/explode), trying to do this
     # won't work so don't try?
     for i, piece in enumerate(new_pieces):
+        # avoid copying the pieces that are already aligned with the data
+        if piece.index.equals(data.index):
+            continue
         new_pieces[i] = piece.sort_index()
         if len(new_pieces[i].index) == len(data.index):
             new_pieces[i].index = data.index
@@ -280,6 +379,12 @@ def execute_selection_dataframe(
 ):
     result = data
 
+    # Execute the subexpressions shared by several columns or predicates
+    # once upfront, the time context may be adjusted for each column
+    # separately so skip this when executing with one
+    if timecontext is None:
+        scope = execute_shared_subexpressions(op, data, scope, timecontext, **kwargs)
+
     # Build up the individual pandas structures from column expressions
     if op.selections:
         if all(isinstance(s, ops.TableColumn) for s in op.selections):
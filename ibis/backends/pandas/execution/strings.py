@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import itertools
 import json
 import operator
@@ -7,6 +8,8 @@ from functools import partial, reduce
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import toolz
 from pandas.core.groupby import SeriesGroupBy
 
@@ -19,18 +22,29 @@ import ibis.expr.operations as ops
 import ibis.util
 from ibis.backends.pandas.core import execute, integer_types, scalar_types
 from ibis.backends.pandas.dispatch import execute_node
-from ibis.backends.pandas.execution.util import get_grouping
+from ibis.backends.pandas.execution.util import (
+    arrow_compute,
+    astype,
+    get_grouping,
+    is_arrow_backed,
+)
+
+# pyarrow's default slice stop overflows when computing the output size
+_ARROW_MAX_STOP = np.iinfo(np.int32).max
 
 
 @execute_node.register(ops.StringLength, pd.Series)
 def execute_string_length_series(op, data, **kwargs):
-    return data.str.len().astype('int32')
+    return astype(data.str.len(), 'int32')
 
 
 @execute_node.register(
     ops.Substring, pd.Series, integer_types, (type(None), *integer_types)
 )
 def execute_substring_int_int(op, data, start, length, **kwargs):
+    if is_arrow_backed(data):
+        stop = _ARROW_MAX_STOP if length is None else start + length
+        return arrow_compute(pc.utf8_slice_codeunits, data, start, stop)
     if length is None:
         return data.str[start:]
     else:
@@ -99,6 +113,8 @@ def execute_string_rpad(op, data, length, pad, **kwargs):
 
 @execute_node.register(ops.Reverse, pd.Series)
 def execute_string_reverse(op, data, **kwargs):
+    if is_arrow_backed(data):
+        return arrow_compute(pc.utf8_reverse, data)
     return data.str[::-1]
 
 
@@ -135,6 +151,8 @@ def execute_string_contains(_, data, needle, **kwargs):
     (pd.Series, type(None)) + integer_types,
 )
 def execute_string_find(op, data, needle, start, end, **kwargs):
+    if is_arrow_backed(data) and isinstance(needle, str) and start is end is None:
+        return arrow_compute(pc.find_substring, data, needle)
     return data.str.find(needle, start, end)
 
 
@@ -241,7 +259,7 @@ def execute_group_concat_series_gb_mask(op, data, sep, mask, aggcontext=None, **
 
 @execute_node.register(ops.StringAscii, pd.Series)
 def execute_string_ascii(op, data, **kwargs):
-    return data.map(ord).astype('int32')
+    return astype(data.map(ord), 'int32')
 
 
 @execute_node.register(ops.StringAscii, SeriesGroupBy)
@@ -253,6 +271,9 @@ def execute_string_ascii_group_by(op, data, **kwargs):
 
 @execute_node.register(ops.RegexSearch, pd.Series, str)
 def execute_series_regex_search(op, data, pattern, **kwargs):
+    if is_arrow_backed(data):
+        with contextlib.suppress(pa.ArrowInvalid):
+            return arrow_compute(pc.match_substring_regex, data, pattern)
     pattern = re.compile(pattern)
     return data.map(lambda x, pattern=pattern: pattern.search(x) is not None)
 
@@ -296,6 +317,10 @@ def execute_series_regex_extract_gb(op, data, pattern, index, **kwargs):
 
 @execute_node.register(ops.RegexReplace, pd.Series, str, str)
 def execute_series_regex_replace(op, data, pattern, replacement, **kwargs):
+    if is_arrow_backed(data):
+        # patterns unsupported by pyarrow's RE2 engine fall back to `re`
+        with contextlib.suppress(pa.ArrowInvalid):
+            return arrow_compute(pc.replace_substring_regex, data, pattern, replacement)
     pattern = re.compile(pattern)
 
     def replacer(x, pattern=pattern):
@@ -355,6 +380,8 @@ def execute_series_translate_scalar_scalar(op, data, from_string, to_string, **k
 
 @execute_node.register(ops.StrRight, pd.Series, integer_types)
 def execute_series_right(op, data, nchars, **kwargs):
+    if is_arrow_backed(data):
+        return arrow_compute(pc.utf8_slice_codeunits, data, -nchars, _ARROW_MAX_STOP)
     return data.str[-nchars:]
 
 
@@ -396,6 +423,9 @@ def haystack_to_series_of_lists(haystack, index=None):
 @execute_node.register(ops.FindInSet, pd.Series, tuple)
 def execute_series_find_in_set(op, needle, haystack, **kwargs):
     haystack = [execute(arg, **kwargs) for arg in haystack]
+    if is_arrow_backed(needle) and all(isinstance(arg, str) for arg in haystack):
+        positions = arrow_compute(pc.index_in, needle, value_set=pa.array(haystack))
+        return astype(positions.fillna(-1), np.int64)
     pieces = haystack_to_series_of_lists(haystack, index=needle.index)
     index = itertools.count()
     return pieces.map(
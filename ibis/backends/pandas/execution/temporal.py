@@ -4,6 +4,8 @@ import datetime
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.core.groupby import SeriesGroupBy
 
 import ibis.expr.datatypes as dt
@@ -18,7 +20,12 @@ from ibis.backends.pandas.core import (
     timestamp_types,
 )
 from ibis.backends.pandas.dispatch import execute_node, pre_execute
-from ibis.backends.pandas.execution.util import get_grouping
+from ibis.backends.pandas.execution.util import (
+    arrow_compute,
+    astype,
+    get_grouping,
+    is_arrow_backed,
+)
 
 
 @execute_node.register(ops.Strftime, pd.Timestamp, str)
@@ -37,9 +44,24 @@ def execute_extract_timestamp_field_timestamp(op, data, **kwargs):
     return getattr(data, field_name)
 
 
+def _arrow_microsecond(values):
+    # pyarrow's microsecond is the fraction of the millisecond
+    return pc.add(pc.multiply(pc.millisecond(values), 1_000), pc.microsecond(values))
+
+
+_ARROW_TEMPORAL_FIELDS = {
+    'dayofyear': pc.day_of_year,
+    'weekofyear': pc.iso_week,
+    'microsecond': _arrow_microsecond,
+}
+
+
 @execute_node.register(ops.ExtractTemporalField, pd.Series)
 def execute_extract_timestamp_field_series(op, data, **kwargs):
     field_name = type(op).__name__.lower().replace('extract', '')
+    if is_arrow_backed(data):
+        func = _ARROW_TEMPORAL_FIELDS.get(field_name) or getattr(pc, field_name)
+        return astype(arrow_compute(func, data), np.int32)
     if field_name == 'weekofyear':
         return data.dt.isocalendar().week.astype(np.int32)
     return getattr(data.dt, field_name).astype(np.int32)
@@ -52,11 +74,17 @@ def execute_extract_millisecond_timestamp(op, data, **kwargs):
 
 @execute_node.register(ops.ExtractMillisecond, pd.Series)
 def execute_extract_millisecond_series(op, data, **kwargs):
+    if is_arrow_backed(data):
+        return astype(arrow_compute(pc.millisecond, data), np.int32)
     return (data.dt.microsecond // 1_000).astype(np.int32)
 
 
 @execute_node.register(ops.ExtractEpochSeconds, (datetime.datetime, pd.Series))
 def execute_epoch_seconds(op, data, **kwargs):
+    if is_arrow_backed(data):
+        unit = pa.timestamp('s', data.dtype.pyarrow_dtype.tz)
+        seconds = arrow_compute(pc.cast, data, unit, safe=False)
+        return astype(arrow_compute(pc.cast, seconds, pa.int64()), np.int32)
     # older versions of dask do not have a view method, so use astype
     # instead
     convert = getattr(data, "view", data.astype)
@@ -256,13 +284,13 @@ def execute_day_of_week_index_any(op, value, **kwargs):
 
 @execute_node.register(ops.DayOfWeekIndex, pd.Series)
 def execute_day_of_week_index_series(op, data, **kwargs):
-    return data.dt.dayofweek.astype(np.int16)
+    return astype(data.dt.dayofweek, np.int16)
 
 
 @execute_node.register(ops.DayOfWeekIndex, SeriesGroupBy)
 def execute_day_of_week_index_series_group_by(op, data, **kwargs):
     groupings = get_grouping(data.grouper.groupings)
-    return data.obj.dt.dayofweek.astype(np.int16).groupby(groupings, group_keys=False)
+    return astype(data.obj.dt.dayofweek, np.int16).groupby(groupings, group_keys=False)
 
 
 def day_name(obj: pd.core.indexes.accessors.DatetimeProperties | pd.Timestamp) -> str:
@@ -286,6 +314,8 @@ def execute_day_of_week_name_any(op, value, **kwargs):
 
 @execute_node.register(ops.DayOfWeekName, pd.Series)
 def execute_day_of_week_name_series(op, data, **kwargs):
+    if is_arrow_backed(data):
+        return arrow_compute(pc.strftime, data, format='%A')
     return day_name(data.dt)
 
 
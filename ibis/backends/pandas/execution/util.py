@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 import ibis.expr.analysis as an
 import ibis.expr.operations as ops
@@ -10,6 +12,7 @@ import ibis.util
 from ibis.backends.base.df.scope import Scope
 from ibis.backends.pandas.core import execute
 from ibis.backends.pandas.execution import constants
+from ibis.formats.pandas import _has_arrow_dtype
 
 
 def get_grouping(grouper):
@@ -135,3 +138,32 @@ def coerce_to_output(
 
     # Wrap `result` into a single-element Series.
     return pd.Series([result], name=node.name)
+
+
+def is_arrow_backed(data: Any) -> bool:
+    """Return whether `data` is a pandas object backed by a pyarrow array."""
+    return _has_arrow_dtype and isinstance(getattr(data, "dtype", None), pd.ArrowDtype)
+
+
+def arrow_compute(func: Callable, data: pd.Series, *args: Any, **kwargs: Any):
+    """Apply the `pyarrow.compute` function `func` to pyarrow backed `data`.
+
+    Returns
+    -------
+    pd.Series
+        The pyarrow backed result, with the index and name of `data`
+    """
+    result = func(pa.array(data.array), *args, **kwargs)
+    return pd.Series(
+        pd.arrays.ArrowExtensionArray(result),
+        index=data.index,
+        name=data.name,
+        copy=False,
+    )
+
+
+def astype(data: pd.Series, dtype: np.dtype | str) -> pd.Series:
+    """Cast `data` to the NumPy `dtype`, pyarrow backed data stays nullable."""
+    if is_arrow_backed(data):
+        return data.astype(pd.ArrowDtype(pa.from_numpy_dtype(np.dtype(dtype))))
+    return data.astype(dtype)
@@ -0,0 +1,285 @@
+"""Read the files registered with `read_parquet` and `read_csv` on execution.
+
+The files are not loaded when they are registered, the backend only keeps an
+empty DataFrame with the columns and types of the file. Before an expression
+is executed, the columns it references and the simple comparisons filtering
+each file table are collected and the file is read with only those columns,
+skipping the row groups of parquet files that can't match the filters.
+
+The pushed down filters only prune data, the predicates are still evaluated
+by the executor.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from typing import Any, Iterator, Literal
+
+import pandas as pd
+
+import ibis.expr.operations as ops
+import ibis.expr.schema as sch
+from ibis.common.graph import Graph, halt, proceed, traverse
+from ibis.formats.pandas import schema_from_pandas_dataframe
+
+# `!=` isn't pushed down, pandas keeps the rows where the column is missing
+# while the parquet reader drops them
+_COMPARISONS = {
+    ops.Equals: ('==', '=='),
+    ops.Greater: ('>', '<'),
+    ops.GreaterEqual: ('>=', '<='),
+    ops.Less: ('<', '>'),
+    ops.LessEqual: ('<=', '>='),
+}
+
+_LITERAL_TYPES = (bool, int, float, str)
+
+# number of rows the types of the columns of a CSV file are inferred from
+_CSV_SAMPLE_ROWS = 10_000
+
+# the tables read for the expression being executed
+_scanned_tables = contextvars.ContextVar('scanned_tables', default=None)
+
+
+class FileSource:
+    """A parquet or CSV file registered as a table.
+
+    Parameters
+    ----------
+    format
+        The format of the file, `"parquet"` or `"csv"`
+    path
+        The path of the file, or of a directory of parquet files
+    kwargs
+        Keyword arguments passed to `pd.read_parquet` or `pd.read_csv`
+    """
+
+    __slots__ = ('format', 'path', 'kwargs', 'placeholder', 'schema')
+
+    def __init__(
+        self, format: Literal['parquet', 'csv'], path: str, kwargs: dict[str, Any]
+    ) -> None:
+        self.format = format
+        self.path = path
+        self.kwargs = kwargs
+        # an empty frame with the columns and types of the file, the types of
+        # its empty object columns can't be inferred so the schema is kept
+        self.placeholder, self.schema = self._inspect()
+
+    def _inspect(self) -> tuple[pd.DataFrame, sch.Schema]:
+        if self.format == 'parquet':
+            import pyarrow.parquet as pq
+
+            schema = pq.ParquetDataset(self.path).schema
+            df = schema.empty_table().to_pandas()
+            if (columns := self.kwargs.get('columns')) is not None:
+                df = df[list(columns)]
+            # leave out the columns restoring the index
+            schema = sch.Schema.from_pyarrow(schema)
+            return df, sch.Schema({name: schema[name] for name in df.columns})
+
+        df = pd.read_csv(self.path, **{**self.kwargs, 'nrows': _CSV_SAMPLE_ROWS})
+        return df.iloc[:0], schema_from_pandas_dataframe(df)
+
+    def read(
+        self, columns: set[str] | None = None, filters: list[tuple] | None = None
+    ) -> pd.DataFrame:
+        """Read the file.
+
+        Parameters
+        ----------
+        columns
+            The columns to read, `None` reads every column
+        filters
+            Comparisons the rows of parquet files are filtered by, ignored
+            for CSV files
+
+        Returns
+        -------
+        pd.DataFrame
+            The data of the file
+        """
+        kwargs = dict(self.kwargs)
+        if columns is not None:
+            # keep the order of the columns of the file
+            names = [name for name in self.placeholder.columns if name in columns]
+            if self.format == 'parquet':
+                kwargs['columns'] = names
+            elif 'usecols' not in kwargs:
+                kwargs['usecols'] = names
+        if self.format == 'parquet':
+            if filters and 'filters' not in kwargs:
+                kwargs['filters'] = filters
+            return pd.read_parquet(self.path, **kwargs)
+        return pd.read_csv(self.path, **kwargs)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.format!r}, {self.path!r})'
+
+
+def get_source(client: Any, name: str) -> FileSource | None:
+    """Return the file source of the `name` table of `client`, if any."""
+    source = getattr(client, '_file_sources', {}).get(name)
+    # the table may have been replaced since it was registered
+    if source is None or client.dictionary.get(name) is not source.placeholder:
+        return None
+    return source
+
+
+def read_tables(node: ops.Node) -> dict[ops.Node, pd.DataFrame]:
+    """Read the file tables of `node` with the pushed down operations.
+
+    Parameters
+    ----------
+    node
+        The operation to execute
+
+    Returns
+    -------
+    dict[ops.Node, pd.DataFrame]
+        Mapping of the file tables of `node` to their data
+    """
+    graph = Graph.from_bfs(node)
+    parents = graph.invert()
+
+    result = {}
+    for table in graph:
+        if not isinstance(table, ops.DatabaseTable):
+            continue
+        if (source := get_source(table.source, table.name)) is None:
+            continue
+        result[table] = source.read(
+            columns=referenced_columns(table, parents[table]),
+            filters=pushed_filters(node, table, parents[table]),
+        )
+    return result
+
+
+def referenced_columns(table: ops.DatabaseTable, parents) -> set[str] | None:
+    """Return the columns of `table` used by `parents`, `None` if all are needed.
+
+    Parameters
+    ----------
+    table
+        The table to read
+    parents
+        The operations depending on `table`
+
+    Returns
+    -------
+    set[str] | None
+        The referenced columns
+    """
+    columns = set()
+    for parent in parents:
+        if isinstance(parent, ops.TableColumn):
+            columns.add(parent.name)
+        elif isinstance(parent, ops.Aggregation) and parent.table == table:
+            continue
+        elif (
+            isinstance(parent, ops.Selection)
+            and parent.table == table
+            and parent.selections
+            and table not in parent.selections
+        ):
+            continue
+        else:
+            # joins, unions, counts and star selections need every column
+            return None
+    # keep at least one column to preserve the number of rows
+    return columns or None
+
+
+def pushed_filters(root: ops.Node, table: ops.DatabaseTable, parents) -> list[tuple]:
+    """Return the comparisons all the rows read from `table` are filtered by.
+
+    Parameters
+    ----------
+    root
+        The operation to execute
+    table
+        The table to read
+    parents
+        The operations depending on `table`
+
+    Returns
+    -------
+    list[tuple]
+        `(column, op, value)` filters in the format of the parquet readers
+    """
+    relations = [
+        parent
+        for parent in parents
+        if isinstance(parent, (ops.Selection, ops.Aggregation))
+        and parent.table == table
+    ]
+    if len(relations) != 1 or not (relation := relations[0]).predicates:
+        return []
+
+    # the table must not be reachable without going through the filtering
+    # relation, e.g. from a subquery aggregating the whole table
+    def fn(node):
+        if node == table:
+            return halt, node
+        return (halt if node == relation else proceed), None
+
+    if any(traverse(fn, root)):
+        return []
+
+    filters = []
+    for predicate in relation.predicates:
+        filters.extend(_predicate(predicate, table))
+    return filters
+
+
+def _predicate(op: ops.Node, table: ops.DatabaseTable) -> list[tuple]:
+    if isinstance(op, ops.And):
+        return _predicate(op.left, table) + _predicate(op.right, table)
+    elif (names := _COMPARISONS.get(type(op))) is not None:
+        if (value := _literal(op.right)) is not None and _is_column(op.left, table):
+            return [(op.left.name, names[0], value)]
+        elif (value := _literal(op.left)) is not None and _is_column(op.right, table):
+            return [(op.right.name, names[1], value)]
+    elif isinstance(op, ops.Between) and _is_column(op.arg, table):
+        filters = []
+        if (lower := _literal(op.lower_bound)) is not None:
+            filters.append((op.arg.name, '>=', lower))
+        if (upper := _literal(op.upper_bound)) is not None:
+            filters.append((op.arg.name, '<=', upper))
+        return filters
+    elif (
+        isinstance(op, ops.Contains)
+        and isinstance(op.options, tuple)
+        and _is_column(op.value, table)
+    ):
+        values = [_literal(option) for option in op.options]
+        if values and all(value is not None for value in values):
+            return [(op.value.name, 'in', values)]
+    return []
+
+
+def _is_column(op: ops.Node, table: ops.DatabaseTable) -> bool:
+    return isinstance(op, ops.TableColumn) and op.table == table
+
+
+def _literal(op: ops.Node) -> Any:
+    if isinstance(op, ops.Literal) and isinstance(op.value, _LITERAL_TYPES):
+        return op.value
+    return None
+
+
+@contextlib.contextmanager
+def scanned_tables(tables: dict[ops.Node, pd.DataFrame]) -> Iterator[None]:
+    """Read the tables in `tables` from the given data within the block."""
+    token = _scanned_tables.set(tables)
+    try:
+        yield
+    finally:
+        _scanned_tables.reset(token)
+
+
+def get_scanned_table(op: ops.DatabaseTable) -> pd.DataFrame | None:
+    """Return the data read for `op`, `None` if it wasn't read beforehand."""
+    tables = _scanned_tables.get()
+    return None if tables is None else tables.get(op)
@@ -12,6 +12,7 @@ import ibis.expr.datatypes as dt
 from ibis import _
 from ibis.backends.pandas import Backend
 from ibis.backends.pandas.execution import execute
+from ibis.backends.pandas.execution.selection import find_shared_subexpressions
 from ibis.backends.pandas.tests.conftest import TestConf as tm
 
 
@@ -66,6 +67,34 @@ def test_project_scope_does_not_override(t, df):
     tm.assert_frame_equal(result, expected)
 
 
+def test_project_shared_subexpressions(t, df):
+    shared = (t.plain_int64 + t.plain_float64) * 2
+    window = ibis.window(group_by='dup_strings')
+    expr = t.filter(shared > 10).select(
+        x=shared + 1,
+        y=shared * shared,
+        z=(t.plain_int64 + t.plain_float64).sum().over(window),
+    )
+
+    op = expr.op()
+    nodes = find_shared_subexpressions([*op.selections, *op.predicates])
+    # the sum is only shared with an expression executed over a window
+    assert nodes == [shared.op()]
+
+    result = expr.execute()
+    shared = (df.plain_int64 + df.plain_float64) * 2
+    expected = pd.DataFrame(
+        {
+            'x': shared + 1,
+            'y': shared * shared,
+            'z': (df.plain_int64 + df.plain_float64)
+            .groupby(df.dup_strings)
+            .transform('sum'),
+        }
+    )[shared > 10].reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     'where',
     [
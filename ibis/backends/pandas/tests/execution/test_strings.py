@@ -1,10 +1,12 @@
 from warnings import catch_warnings
 
 import numpy as np
+import pandas as pd
 import pandas.testing as tm
 import pytest
 from pytest import param
 
+import ibis
 from ibis.backends.pandas.execution.strings import sql_like_to_regex
 
 
@@ -99,6 +101,30 @@ def test_string_ops(t, df, case_func, expected_func):
         tm.assert_series_equal(result, series, check_names=False)
 
 
+@pytest.mark.parametrize(
+    'case_func',
+    [
+        param(lambda s: s.length(), id='length'),
+        param(lambda s: s.substr(1, 2), id='substr'),
+        param(lambda s: s.substr(1), id='substr_open'),
+        param(lambda s: s.right(2), id='right'),
+        param(lambda s: s.reverse(), id='reverse'),
+        param(lambda s: s.upper(), id='upper'),
+        param(lambda s: s.find('a'), id='find'),
+        param(lambda s: s.re_search('(ab)+'), id='re_search'),
+        param(lambda s: s.re_replace('a+', 'b'), id='re_replace'),
+        param(lambda s: s.find_in_set(['a', 'b']), id='find_in_set'),
+    ],
+)
+def test_string_ops_arrow_dtypes(t, case_func):
+    expr = case_func(t.strings_with_space)
+    expected = expr.execute()
+    with ibis.config.option_context('pandas.dtype_backend', 'pyarrow'):
+        result = expr.execute()
+    assert isinstance(result.dtype, pd.ArrowDtype)
+    tm.assert_series_equal(result.astype(expected.dtype), expected)
+
+
 @pytest.mark.parametrize(
     ('pattern', 'expected'),
     [
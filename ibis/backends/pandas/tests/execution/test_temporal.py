@@ -7,6 +7,7 @@ import pytest
 from packaging.version import parse as parse_version
 from pytest import param
 
+import ibis
 from ibis import literal as L
 from ibis.backends.pandas import Backend
 from ibis.backends.pandas.execution import execute
@@ -174,3 +175,22 @@ def test_interval_arithmetic(op, expected):
     result = expr.execute()
     expected = pd.Series(expected(data, data), name='td')
     tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ('case_func', 'expected'),
+    [
+        param(methodcaller('year'), [2015, None], id='year'),
+        param(methodcaller('millisecond'), [359, None], id='millisecond'),
+        param(methodcaller('epoch_seconds'), [1441118885, None], id='epoch'),
+        param(lambda v: v.day_of_week.index(), [1, None], id='day_of_week_index'),
+        param(lambda v: v.day_of_week.full_name(), ['Tuesday', None], id='day_name'),
+    ],
+)
+def test_timestamp_functions_arrow_dtypes(case_func, expected):
+    df = pd.DataFrame({'ts': pd.to_datetime(['2015-09-01 14:48:05.359', None])})
+    t = Backend().connect({'df': df}).table('df')
+    with ibis.config.option_context('pandas.dtype_backend', 'pyarrow'):
+        result = case_func(t.ts).execute()
+    assert isinstance(result.dtype, pd.ArrowDtype)
+    assert result.tolist() == [expected[0], pd.NA]
@@ -163,3 +163,34 @@ def test_window_agg_udf_different_freq():
     expected = pd.Series([data.iloc[0:5].mean(), data.iloc[4:7].mean()])
 
     tm.assert_series_equal(result, expected)
+
+
+def test_window_agg_udf_vectorized():
+    data = pd.Series(np.arange(6, dtype=float))
+    window_lower_indices = pd.Series([0, 0, 0, 1, 3, 3])
+    window_upper_indices = pd.Series([1, 2, 3, 4, 4, 6])
+    mask = pd.Series([True, True, True, True, False, True])
+
+    calls = []
+
+    def mean(v):
+        calls.append(v.shape)
+        return v.mean(axis=-1)
+
+    mean.vectorized = True
+
+    result = window_agg_udf(
+        data,
+        mean,
+        window_lower_indices,
+        window_upper_indices,
+        mask,
+        data.index,
+        'float',
+        None,
+    )
+
+    expected = pd.Series([0.0, 0.5, 1.0, 2.0, np.nan, 4.0])
+    tm.assert_series_equal(result, expected)
+    # one call per distinct window length
+    assert sorted(calls) == [(1, 1), (1, 2), (3, 3)]
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import pandas.testing as tm
+import pyarrow as pa
 import pytest
 from pytest import param
 
@@ -87,3 +88,116 @@ def test_datetime64_infer(client, unit):
     expr = ibis.literal(value, type='timestamp')
     result = client.execute(expr)
     assert result == pd.Timestamp(value).to_pydatetime()
+
+
+def test_to_pyarrow_batches(client, table):
+    reader = client.to_pyarrow_batches(table.mutate(c=table.a + 1), chunk_size=2)
+    assert reader.schema.names == ['a', 'b', 'c']
+    assert [batch.num_rows for batch in reader] == [2, 1]
+
+
+def test_to_pyarrow_batches_column(client, table):
+    result = client.to_pyarrow_batches(table.a).read_all()
+    assert result.column_names == ['a']
+    assert result['a'].to_pylist() == [1, 2, 3]
+
+
+def test_to_pyarrow_arrow_memtable(client, monkeypatch):
+    data = pa.table({'a': [1, None, 3, 4], 'b': list('abcd')})
+    t = ibis.memtable(data)
+    expr = t.filter([t.a > 1, t.b.isin(['c', 'd'])]).select('b', c='a')
+
+    # arrow backed tables aren't converted to pandas
+    monkeypatch.setattr(client, 'execute', None)
+    result = client.to_pyarrow(expr)
+    assert result.to_pydict() == {'b': ['c', 'd'], 'c': [3, 4]}
+
+    reader = client.to_pyarrow_batches(t, chunk_size=3)
+    assert [batch.num_rows for batch in reader] == [3, 1]
+
+
+def test_to_pyarrow_arrow_memtable_matches_execute(client):
+    t = ibis.memtable(pa.table({'a': [1, None, 3]}))
+
+    # pandas keeps the missing values compared with `!=`
+    expr = t.filter(t.a != 1)
+    assert client.to_pyarrow(expr).num_rows == len(client.execute(expr)) == 2
+
+    # limits are rejected like `execute` does
+    with pytest.raises(ValueError, match="limit"):
+        client.to_pyarrow(t, limit=1)
+    with pytest.raises(ValueError, match="limit"):
+        client.to_pyarrow_batches(t, limit=1)
+
+
+@pytest.fixture
+def file_data():
+    return pd.DataFrame(
+        {
+            'a': np.arange(100),
+            'b': np.arange(100) * 1.5,
+            'c': list('xy') * 50,
+        }
+    )
+
+
+@pytest.fixture
+def parquet_table(file_data, tmp_path):
+    path = tmp_path / 't.parquet'
+    file_data.to_parquet(path, row_group_size=10)
+    return ibis.pandas.connect().read_parquet(path, table_name='t')
+
+
+def test_read_parquet_pushdown(parquet_table, file_data, monkeypatch):
+    from ibis.backends.pandas.scan import read_tables
+
+    t, df = parquet_table, file_data
+    expr = t.filter([t.a >= 90, t.c.isin(['x'])])[['a', 'b']]
+
+    (scanned,) = read_tables(expr.op()).values()
+    assert list(scanned.columns) == ['a', 'b', 'c']
+    assert len(scanned) == 5
+
+    # the file is only read when executing
+    assert not len(t.op().source.dictionary['t'])
+    result = expr.execute()
+    expected = df.loc[(df.a >= 90) & (df.c == 'x'), ['a', 'b']].reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_parquet_no_unsafe_filters(parquet_table, file_data):
+    from ibis.backends.pandas.scan import read_tables
+
+    t, df = parquet_table, file_data
+    # the mean has to be computed over the whole table
+    expr = t.filter(t.a > t.a.mean()).count()
+    (scanned,) = read_tables(expr.op()).values()
+    assert len(scanned) == len(df)
+    assert expr.execute() == (df.a > df.a.mean()).sum()
+
+    # pandas keeps the missing values compared with `!=`
+    expr = t.filter(t.b.nullif(3.0) != 0.0).count()
+    assert expr.execute() == len(df) - 1
+
+
+def test_read_parquet_replaced(parquet_table, file_data):
+    client = parquet_table.op().source
+    client.dictionary['t'] = file_data.head(3)
+    assert client.table('t').count().execute() == 3
+
+
+def test_read_csv(file_data, tmp_path):
+    from ibis.backends.pandas.scan import read_tables
+
+    path = tmp_path / 't.csv'
+    file_data.to_csv(path, index=False)
+    t = ibis.pandas.connect().read_csv(path)
+    assert t.schema() == ibis.schema({'a': 'int64', 'b': 'float64', 'c': 'string'})
+
+    expr = t.group_by('c').aggregate(total=t.b.sum()).order_by('c')
+    (scanned,) = read_tables(expr.op()).values()
+    assert list(scanned.columns) == ['b', 'c']
+
+    result = expr.execute()
+    expected = file_data.groupby('c').b.sum().rename('total').reset_index()
+    tm.assert_frame_equal(result, expected)
@@ -1,3 +1,5 @@
+import json
+
 import pandas as pd
 import pandas.testing as tm
 import pytest
@@ -5,10 +7,12 @@ import pytest
 import ibis
 import ibis.common.exceptions as com
 import ibis.expr.operations as ops
-from ibis.backends.base.df.scope import Scope
+from ibis.backends.base.df.profile import profile
+from ibis.backends.base.df.scope import Scope, ScopeTracker
 from ibis.backends.pandas import Backend
 from ibis.backends.pandas.dispatch import post_execute, pre_execute
 from ibis.backends.pandas.execution import execute
+from ibis.common.graph import Graph
 
 
 @pytest.fixture
@@ -104,3 +108,84 @@ def test_scope_look_up():
     scope = scope.merge_scope(Scope({one_day: 1}, None))
     assert scope.get_value(one_hour) is None
     assert scope.get_value(one_day) is not None
+
+
+def test_scope_tracker_releases_cache(ibis_table):
+    value = ibis_table.plain_int64 + 1
+    expr = ibis_table.mutate(a=value, b=value * 2)
+    node = value.op()
+
+    cache = {}
+    tracker = ScopeTracker(expr.op(), cache)
+    assert tracker.expected[node] == 2
+
+    frame = tracker.enter()
+    cache[node, None] = object()
+    tracker.exit(frame, node, None)
+    assert (node, None) in cache
+
+    frame = tracker.enter()
+    tracker.exit(frame, node, None)
+    assert not cache
+
+
+def test_scope_tracker_without_cache_skips_traversal(ibis_table, mocker):
+    expr = ibis_table.mutate(a=ibis_table.plain_int64 + 1)
+    from_bfs = mocker.spy(Graph, 'from_bfs')
+
+    tracker = ScopeTracker(expr.op(), {})
+    node = expr.op()
+    frame = tracker.enter()
+    tracker.exit(frame, node, None)
+
+    from_bfs.assert_not_called()
+
+
+def test_report_scope_size(ibis_table, capsys):
+    expr = ibis_table.mutate(a=ibis_table.plain_int64 + 1)
+    with ibis.config.option_context('pandas.report_scope_size', True):
+        expr.execute()
+    out = capsys.readouterr().out
+    assert out.startswith("peak scope size: ")
+
+
+def test_profile(ibis_table, tmp_path):
+    t = ibis_table
+    expr = t.filter(t.plain_int64 > 1).group_by('dup_strings').plain_int64.sum()
+    with profile() as report:
+        expr.execute()
+
+    stats = report.by_op()
+    assert stats['Greater'].calls == 1
+    assert stats['Greater'].rows_in == 3
+    assert stats['Greater'].rows_out == 3
+    assert stats['Sum'].rows_in == 2
+    assert stats['Aggregation'].rows_out == 2
+    assert all(s.memory_delta is not None for s in stats.values())
+    # the time of the nested dispatches is subtracted from the self time
+    (agg,) = (r for r in report.records if r.op == 'Aggregation')
+    assert 0 <= agg.self_time < agg.wall_time
+    assert agg.stack == ('Aggregation',)
+
+    path = tmp_path / 'profile.json'
+    report.to_json(path)
+    data = json.loads(path.read_text())
+    assert data['ops'].keys() == stats.keys()
+    assert len(data['records']) == len(report.records)
+
+    lines = report.to_flamegraph().splitlines()
+    assert 'Aggregation;Greater;TableColumn;DatabaseTable' in {
+        line.rsplit(' ', 1)[0] for line in lines
+    }
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+
+def test_profile_without_memory(ibis_table):
+    with profile(memory=False) as report:
+        ibis_table.plain_int64.sum().execute()
+    assert report.by_op()['Sum'].memory_delta is None
+
+    # executions outside of the block aren't recorded
+    num_records = len(report.records)
+    ibis_table.plain_int64.sum().execute()
+    assert len(report.records) == num_records
@@ -6,6 +6,7 @@ import pytest
 from packaging.version import parse as vparse
 
 import ibis
+import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.types as ir
 from ibis.backends.pandas import Backend
@@ -207,6 +208,40 @@ def test_udaf_groupby():
     tm.assert_frame_equal(result[columns], expected[columns])
 
 
+@pytest.fixture(params=['thread', 'process'])
+def udf_executor(request):
+    Backend.register_options()
+    with ibis.options(
+        {'pandas.udf_executor': request.param, 'pandas.udf_chunk_size': 1}
+    ):
+        yield request.param
+
+
+def test_udaf_parallel_groupby(con, t2, df2, udf_executor):
+    expr = t2.group_by(t2.key).aggregate(my_corr=my_corr(t2.a, t2.b))
+    result = expr.execute().sort_values('key').reset_index(drop=True)
+
+    expected = (
+        df2.groupby('key')
+        .apply(lambda df: df.a.corr(df.b))
+        .rename('my_corr')
+        .reset_index()
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_udaf_parallel_analytic_groupby(con, t2, df2, udf_executor):
+    window = ibis.window(group_by=t2.key)
+    expr = t2.mutate(z=zscore(t2.a).over(window), corr=my_corr(t2.a, t2.b).over(window))
+    result = expr.execute()
+
+    expected = df2.assign(
+        z=df2.groupby('key').a.transform(lambda s: s.sub(s.mean()).div(s.std())),
+        corr=df2.groupby('key').a.transform(lambda s: s.corr(df2.loc[s.index, 'b'])),
+    )
+    tm.assert_frame_equal(result, expected)
+
+
 def test_udaf_parameter_mismatch():
     with pytest.raises(TypeError):
 
@@ -362,6 +397,57 @@ def test_multiple_argument_udaf_window():
     tm.assert_frame_equal(result, expected)
 
 
+def test_vectorized_udaf_window():
+    @udf.reduction(['double', 'double'], 'double', vectorized=True)
+    def my_wm(v, w):
+        assert v.ndim == 2
+        return np.average(v, weights=w, axis=-1)
+
+    df = pd.DataFrame(
+        {
+            'a': np.arange(10, dtype=float),
+            'b': np.random.rand(10),
+            'w': np.random.rand(10),
+            'key': list('ddeefffggh'),
+        }
+    )
+    con = Backend().connect({'df': df})
+    t = con.table('df')
+    window = ibis.trailing_window(2, order_by='a', group_by='key')
+    expr = t.mutate(rolled=my_wm(t.b, t.w).over(window))
+    result = expr.execute().sort_values(['key', 'a'])
+    expected = df.sort_values(['key', 'a']).assign(
+        rolled=lambda d: (
+            (d.b * d.w).groupby(d.key).rolling(3, min_periods=1).sum()
+            / d.w.groupby(d.key).rolling(3, min_periods=1).sum()
+        ).reset_index(level=0, drop=True)
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'output_type',
+    [dt.Struct(dict(mean='double', std='double')), dt.Array(dt.double)],
+)
+def test_vectorized_udaf_non_scalar_output(output_type):
+    with pytest.raises(com.IbisTypeError, match='scalar values'):
+
+        @udf.reduction(['double'], output_type, vectorized=True)
+        def batched_mean_and_std(v):
+            return v.mean(axis=-1), v.std(axis=-1)
+
+    @udf.reduction(['double'], output_type)
+    def mean_and_std(v):
+        return v.mean(), v.std()
+
+    df = pd.DataFrame({'a': np.arange(4, dtype=float), 'key': list('aabb')})
+    con = Backend().connect({'df': df})
+    t = con.table('df')
+    window = ibis.trailing_window(1, order_by='a', group_by='key')
+    result = t.mutate(r=mean_and_std(t.a).over(window)).execute()
+    assert len(result.r) == 4
+
+
 def test_udaf_window_nan():
     df = pd.DataFrame(
         {
@@ -4,6 +4,9 @@ With tracing enabled, this module will log time and call stack information of
 the executed expression. Call stack information is presented with indentation
 level.
 
+`ibis.backends.base.df.profile` records the same information per operation
+in a structured form that can be aggregated and exported.
+
 For example:
 
 import pandas as pd
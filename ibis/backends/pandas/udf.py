@@ -10,7 +10,6 @@ from pandas.core.groupby import SeriesGroupBy
 import ibis.expr.operations as ops
 import ibis.udf.vectorized
 from ibis.backends.base import BaseBackend
-from ibis.backends.pandas.aggcontext import Transform
 from ibis.backends.pandas.dispatch import execute_node, pre_execute
 from ibis.backends.pandas.execution.util import get_grouping
 
@@ -41,9 +40,11 @@ class udf:
         return ibis.udf.vectorized.elementwise(input_type, output_type)
 
     @staticmethod
-    def reduction(input_type, output_type):
+    def reduction(input_type, output_type, *, vectorized=False):
         """Alias for ibis.udf.vectorized.reduction."""
-        return ibis.udf.vectorized.reduction(input_type, output_type)
+        return ibis.udf.vectorized.reduction(
+            input_type, output_type, vectorized=vectorized
+        )
 
     @staticmethod
     def analytic(input_type, output_type):
@@ -134,35 +135,15 @@ def pre_execute_analytic_and_reduction_udf(op, *clients, scope=None, **kwargs):
     # 3) a grouped custom aggregation context
     @execute_node.register(type(op), *(itertools.repeat(SeriesGroupBy, nargs)))
     def execute_udaf_node_groupby(op, *args, aggcontext, **kwargs):
-        func = op.func
-        if isinstance(aggcontext, Transform):
-            # We are aggregating over an unbounded (and GROUPED) window,
-            # which uses a Transform aggregation context.
-            # We need to do some pre-processing to func and args so that
-            # Transform can pull data out of the SeriesGroupBys in args.
-
-            # Construct a generator that yields the next group of data
-            # for every argument excluding the first (pandas performs
-            # the iteration for the first argument) for each argument
-            # that is a SeriesGroupBy.
-            iters = create_gens_from_args_groupby(*args[1:])
-
-            # TODO: Unify calling convension here to be more like
-            # window
-            def aggregator(first, *rest):
-                # map(next, *rest) gets the inputs for the next group
-                # TODO: might be inefficient to do this on every call
-                return func(first, *map(next, rest))
-
-            return aggcontext.agg(args[0], aggregator, *iters)
-        else:
-            # We are either:
-            # 1) Aggregating over a bounded window, which uses a Window
-            #  aggregation context
-            # 2) Aggregating over a custom aggregation context
-            # 3) Aggregating using an Aggregate node (with GROUPING), which
-            #   uses a Summarize aggregation context
-            # No pre-processing to be done for any case.
-            return aggcontext.agg(args[0], func, *args[1:])
+        # No pre-processing to be done, the aggregation contexts handle
+        # SeriesGroupBy arguments:
+        # 1) Aggregating over an unbounded (and GROUPED) window, which uses a
+        #   Transform aggregation context
+        # 2) Aggregating over a bounded window, which uses a Window
+        #   aggregation context
+        # 3) Aggregating over a custom aggregation context
+        # 4) Aggregating using an Aggregate node (with GROUPING), which
+        #   uses a Summarize aggregation context
+        return aggcontext.agg(args[0], op.func, *args[1:])
 
     return scope
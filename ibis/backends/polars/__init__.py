@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
+import warnings
+import weakref
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Mapping, MutableMapping
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, MutableMapping
 
 import polars as pl
 
@@ -14,11 +19,12 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis.backends.base import BaseBackend, Database
 from ibis.backends.polars.compiler import translate
-from ibis.backends.polars.datatypes import schema_from_polars
-from ibis.util import gen_name, normalize_filename
+from ibis.backends.polars.datatypes import dtype_to_polars, schema_from_polars
+from ibis.util import experimental, gen_name, normalize_filename
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 
 class Backend(BaseBackend):
@@ -373,10 +379,163 @@ class Backend(BaseBackend):
         limit: int | str | None = None,
         chunk_size: int = 1_000_000,
         **kwargs: Any,
-    ):
-        self._import_pyarrow()
-        table = self._to_pyarrow_table(expr, params=params, limit=limit, **kwargs)
-        return table.to_reader(chunk_size)
+    ) -> pa.ipc.RecordBatchReader:
+        """Execute expression and return a RecordBatchReader.
+
+        Queries supported by the polars streaming engine are streamed into a
+        temporary uncompressed Arrow IPC file, which is memory mapped and read
+        batch by batch, so the result doesn't have to fit in memory. Other
+        queries are collected before being split into batches.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        results
+            RecordBatchReader
+        """
+        pa = self._import_pyarrow()
+        lf = self.compile(expr, params=params, **kwargs)
+        if limit == "default":
+            limit = ibis.options.sql.default_limit
+        if limit is not None:
+            lf = lf.limit(limit)
+        schema = expr.as_table().schema().to_pyarrow()
+
+        if not (hasattr(lf, "sink_ipc") and _is_streamable(lf)):
+            table = lf.collect(streaming=True).to_arrow()
+            table = table.rename_columns(schema.names).cast(schema)
+            return table.to_reader(chunk_size)
+
+        tmpdir = tempfile.mkdtemp(prefix="ibis-polars-")
+        path = os.path.join(tmpdir, "result.arrow")
+        try:
+            lf.sink_ipc(path, compression=None)
+        except Exception:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            raise
+
+        batches = _read_ipc_batches(path, schema, chunk_size)
+        # remove the spooled result once the reader is garbage collected
+        weakref.finalize(batches, shutil.rmtree, tmpdir, ignore_errors=True)
+        return pa.ipc.RecordBatchReader.from_batches(schema, batches)
+
+    @experimental
+    def to_parquet(
+        self,
+        expr: ir.Table,
+        path: str | Path,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Write the results of executing the given expression to a parquet file.
+
+        Queries supported by the polars streaming engine are written with
+        `LazyFrame.sink_parquet` without materializing the result when the
+        keyword arguments have an equivalent there, the others are written
+        batch by batch with pyarrow.
+
+        Parameters
+        ----------
+        expr
+            The ibis expression to execute and persist to parquet.
+        path
+            The data source. A string or Path to the parquet file.
+        params
+            Mapping of scalar parameter expressions to value.
+        **kwargs
+            Additional keyword arguments passed to
+            `pyarrow.parquet.ParquetWriter`
+
+        https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetWriter.html
+        """
+        sink_kwargs = _parquet_sink_kwargs(kwargs)
+        if sink_kwargs is not None and (lf := self._sinkable(expr, params)) is not None:
+            lf.sink_parquet(path, **sink_kwargs)
+            return
+
+        import pyarrow.parquet as pq
+
+        batch_reader = self.to_pyarrow_batches(expr, params=params)
+        with pq.ParquetWriter(path, batch_reader.schema, **kwargs) as writer:
+            for batch in batch_reader:
+                writer.write_batch(batch)
+
+    @experimental
+    def to_csv(
+        self,
+        expr: ir.Table,
+        path: str | Path,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Write the results of executing the given expression to a CSV file.
+
+        Queries supported by the polars streaming engine are written with
+        `LazyFrame.sink_csv` where polars provides it and no keyword arguments
+        are given, the others are written batch by batch with pyarrow.
+
+        Parameters
+        ----------
+        expr
+            The ibis expression to execute and persist to CSV.
+        path
+            The data source. A string or Path to the CSV file.
+        params
+            Mapping of scalar parameter expressions to value.
+        **kwargs
+            Additional keyword arguments passed to `pyarrow.csv.CSVWriter`
+
+        https://arrow.apache.org/docs/python/generated/pyarrow.csv.CSVWriter.html
+        """
+        if not kwargs and (lf := self._sinkable(expr, params, "sink_csv")) is not None:
+            lf.sink_csv(path)
+            return
+
+        import pyarrow.csv as pcsv
+
+        batch_reader = self.to_pyarrow_batches(expr, params=params)
+        with pcsv.CSVWriter(path, batch_reader.schema, **kwargs) as writer:
+            for batch in batch_reader:
+                writer.write_batch(batch)
+
+    def _sinkable(
+        self,
+        expr: ir.Table,
+        params: Mapping[ir.Scalar, Any] | None,
+        sink: str = "sink_parquet",
+    ) -> pl.LazyFrame | None:
+        """Return the query of `expr` if it can be sunk with `sink`.
+
+        The columns are cast to the types of the expression's schema, as done
+        when exporting to pyarrow.
+        """
+        lf = self.compile(expr, params=params)
+        if not hasattr(lf, sink):
+            return None
+        try:
+            columns = [
+                pl.col(column).cast(dtype_to_polars(dtype)).alias(name)
+                for column, (name, dtype) in zip(lf.columns, expr.schema().items())
+            ]
+        except (NotImplementedError, ValueError):
+            return None
+        lf = lf.select(columns)
+        return lf if _is_streamable(lf) else None
 
     def _load_into_cache(self, name, expr):
         self.create_table(name, self.compile(expr).cache())
@@ -392,3 +551,52 @@ class Backend(BaseBackend):
 
     def drop_view(self, *_, **__) -> ir.Table:
         raise NotImplementedError(self.name)
+
+
+def _parquet_sink_kwargs(kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Translate `ParquetWriter` keyword arguments to `sink_parquet` ones.
+
+    Returns `None` if any of the arguments has no equivalent.
+    """
+    # use the defaults of `ParquetWriter`
+    sink_kwargs = {"compression": "snappy", "statistics": True}
+    for key, value in kwargs.items():
+        if key == "compression" and isinstance(value, str):
+            value = value.lower()
+            sink_kwargs[key] = "uncompressed" if value == "none" else value
+        elif key == "compression_level" and isinstance(value, int):
+            sink_kwargs[key] = value
+        elif key == "write_statistics" and isinstance(value, bool):
+            sink_kwargs["statistics"] = value
+        else:
+            return None
+    return sink_kwargs
+
+
+def _is_streamable(lf: pl.LazyFrame) -> bool:
+    """Return whether the streaming engine can execute the whole query."""
+    with warnings.catch_warnings():
+        # polars warns that common subplan elimination gets disabled
+        warnings.simplefilter("ignore")
+        plan = lf.explain(streaming=True)
+    return plan.startswith("--- PIPELINE")
+
+
+def _read_ipc_batches(
+    path: str, schema: pa.Schema, chunk_size: int
+) -> Iterator[pa.RecordBatch]:
+    import pyarrow as pa
+
+    with pa.memory_map(path) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            for offset in range(0, batch.num_rows, chunk_size):
+                chunk = batch.slice(offset, chunk_size)
+                yield pa.RecordBatch.from_arrays(
+                    [
+                        column.cast(field.type)
+                        for column, field in zip(chunk.columns, schema)
+                    ],
+                    schema=schema,
+                )
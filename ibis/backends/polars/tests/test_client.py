@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+import ibis
+
+pl = pytest.importorskip("polars")
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+pcsv = pytest.importorskip("pyarrow.csv")
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "a": np.arange(100),
+            "b": np.arange(100, dtype="int32") % 3,
+            "s": [f"s{i:d}" for i in range(100)],
+        }
+    )
+
+
+@pytest.fixture
+def con(df):
+    con = ibis.polars.connect({})
+    con.read_pandas(df, table_name="t")
+    return con
+
+
+@pytest.fixture
+def t(con):
+    return con.table("t")
+
+
+def test_to_pyarrow_batches_streaming(con, t, df, tmp_path, monkeypatch):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    expr = t.filter(t.a >= 10)
+
+    reader = con.to_pyarrow_batches(expr, chunk_size=30)
+    assert reader.schema == expr.schema().to_pyarrow()
+    # the result is spooled to disk until the reader is released
+    assert list(tmp_path.iterdir())
+
+    batches = list(reader)
+    assert [len(batch) for batch in batches] == [30, 30, 30]
+    result = pa.Table.from_batches(batches).to_pandas()
+    tm.assert_frame_equal(result, df[df.a >= 10].reset_index(drop=True))
+
+    del reader, batches
+    gc.collect()
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize(
+    "make_expr",
+    [
+        pytest.param(lambda t: t.a.sum(), id="scalar"),
+        pytest.param(
+            lambda t: t.group_by("b").aggregate(n=t.a.sum()).order_by("b"), id="agg"
+        ),
+        pytest.param(lambda t: t.s, id="column"),
+    ],
+)
+def test_to_pyarrow_batches(con, t, make_expr):
+    expr = make_expr(t)
+    reader = con.to_pyarrow_batches(expr, chunk_size=30)
+    assert reader.schema == expr.as_table().schema().to_pyarrow()
+    assert reader.read_all().equals(con.to_pyarrow(expr.as_table()))
+
+
+def test_to_pyarrow_batches_limit(con, t):
+    assert con.to_pyarrow_batches(t, limit=5).read_all().num_rows == 5
+
+
+@pytest.mark.parametrize(
+    "make_expr",
+    [
+        pytest.param(lambda t: t.filter(t.a >= 10), id="streaming"),
+        pytest.param(lambda t: t.group_by("b").aggregate(n=t.a.sum()), id="agg"),
+    ],
+)
+def test_to_parquet(con, t, tmp_path, make_expr):
+    expr = make_expr(t)
+    path = tmp_path / "out.parquet"
+    con.to_parquet(expr, path)
+    result = pq.read_table(path).to_pandas()
+    expected = expr.execute()
+    tm.assert_frame_equal(
+        result.sort_values(list(result.columns), ignore_index=True),
+        expected.sort_values(list(expected.columns), ignore_index=True),
+        check_dtype=False,
+    )
+
+
+def test_to_csv(con, t, df, tmp_path):
+    path = tmp_path / "out.csv"
+    con.to_csv(t.filter(t.a >= 10), path)
+    result = pcsv.read_csv(path).to_pandas()
+    tm.assert_frame_equal(
+        result, df[df.a >= 10].reset_index(drop=True), check_dtype=False
+    )
+
+
+@pytest.mark.parametrize(
+    "make_expr",
+    [
+        pytest.param(lambda t: t.filter(t.a >= 10), id="streaming"),
+        pytest.param(lambda t: t.group_by("b").aggregate(n=t.a.sum()), id="agg"),
+    ],
+)
+@pytest.mark.parametrize(
+    ("kwargs", "version", "compression"),
+    [
+        pytest.param({}, "2.6", "SNAPPY", id="default"),
+        pytest.param({"compression": "ZSTD"}, "2.6", "ZSTD", id="translated"),
+        pytest.param({"version": "1.0"}, "1.0", "SNAPPY", id="pyarrow_only"),
+    ],
+)
+def test_to_parquet_writer_kwargs(
+    con, t, tmp_path, make_expr, kwargs, version, compression
+):
+    path = tmp_path / "out.parquet"
+    con.to_parquet(make_expr(t), path, **kwargs)
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.format_version == version
+    assert metadata.row_group(0).column(0).compression == compression
+
+
+def test_to_parquet_sink_casts_to_schema(con, t, tmp_path, mocker):
+    sink = mocker.spy(pl.LazyFrame, "sink_parquet")
+    # polars computes the sum as int32
+    expr = t.mutate(c=t.b + t.b)
+    path = tmp_path / "out.parquet"
+
+    con.to_parquet(expr, path)
+
+    sink.assert_called_once()
+    assert ibis.Schema.from_pyarrow(pq.read_schema(path)) == expr.schema()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 from typing import TYPE_CHECKING, Iterable, Literal
 
 import sqlalchemy as sa
@@ -13,8 +14,22 @@ from ibis.backends.postgres.datatypes import _get_type
 from ibis.backends.postgres.udf import udf as _udf
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     import ibis.expr.datatypes as dt
 
+# column types whose values round trip through COPY's CSV format
+_COPY_TYPES = (
+    sa.Boolean,
+    sa.Integer,
+    sa.Float,
+    sa.Numeric,
+    sa.String,
+    sa.Date,
+    sa.DateTime,
+    sa.Time,
+)
+
 
 class Backend(BaseAlchemyBackend):
     name = "postgres"
@@ -210,3 +225,54 @@ ORDER BY attnum"""
     ) -> str:
         yield f"DROP VIEW IF EXISTS {name}"
         yield f"CREATE TEMPORARY VIEW {name} AS {definition}"
+
+    def _bulk_insert(
+        self, con: sa.engine.Connection, table: sa.Table, df: pd.DataFrame
+    ) -> None:
+        r"""Insert the rows of `df` into `table` with `COPY ... FROM STDIN`.
+
+        Frames with columns of types that `COPY` can't parse from CSV, or with
+        strings spelled `\N`, are inserted with the default batched insert.
+
+        Missing values are written as `\N`, so floating point `NaN`s are
+        loaded as `NULL` rather than as the `'NaN'` float value.
+        """
+        columns = table.columns
+        if not all(
+            name in columns and isinstance(columns[name].type, _COPY_TYPES)
+            for name in df.columns
+        ):
+            return super()._bulk_insert(con, table, df)
+
+        # COPY parses its input with the column's type, so integral floats
+        # produced by missing values have to be turned back into integers
+        try:
+            df = df.astype(
+                {
+                    name: "Int64"
+                    for name, dtype in df.dtypes.items()
+                    if dtype.kind == "f" and isinstance(columns[name].type, sa.Integer)
+                }
+            )
+        except (TypeError, ValueError):
+            return super()._bulk_insert(con, table, df)
+
+        # `\N` marks missing values, so a string spelled that way can't be
+        # told apart from NULL
+        strings = df.select_dtypes(include=["object", "string"])
+        if strings.isin([r"\N"]).any(axis=None):
+            return super()._bulk_insert(con, table, df)
+
+        buf = io.StringIO()
+        df.to_csv(buf, index=False, header=False, na_rep=r"\N")
+        buf.seek(0)
+
+        name = ".".join(map(self._quote, filter(None, (table.schema, table.name))))
+        cols = ", ".join(map(self._quote, df.columns))
+        query = f"COPY {name} ({cols}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+
+        cursor = con.connection.cursor()
+        try:
+            cursor.copy_expert(query, buf)
+        finally:
+            cursor.close()
@@ -211,3 +211,57 @@ def test_get_schema_from_query(con, pg_type, expected_type):
 def test_unknown_column_type(con, col):
     awards_players = con.table("awards_players_special_types")
     assert awards_players[col].type().is_unknown()
+
+
+@pytest.fixture
+def bulk_insert_fallback(mocker):
+    from ibis.backends.base.sql.alchemy import BaseAlchemyBackend
+
+    return mocker.spy(BaseAlchemyBackend, "_bulk_insert")
+
+
+def test_insert_copy_nullable_integers(con, temp_table, bulk_insert_fallback):
+    con.create_table(temp_table, schema=ibis.schema(dict(a="int64", b="string")))
+    # missing values turn the integer column into floats, which COPY only
+    # parses once they are converted back to (nullable) integers
+    df = pd.DataFrame({"a": [1, None, 3], "b": ["x", "y", "z"]})
+    assert df.a.dtype == np.float64
+
+    con.insert(temp_table, df)
+
+    bulk_insert_fallback.assert_not_called()
+    result = con.table(temp_table).execute().sort_values("b", ignore_index=True)
+    assert result.a.isna().tolist() == [False, True, False]
+    assert result.a.dropna().tolist() == [1, 3]
+
+
+def test_insert_copy_nan_is_null(con, temp_table, bulk_insert_fallback):
+    con.create_table(temp_table, schema=ibis.schema(dict(x="float64")))
+
+    con.insert(temp_table, pd.DataFrame({"x": [1.5, np.nan]}))
+
+    bulk_insert_fallback.assert_not_called()
+    t = con.table(temp_table)
+    # `NaN` is written as `\N` and loaded as `NULL`
+    assert t.filter(t.x.isnull()).count().execute() == 1
+    assert t.filter(t.x.isnan()).count().execute() == 0
+
+
+def test_insert_copy_null_marker_string(con, temp_table, bulk_insert_fallback):
+    con.create_table(temp_table, schema=ibis.schema(dict(s="string")))
+
+    con.insert(temp_table, pd.DataFrame({"s": [r"\N", "x"]}))
+
+    bulk_insert_fallback.assert_called_once()
+    result = con.table(temp_table).s.execute()
+    assert sorted(result) == [r"\N", "x"]
+
+
+def test_insert_copy_unsupported_type(con, temp_table, bulk_insert_fallback):
+    con.create_table(temp_table, schema=ibis.schema(dict(a="array<int64>")))
+
+    con.insert(temp_table, pd.DataFrame({"a": [[1, 2], [3]]}))
+
+    bulk_insert_fallback.assert_called_once()
+    result = con.table(temp_table).a.execute()
+    assert sorted(map(list, result)) == [[1, 2], [3]]
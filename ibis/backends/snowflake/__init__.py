@@ -21,11 +21,8 @@ from ibis.backends.base.sql.alchemy import (
 )
 
 if TYPE_CHECKING:
-    import pandas as pd
     import pyarrow as pa
 
-    import ibis.expr.schema as sch
-
 
 @contextlib.contextmanager
 def _handle_pyarrow_warning(*, action: str):
@@ -276,8 +273,7 @@ $$ {defn["source"]} $$"""
         import pyarrow as pa
 
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        _, sql = self._compile_query(expr, limit=limit, params=params)
         with self.begin() as con:
             con.exec_driver_sql(
                 f"ALTER SESSION SET {PARAMETER_PYTHON_CONNECTOR_QUERY_RESULT_FORMAT} = 'ARROW'"
@@ -300,10 +296,12 @@ $$ {defn["source"]} $$"""
             return res[expr.get_name()][0]
         return res
 
-    def fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
+    def _fetch_arrow_table(self, cursor) -> pa.Table | None:
         if _NATIVE_ARROW and self._default_connector_format == "ARROW":
-            return cursor.cursor.fetch_pandas_all()
-        return super().fetch_from_cursor(cursor, schema)
+            # `None` is returned for empty results, in which case the
+            # (exhausted) cursor is used to construct an empty frame
+            return cursor.cursor.fetch_arrow_all()
+        return None
 
     def to_pyarrow_batches(
         self,
@@ -322,8 +320,7 @@ $$ {defn["source"]} $$"""
         import pyarrow as pa
 
         self._run_pre_execute_hooks(expr)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        _, sql = self._compile_query(expr, limit=limit, params=params)
         target_schema = expr.as_table().schema().to_pyarrow()
         target_columns = target_schema.names
 
@@ -9,7 +9,7 @@ import ibis
 import ibis.expr.types as ir
 from ibis import config
 
-pytest.importorskip("sqlalchemy")
+sa = pytest.importorskip("sqlalchemy")
 
 
 def test_table(con):
@@ -109,3 +109,182 @@ def test_table_inequality(dbpath):
 
     assert t.op() != s.op()
     assert not t.equals(s)
+
+
+def test_compile_cache():
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", schema=ibis.schema(dict(a="int64")))
+    con.insert("t", [{"a": 1}, {"a": 2}, {"a": 3}])
+    param = ibis.param("int64")
+    expr = t.filter(t.a > param).a.sum()
+
+    with config.option_context("sql.compile_cache_size", 8):
+        assert con.execute(expr, params={param: 1}) == 5
+        assert con.execute(expr, params={param: 1}) == 5
+        assert con.execute(expr, params={param: 2}) == 3
+
+        info = con.compile_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+        assert len(con.execute(t, limit=1)) == 1
+        assert len(con.execute(t, limit=2)) == 2
+        assert con.compile_cache_info().currsize == 4
+
+    # the cache is opt-in
+    con.execute(expr, params={param: 1})
+    assert con.compile_cache_info().hits == 1
+
+
+def test_compile_cache_bytes():
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", schema=ibis.schema(dict(a="int64", b="string")))
+    exprs = [t.filter(t.a > i)[["a", "b"]] for i in range(4)]
+    length = len(str(con.compile(exprs[0])))
+
+    with config.option_context("sql.compile_cache_size", 8):
+        for expr in exprs:
+            con.execute(expr)
+        info = con.compile_cache_info()
+        assert info.currsize == 4
+        # entries are sized by their rendered SQL
+        assert info.currbytes > 4 * length
+
+        maxbytes = info.currbytes // 2
+        with config.option_context("sql.compile_cache_bytes", maxbytes):
+            con.execute(exprs[3])
+            info = con.compile_cache_info()
+            assert 0 < info.currsize < 4
+            assert info.currbytes <= maxbytes
+
+
+def test_bind_params():
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", schema=ibis.schema(dict(a="int64", b="string")))
+    con.insert("t", [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}])
+    lower = ibis.param("int64")
+    excluded = ibis.param("string")
+    expr = t.filter([t.a > lower, t.b != excluded]).a.sum()
+
+    with config.option_context("sql.bind_params", True):
+        sql = str(con.compile(expr, params={lower: 1, excluded: "z"}))
+        assert ":ibis_param" in sql
+
+        with config.option_context("sql.compile_cache_size", 8):
+            assert con.execute(expr, params={lower: 1, excluded: "z"}) == 2
+            assert con.execute(expr, params={lower: 0, excluded: "y"}) == 4
+
+            # one statement is shared by both calls
+            info = con.compile_cache_info()
+            assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    sql = str(con.compile(expr, params={lower: 1, excluded: "z"}))
+    assert ":ibis_param" not in sql
+
+
+def test_bind_params_compile_cache():
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", schema=ibis.schema(dict(a="int64")))
+    con.insert("t", [{"a": 1}, {"a": 2}, {"a": 3}])
+    lower = ibis.param("int64")
+    expr = t.filter(t.a > lower).a.sum()
+
+    with config.option_context("sql.compile_cache_size", 8):
+        # the statement with the inlined value isn't reused once binding is on
+        assert con.execute(expr, params={lower: 1}) == 5
+        with config.option_context("sql.bind_params", True):
+            assert con.execute(expr, params={lower: 2}) == 3
+            assert con.execute(expr, params={lower: 0}) == 6
+        assert con.compile_cache_info().currsize == 2
+
+
+def test_schema_cache(mocker):
+    con = ibis.sqlite.connect()
+    con.create_table("t", schema=ibis.schema(dict(a="int64")))
+    reflect = mocker.spy(con, "_reflect_sqla_table")
+
+    with config.option_context("sql.schema_cache_ttl", 60):
+        assert con.table("t").schema() == ibis.schema(dict(a="int64"))
+        con.table("t")
+        assert reflect.call_count == 1
+
+        # replacing the table through ibis invalidates the cached reflection
+        con.create_table("t", schema=ibis.schema(dict(b="string")), overwrite=True)
+        assert con.table("t").schema() == ibis.schema(dict(b="string"))
+        assert reflect.call_count == 2
+
+        con.drop_table("t")
+        with pytest.raises(sa.exc.NoSuchTableError):
+            con.table("t")
+
+    # the cache is opt-in
+    con.create_table("t", schema=ibis.schema(dict(a="int64")))
+    reflect.reset_mock()
+    con.table("t")
+    con.table("t")
+    assert reflect.call_count == 2
+
+
+def test_memtable_temp_table(mocker):
+    pd = pytest.importorskip("pandas")
+
+    con = ibis.sqlite.connect()
+    df = pd.DataFrame({"a": np.arange(50), "b": [f"s{i:d}" for i in range(50)]})
+    small = ibis.memtable(df.head(3))
+    large = ibis.memtable(df)
+    bulk_insert = mocker.spy(con, "_bulk_insert")
+
+    with config.option_context("sql.memtable_inline_limit", 10):
+        # only the large table is loaded into a temporary table, when executing
+        expr = large.join(small, "a").select(large.a)
+        assert sorted(con.execute(expr).a) == [0, 1, 2]
+        result = con.execute(large.filter(large.a >= 40).b)
+        assert result.tolist() == [f"s{i:d}" for i in range(40, 50)]
+        tm.assert_frame_equal(con.execute(large), df)
+
+        # the table is only loaded once
+        assert bulk_insert.call_count == 1
+
+        con.create_table("t", large)
+        assert con.table("t").count().execute() == 50
+
+        # the table is only referenced by statements compiled for execution
+        assert "UNION ALL" in str(con.compile(large))
+
+    with config.option_context("sql.memtable_inline_limit", None):
+        assert "UNION ALL" in str(con.compile(ibis.memtable(df)))
+
+
+@pytest.mark.parametrize(
+    ("dialect", "inlined"), [("sqlite", "UNION ALL"), ("postgres", "VALUES")]
+)
+def test_large_memtable_to_sql(dialect, inlined):
+    pd = pytest.importorskip("pandas")
+
+    df = pd.DataFrame({"a": np.arange(50), "b": [f"s{i:d}" for i in range(50)]})
+    with config.option_context("sql.memtable_inline_limit", 10):
+        sql = str(ibis.to_sql(ibis.memtable(df), dialect=dialect))
+    assert inlined in sql
+    assert "'s49'" in sql
+
+
+def test_large_memtable_view(tmp_path):
+    pd = pytest.importorskip("pandas")
+
+    path = tmp_path / "test.db"
+    con = ibis.sqlite.connect(path)
+    df = pd.DataFrame({"a": np.arange(50), "b": [f"s{i:d}" for i in range(50)]})
+    large = ibis.memtable(df)
+
+    with config.option_context("sql.memtable_inline_limit", 10):
+        # a temporary table holding the data exists once executed
+        assert con.execute(large.count()) == 50
+        view = con.create_view("v", large.filter(large.a >= 40))
+        assert view.count().execute() == 10
+
+        con.create_table("t", schema=large.schema())
+        con.insert("t", large[large.a < 5])
+        assert con.table("t").count().execute() == 5
+
+    # the data of the view outlives the session
+    con = ibis.sqlite.connect(path)
+    assert con.table("v").b.execute().tolist() == [f"s{i:d}" for i in range(40, 50)]
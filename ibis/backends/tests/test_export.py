@@ -24,7 +24,6 @@ limit = [
                 [
                     # limit not implemented for pandas backend execution
                     "dask",
-                    "datafusion",
                     "impala",
                     "pandas",
                     "pyspark",
@@ -139,7 +138,7 @@ def test_column_to_pyarrow_table_schema(awards_players):
     assert array.type == pa.string() or array.type == pa.large_string()
 
 
-@pytest.mark.notimpl(["pandas", "dask", "impala", "pyspark", "datafusion", "druid"])
+@pytest.mark.notimpl(["pandas", "dask", "impala", "pyspark", "druid"])
 @pytest.mark.notyet(
     ["clickhouse"],
     raises=AssertionError,
@@ -154,7 +153,7 @@ def test_table_pyarrow_batch_chunk_size(awards_players):
     util.consume(batch_reader)
 
 
-@pytest.mark.notimpl(["pandas", "dask", "impala", "pyspark", "datafusion"])
+@pytest.mark.notimpl(["pandas", "dask", "impala", "pyspark"])
 @pytest.mark.notyet(
     ["clickhouse"],
     raises=AssertionError,
@@ -171,7 +170,7 @@ def test_column_pyarrow_batch_chunk_size(awards_players):
     util.consume(batch_reader)
 
 
-@pytest.mark.notimpl(["pandas", "dask", "impala", "pyspark", "datafusion", "druid"])
+@pytest.mark.notimpl(["pandas", "dask", "impala", "pyspark", "druid"])
 @pytest.mark.broken(
     ["sqlite"],
     raises=pa.ArrowException,
@@ -407,11 +407,9 @@ def test_register_garbage(con, monkeypatch):
     [
         "bigquery",
         "clickhouse",
-        "dask",
         "impala",
         "mssql",
         "mysql",
-        "pandas",
         "postgres",
         "snowflake",
         "sqlite",
@@ -461,7 +459,6 @@ def test_read_parquet(
         "impala",
         "mssql",
         "mysql",
-        "pandas",
         "postgres",
         "snowflake",
         "sqlite",
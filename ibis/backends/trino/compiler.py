@@ -50,4 +50,5 @@ def _rewrite_string_contains(op):
 
 class TrinoSQLCompiler(AlchemyCompiler):
     cheap_in_memory_tables = False
+    supports_temp_in_memory_tables = False
     translator_class = TrinoSQLExprTranslator
@@ -1,34 +1,87 @@
 from __future__ import annotations
 
+import contextlib
 import functools
+import sys
+import threading
 import weakref
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict, namedtuple
 from collections.abc import Iterator
 from typing import Any, Callable, MutableMapping
 
 from bidict import bidict
 
-from ibis.common.collections import FrozenDict
 from ibis.common.exceptions import IbisError
 
 
-def memoize(func: Callable) -> Callable:
-    """Memoize a function."""
-    cache = {}
+def memoize(
+    func: Callable | None = None,
+    /,
+    *,
+    maxsize: int | None = None,
+    weak: bool = False,
+) -> Callable:
+    """Memoize a function.
+
+    Can be used as a plain decorator or called with options. The decorated
+    function exposes `cache_info()` and `cache_clear()` like the functions
+    decorated with `functools.lru_cache`.
+
+    Parameters
+    ----------
+    func
+        Function to memoize.
+    maxsize
+        Maximum number of results to keep, the least recently used ones are
+        evicted first. `None` means unbounded.
+    weak
+        Only hold a weak reference to the first argument, its results are
+        dropped once it gets garbage collected. Arguments not supporting weak
+        references are held strongly.
+    """
+    if func is None:
+        return functools.partial(memoize, maxsize=maxsize, weak=weak)
+
+    cache = LRUCache(maxsize=maxsize, sizeof=_zero_size)
+
+    def collect(_):
+        # remove the entries whose first argument got garbage collected
+        for key in cache:
+            if isinstance(ref := key[0], weakref.ref) and ref() is None:
+                with contextlib.suppress(KeyError):
+                    del cache[key]
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        key = (args, FrozenDict(kwargs))
+        key = args if not kwargs else (*args, _KWARGS_MARK, *kwargs.items())
+        ref = None
+        if weak and args:
+            # arguments not supporting weak references are held strongly
+            with contextlib.suppress(TypeError):
+                ref = weakref.ref(args[0])
+                key = (ref, *key[1:])
         try:
             return cache[key]
         except KeyError:
             result = func(*args, **kwargs)
+            if ref is not None:
+                # only the stored reference needs the cleanup callback
+                key = (weakref.ref(args[0], collect), *key[1:])
             cache[key] = result
             return result
 
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
     return wrapper
 
 
+def _zero_size(_):
+    return 0
+
+
+_KWARGS_MARK = object()
+
+
 class WeakCache(MutableMapping):
     __slots__ = ('_data',)
 
@@ -73,6 +126,126 @@ class WeakCache(MutableMapping):
         return f"{self.__class__.__name__}({self._data})"
 
 
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "maxbytes", "currbytes"]
+)
+
+
+class LRUCache(MutableMapping):
+    """A bounded mapping evicting the least recently used entries.
+
+    The cache is bounded by the number of entries and, optionally, by the
+    total size of the stored values as reported by `sizeof`. Lookups through
+    `get` and `[]` are counted as hits or misses and reported by `info`.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of entries, `None` means unbounded.
+    maxbytes
+        Maximum total size of the stored values, `None` means unbounded.
+    sizeof
+        Function returning the size of a value, defaults to `sys.getsizeof`.
+    """
+
+    __slots__ = (
+        '_data',
+        '_sizes',
+        '_lock',
+        'maxsize',
+        'maxbytes',
+        'sizeof',
+        'hits',
+        'misses',
+        'currbytes',
+    )
+
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        maxbytes: int | None = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ) -> None:
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.currbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._data))
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value) -> None:
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = value
+            self._sizes[key] = size
+            self.currbytes += size
+            self.evict()
+
+    def __delitem__(self, key) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        del self._data[key]
+        self.currbytes -= self._sizes.pop(key)
+
+    def evict(self) -> None:
+        """Drop the least recently used entries until the bounds are met."""
+        with self._lock:
+            maxsize, maxbytes = self.maxsize, self.maxbytes
+            while self._data and (
+                (maxsize is not None and len(self._data) > maxsize)
+                or (maxbytes is not None and self.currbytes > maxbytes)
+            ):
+                self._remove(next(iter(self._data)))
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.hits = self.misses = self.currbytes = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._data),
+            maxbytes=self.maxbytes,
+            currbytes=self.currbytes,
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.info()})"
+
+
 class RefCountedCache:
     """A cache with reference-counted keys.
 
@@ -1,6 +1,7 @@
 """Various traversal utilities for the expression graph."""
 from __future__ import annotations
 
+import weakref
 from abc import abstractmethod
 from collections import deque
 from collections.abc import Hashable, Iterable, Iterator, Mapping
@@ -30,7 +31,7 @@ class Node(Hashable):
 
     def map(self, fn, filter=None):
         results = {}
-        for node in Graph.from_bfs(self, filter=filter).toposort():
+        for node in _toposorted(self, filter or Node):
             kwargs = dict(zip(node.__argnames__, node.__args__))
             kwargs = recursive_get(kwargs, results)
             results[node] = fn(node, results, **kwargs)
@@ -60,6 +61,31 @@ class Node(Hashable):
         return self.substitute(fn, filter=filter)
 
 
+# topologically sorted dependencies of already traversed nodes keyed by the
+# root node and the traversal filter; nodes are immutable so the order can be
+# reused by subsequent traversals of the same (sub)graph
+_dependencies = weakref.WeakKeyDictionary()
+
+
+def _toposorted(root: Node, filter) -> tuple[Node, ...]:
+    """Return the nodes reachable from `root` in topological order."""
+    try:
+        orders = _dependencies[root]
+    except KeyError:
+        orders = _dependencies.setdefault(root, {})
+    except TypeError:
+        # the node doesn't support weak references, don't cache anything
+        orders = {}
+    try:
+        deps = orders[filter]
+    except KeyError:
+        *deps, _ = Graph.from_bfs(root, filter=filter).toposort()
+        # the root is excluded from the cached value, otherwise it would be
+        # kept alive by the cache itself
+        deps = orders[filter] = tuple(deps)
+    return (*deps, root)
+
+
 def _flatten_collections(node, filter=Node):
     """Flatten collections of nodes into a single iterator.
 
@@ -221,6 +221,25 @@ class Comparable(Base):
 class Concrete(Immutable, Comparable, Annotable):
     """Opinionated base class for immutable data classes."""
 
+    # weak-valued table of the interned instances keyed by class and arguments
+    __interned__ = WeakValueDictionary()
+    __interning__ = False
+
+    @classmethod
+    def __create__(cls, *args, **kwargs) -> Concrete:
+        instance = super().__create__(*args, **kwargs)
+        return instance.__intern__() if Concrete.__interning__ else instance
+
+    @classmethod
+    def __recreate__(cls, kwargs) -> Concrete:
+        instance = super().__recreate__(kwargs)
+        return instance.__intern__() if Concrete.__interning__ else instance
+
+    def __intern__(self) -> Concrete:
+        """Return the interned instance structurally equal to this one."""
+        key = (self.__class__, self.__args__)
+        return self.__interned__.setdefault(key, self)
+
     @attribute.default
     def __args__(self):
         return tuple(getattr(self, name) for name in self.__argnames__)
@@ -253,3 +272,27 @@ class Concrete(Immutable, Comparable, Annotable):
         kwargs = dict(zip(self.__argnames__, self.__args__))
         kwargs.update(overrides)
         return self.__recreate__(kwargs)
+
+
+@contextlib.contextmanager
+def interning(enabled: bool = True):
+    """Intern the `Concrete` instances constructed within the block.
+
+    While interning is enabled, constructing an instance structurally equal to
+    a live instance created under interning returns the existing object, so
+    equal trees share their nodes and compare by identity. Arguments comparing
+    equal are considered interchangeable, e.g. tables of two equal backends
+    resolve to the same node. The interning table only holds weak references
+    to the instances.
+
+    Parameters
+    ----------
+    enabled
+        Whether to enable or disable interning within the block.
+    """
+    previous = Concrete.__interning__
+    Concrete.__interning__ = enabled
+    try:
+        yield
+    finally:
+        Concrete.__interning__ = previous
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import gc
+
+import pytest
+
+from ibis.common.caching import LRUCache, memoize
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+
+    cache["c"] = 3
+    assert list(cache) == ["a", "c"]
+    assert "b" not in cache
+
+
+def test_lru_cache_maxbytes():
+    cache = LRUCache(maxsize=None, maxbytes=10, sizeof=len)
+    cache["a"] = "xxxx"
+    cache["b"] = "yyyy"
+    assert cache.currbytes == 8
+
+    cache["c"] = "zzzz"
+    assert list(cache) == ["b", "c"]
+    assert cache.currbytes == 8
+
+    # values larger than the limit are not retained
+    cache["d"] = "x" * 11
+    assert not cache
+    assert cache.currbytes == 0
+
+
+def test_lru_cache_info():
+    cache = LRUCache(maxsize=4)
+    cache["a"] = 1
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    with pytest.raises(KeyError):
+        cache["c"]
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.maxsize == 4
+    assert info.currsize == 1
+
+    cache.clear()
+    assert cache.info() == (0, 0, 4, 0, None, 0)
+
+
+def test_lru_cache_overwrite_and_delete():
+    cache = LRUCache(sizeof=lambda _: 1)
+    cache["a"] = 1
+    cache["a"] = 2
+    assert len(cache) == 1
+    assert cache.currbytes == 1
+    assert cache["a"] == 2
+
+    del cache["a"]
+    assert not cache
+    assert cache.currbytes == 0
+
+
+def test_memoize():
+    calls = []
+
+    @memoize
+    def add(a, b=0):
+        calls.append((a, b))
+        return a + b
+
+    assert add(1) == 1
+    assert add(1) == 1
+    assert add(1, b=2) == 3
+    assert add(1, b=2) == 3
+    assert calls == [(1, 0), (1, 2)]
+
+    info = add.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+    add.cache_clear()
+    assert add.cache_info().currsize == 0
+
+
+def test_memoize_maxsize():
+    @memoize(maxsize=2)
+    def double(x):
+        return x * 2
+
+    for x in (1, 2, 1, 3):
+        double(x)
+
+    info = double.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.maxsize) == (1, 3, 2, 2)
+
+    # 2 was the least recently used argument
+    double(2)
+    assert double.cache_info().misses == 4
+
+
+def test_memoize_weak():
+    class Key:
+        pass
+
+    @memoize(weak=True)
+    def name(obj, suffix=""):
+        return type(obj).__name__ + suffix
+
+    key = Key()
+    assert name(key) == "Key"
+    assert name(key, suffix="!") == "Key!"
+    assert name(key) == "Key"
+    assert name.cache_info().currsize == 2
+
+    # arguments which can't be weakly referenced are cached as usual
+    assert name(1) == "int"
+    assert name(1) == "int"
+    assert name.cache_info().currsize == 3
+
+    del key
+    gc.collect()
+    assert name.cache_info().currsize == 1
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import weakref
+
 import pytest
 
 from ibis.common.graph import Graph, Node, bfs, dfs, toposort
@@ -180,3 +182,23 @@ def test_concrete_with_traversable_children():
 
     copied = node.copy(arguments=(T, F))
     assert copied == All((T, F), strict=False)
+
+
+def test_map_reuses_traversal_order(mocker):
+    leaf = MyNode(name="leaf", children=())
+    root = MyNode(name="root", children=(leaf,))
+
+    spy = mocker.spy(Graph, "from_bfs")
+    assert root.find(MyNode) == {root, leaf}
+    assert root.find(MyNode) == {root, leaf}
+    assert spy.call_count == 1
+
+
+def test_map_traversal_order_cache_is_weak():
+    leaf = MyNode(name="leaf", children=())
+    root = MyNode(name="root", children=(leaf,))
+    assert root.find(MyNode) == {root, leaf}
+
+    ref = weakref.ref(root)
+    del root
+    assert ref() is None
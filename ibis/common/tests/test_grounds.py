@@ -24,6 +24,7 @@ from ibis.common.grounds import (
     Concrete,
     Immutable,
     Singleton,
+    interning,
 )
 from ibis.common.validators import Coercible, Validator, instance_of, option, validator
 from ibis.tests.util import assert_pickle_roundtrip
@@ -1061,7 +1062,7 @@ def test_concrete():
         object,
     )
 
-    assert BetweenWithCalculated.__create__.__func__ is Annotable.__create__.__func__
+    assert BetweenWithCalculated.__create__.__func__ is Concrete.__create__.__func__
     assert BetweenWithCalculated.__eq__ is Comparable.__eq__
     assert BetweenWithCalculated.__argnames__ == ("value", "lower", "upper")
 
@@ -1115,6 +1116,27 @@ def test_composition_of_concrete_and_singleton():
     assert SingConc(3) is obj2
 
 
+def test_concrete_interning():
+    obj = BetweenWithCalculated(10, lower=5, upper=15)
+    assert BetweenWithCalculated(10, lower=5, upper=15) is not obj
+
+    with interning():
+        one = BetweenWithCalculated(10, lower=5, upper=15)
+        assert BetweenWithCalculated(10, lower=5, upper=15) is one
+        assert BetweenWithCalculated(10, lower=5, upper=16) is not one
+        assert one.copy() is one
+        assert pickle.loads(pickle.dumps(one)) is one
+
+        with interning(False):
+            assert BetweenWithCalculated(10, lower=5, upper=15) is not one
+
+    # the interning table doesn't keep instances alive
+    key = (BetweenWithCalculated, (10, 5, 15))
+    assert Concrete.__interned__[key] is one
+    del one
+    assert key not in Concrete.__interned__
+
+
 def test_init_subclass_keyword_arguments():
     class Test(Annotable):
         def __init_subclass__(cls, **kwargs):
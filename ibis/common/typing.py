@@ -21,7 +21,7 @@ T = TypeVar("T")
 U = TypeVar("U")
 
 
-@memoize
+@memoize(maxsize=1024, weak=True)
 def get_type_hints(
     obj: Any,
     include_extras: bool = True,
@@ -62,7 +62,7 @@ def get_type_hints(
     return hints
 
 
-@memoize
+@memoize(maxsize=1024, weak=True)
 def get_type_params(obj: Any) -> dict[str, Any]:
     """Get type parameters for a generic class.
 
@@ -105,7 +105,7 @@ def get_type_params(obj: Any) -> dict[str, Any]:
     return result
 
 
-@memoize
+@memoize(maxsize=1024, weak=True)
 def get_bound_typevars(obj: Any) -> dict[str, Any]:
     """Get type variables bound to concrete types for a generic class.
 
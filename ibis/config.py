@@ -64,10 +64,43 @@ class SQL(Config):
         explicit limit. [`None`][None] means no limit.
     default_dialect : str
         Dialect to use for printing SQL when the backend cannot be determined.
+    compile_cache_size : int | None
+        Maximum number of compiled queries each SQL backend keeps around for
+        reuse. [`None`][None] disables the cache.
+    compile_cache_bytes : int | None
+        Maximum total size in bytes of the compiled queries cached by each SQL
+        backend. [`None`][None] means no size limit.
+    bind_params : bool
+        Compile the values of scalar parameters created with `ibis.param` to
+        driver bind parameters instead of inlined literals in SQLAlchemy-based
+        backends, so that a compiled statement can be reused across calls
+        with different parameter values. Only boolean, integer, floating
+        point, string, date and timestamp parameters are bound.
+    schema_cache_ttl : int | None
+        Number of seconds SQLAlchemy-based backends keep reflected table
+        metadata around before reflecting the table again. Tables created,
+        dropped or replaced through ibis are invalidated immediately; changes
+        made outside of ibis are only picked up once the entry expires.
+        [`None`][None] disables the cache.
+    insert_batch_size : int | None
+        Number of rows sent per statement when SQLAlchemy-based backends
+        without a native bulk loading mechanism insert a DataFrame.
+        [`None`][None] sends all rows at once.
+    memtable_inline_limit : int | None
+        Maximum number of rows of an in-memory table that SQLAlchemy-based
+        backends without native in-memory tables compile into queries as
+        literal rows. Larger tables are bulk loaded into a temporary table
+        before executing. [`None`][None] always compiles them to literals.
     """
 
     default_limit: Optional[PosInt] = None
     default_dialect: str = "duckdb"
+    compile_cache_size: Optional[PosInt] = None
+    compile_cache_bytes: Optional[PosInt] = None
+    bind_params: bool = False
+    schema_cache_ttl: Optional[PosInt] = None
+    insert_batch_size: Optional[PosInt] = 10_000
+    memtable_inline_limit: Optional[PosInt] = 1_000
 
 
 class Interactive(Config):
@@ -156,6 +189,11 @@ class Options(Config):
         Pandas specific options.
     pyspark : Config | None
         PySpark specific options.
+    memtable_fingerprint : bool
+        Name the tables created by [`memtable`][ibis.memtable] without an
+        explicit name after a digest of their data and schema, so that
+        backends register tables holding the same data only once. Computing
+        the digest reads all of the data.
     """
 
     interactive: bool = False
@@ -171,6 +209,7 @@ class Options(Config):
     impala: Optional[Config] = None
     pandas: Optional[Config] = None
     pyspark: Optional[Config] = None
+    memtable_fingerprint: bool = False
 
 
 def _default_backend() -> Any:
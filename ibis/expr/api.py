@@ -21,6 +21,7 @@ from ibis.backends.base import BaseBackend, connect
 from ibis.common.dispatch import lazy_singledispatch
 from ibis.common.exceptions import IbisInputError
 from ibis.common.temporal import normalize_datetime, normalize_timezone
+from ibis.config import options
 from ibis.expr.decompile import decompile
 from ibis.expr.deferred import Deferred
 from ibis.expr.schema import Schema
@@ -43,6 +44,7 @@ if TYPE_CHECKING:
     import pyarrow as pa
 
     from ibis.common.typing import SupportsSchema
+    from ibis.expr.operations.relations import TableProxy
 
 __all__ = (
     'aggregate',
@@ -408,10 +410,12 @@ def _memtable_from_pyarrow_table(
     if columns is not None:
         assert schema is None, "if `columns` is not `None` then `schema` must be `None`"
         schema = sch.Schema(dict(zip(columns, sch.infer(data).values())))
+    schema = sch.infer(data) if schema is None else sch.schema(schema)
+    proxy = PyArrowTableProxy(data)
     return ops.InMemoryTable(
-        name=name if name is not None else util.gen_name("pyarrow_memtable"),
-        schema=sch.infer(data) if schema is None else schema,
-        data=PyArrowTableProxy(data),
+        name=_memtable_name(name, "pyarrow_memtable", proxy, schema),
+        schema=schema,
+        data=proxy,
     ).to_expr()
 
 
@@ -436,14 +440,26 @@ def _memtable_from_dataframe(
             (f"col{i:d}" for i in range(len(cols))),
         )
         df = df.rename(columns=dict(zip(cols, newcols)))
+    schema = sch.infer(df) if schema is None else sch.schema(schema)
+    proxy = PandasDataFrameProxy(df)
     op = ops.InMemoryTable(
-        name=name if name is not None else util.gen_name("pandas_memtable"),
-        schema=sch.infer(df) if schema is None else schema,
-        data=PandasDataFrameProxy(df),
+        name=_memtable_name(name, "pandas_memtable", proxy, schema),
+        schema=schema,
+        data=proxy,
     )
     return op.to_expr()
 
 
+def _memtable_name(
+    name: str | None, namespace: str, proxy: TableProxy, schema: sch.Schema
+) -> str:
+    if name is not None:
+        return name
+    if options.memtable_fingerprint and (fingerprint := proxy.fingerprint(schema)):
+        return f"_ibis_{namespace}_{fingerprint}"
+    return util.gen_name(namespace)
+
+
 def _deferred_method_call(expr, method_name):
     method = operator.methodcaller(method_name)
     if isinstance(expr, str):
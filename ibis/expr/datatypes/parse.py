@@ -26,17 +26,54 @@ from ibis.common.parsing import (
     spaceless_string,
 )
 
+# spellings of types without parameters that don't need to go through the
+# parser, must produce the same results as the grammar below
+_PRIMITIVES = {
+    **{
+        name: getattr(dt, name)
+        for name in (
+            "int8",
+            "int16",
+            "int32",
+            "int64",
+            "uint8",
+            "uint16",
+            "uint32",
+            "uint64",
+            "float16",
+            "float32",
+            "float64",
+            "string",
+            "binary",
+            "timestamp",
+            "time",
+            "date",
+            "null",
+            "boolean",
+            "json",
+            "uuid",
+            "macaddr",
+            "inet",
+        )
+    },
+    "bool": dt.boolean,
+    "halffloat": dt.float16,
+    "double": dt.float64,
+    "float": dt.float64,
+    "bytes": dt.binary,
+    "int": dt.int64,
+    "str": dt.string,
+}
+
 
 @public
-@functools.lru_cache(maxsize=100)
 def parse(
     text: str, default_decimal_parameters: tuple[int | None, int | None] = (None, None)
 ) -> dt.DataType:
     """Parse a type from a [`str`][str] `text`.
 
-    The default `maxsize` parameter for caching is chosen to cache the most
-    commonly used types--there are about 30--along with some capacity for less
-    common but repeatedly-used complex types.
+    Primitive type names are looked up directly, other types are parsed once
+    and cached, keeping up to 1024 of the most recently used ones.
 
     Parameters
     ----------
@@ -62,6 +99,22 @@ def parse(
     >>> ty == dt.Array(dt.int64)
     True
     """
+    try:
+        return _PRIMITIVES[text]
+    except KeyError:
+        return _parse(text, default_decimal_parameters)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse(
+    text: str, default_decimal_parameters: tuple[int | None, int | None]
+) -> dt.DataType:
+    return _parser(default_decimal_parameters).parse(text)
+
+
+@functools.lru_cache(maxsize=8)
+def _parser(default_decimal_parameters: tuple[int | None, int | None]) -> parsy.Parser:
+    """Build the datatype grammar."""
     geotype = spaceless_string("geography", "geometry")
 
     srid_geotype = SEMICOLON.then(parsy.seq(srid=NUMBER.skip(COLON), geotype=geotype))
@@ -184,4 +237,4 @@ def parse(
         | spaceless_string("str").result(dt.string)
     )
 
-    return ty.parse(text)
+    return ty
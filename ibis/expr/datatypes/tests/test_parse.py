@@ -2,6 +2,7 @@ import parsy
 import pytest
 
 import ibis.expr.datatypes as dt
+from ibis.expr.datatypes.parse import _PRIMITIVES, _parse, _parser
 
 
 @pytest.mark.parametrize(
@@ -252,3 +253,20 @@ def test_parse_time():
 
 def test_parse_null():
     assert dt.parse("null") == dt.null
+
+
+@pytest.mark.parametrize("text", sorted(_PRIMITIVES))
+def test_parse_primitive_fast_path(text):
+    # the names resolved without the parser must agree with the grammar
+    assert _parser((None, None)).parse(text) == dt.parse(text)
+    assert _parser((None, None)).parse(text.upper()) == dt.parse(text)
+
+
+def test_parse_cache():
+    _parse.cache_clear()
+    text = "array<struct<a: int64, b: map<string, array<float64>>>>"
+    assert dt.parse(text) is dt.parse(text)
+    assert dt.parse(" INT64 ") == dt.int64
+
+    info = _parse.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import collections
+import hashlib
 import itertools
 from abc import abstractmethod
 from typing import TYPE_CHECKING
@@ -98,6 +99,30 @@ class TableProxy(Immutable):
         data_repr = util.indent(repr(self._data), spaces=2)
         return f"{self.__class__.__name__}:\n{data_repr}"
 
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def fingerprint(self, schema: Schema) -> str | None:
+        """Return a digest of the data and `schema`.
+
+        Equal digests imply equal data, while equal data may have different
+        digests depending on its memory layout.
+
+        Returns
+        -------
+        str | None
+            The hex digest, `None` if the data can't be hashed
+        """
+        hasher = hashlib.blake2b(repr(schema).encode(), digest_size=16)
+        try:
+            self._update_hash(hasher)
+        except TypeError:
+            return None
+        return hasher.hexdigest()
+
+    def _update_hash(self, hasher) -> None:
+        raise TypeError(f"{self.__class__.__name__} data can't be hashed")
+
     @abc.abstractmethod
     def to_frame(self) -> pd.DataFrame:  # pragma: no cover
         """Convert this input to a pandas DataFrame."""
@@ -125,6 +150,34 @@ class PyArrowTableProxy(TableProxy):
     def to_pyarrow(self, schema: Schema) -> pa.Table:
         return self._data
 
+    def _update_hash(self, hasher) -> None:
+        import pyarrow as pa
+
+        table = self._data
+        hasher.update(str(table.shape).encode())
+        for column in table.columns:
+            typ = column.type
+            # the buffers of nested and dictionary arrays don't hold all of
+            # their values, these are serialized instead
+            serialize = (
+                pa.types.is_nested(typ)
+                or pa.types.is_dictionary(typ)
+                or isinstance(typ, pa.ExtensionType)
+            )
+            for chunk in column.chunks:
+                if serialize:
+                    out = pa.BufferOutputStream()
+                    batch = pa.RecordBatch.from_arrays([chunk], names=["_"])
+                    with pa.ipc.new_stream(out, batch.schema) as writer:
+                        writer.write_batch(batch)
+                    hasher.update(out.getvalue())
+                    continue
+
+                # the buffers of sliced arrays extend past the sliced values
+                hasher.update(f"{chunk.offset:d}:{len(chunk):d}".encode())
+                for buffer in chunk.buffers():
+                    hasher.update(b"-" if buffer is None else buffer)
+
 
 class PandasDataFrameProxy(TableProxy):
     __slots__ = ()
@@ -139,6 +192,14 @@ class PandasDataFrameProxy(TableProxy):
 
         return pa.Table.from_pandas(self._data, schema=schema_to_pyarrow(schema))
 
+    def _update_hash(self, hasher) -> None:
+        import pandas as pd
+
+        df = self._data
+        hasher.update(str(df.shape).encode())
+        # raises a TypeError for unhashable values like lists
+        hasher.update(pd.util.hash_pandas_object(df, index=False).values)
+
 
 @public
 class InMemoryTable(PhysicalTable):
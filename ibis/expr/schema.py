@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any
 
@@ -39,6 +40,9 @@ result : pd.Series
 """,
 )
 
+# number of input dtype combinations `Schema.apply_to` keeps conversions for
+_MAX_PANDAS_PLANS = 8
+
 
 class Schema(Concrete, Coercible, MapSet):
     """An object for holding table schema information."""
@@ -87,6 +91,11 @@ class Schema(Concrete, Coercible, MapSet):
     def _name_locs(self) -> dict[str, int]:
         return {v: i for i, v in enumerate(self.names)}
 
+    @attribute.default
+    def _pandas_plans(self) -> dict[tuple, tuple[tuple, tuple]]:
+        # conversions computed by `apply_to` keyed by the input dtypes
+        return {}
+
     def equals(self, other: Schema) -> bool:
         """Return whether `other` is equal to `self`.
 
@@ -299,19 +308,65 @@ class Schema(Concrete, Coercible, MapSet):
         x                 int16
         dtype: object
         """
-        schema_names = self.names
-        data_columns = df.columns
-
-        assert len(schema_names) == len(
-            data_columns
+        assert len(self.names) == len(
+            df.columns
         ), "schema column count does not match input data column count"
 
-        for column, dtype in zip(data_columns, self.types):
-            pandas_dtype = dtype.to_pandas()
+        # the schema's column names may be different than the input columns,
+        # rename first so that the columns can be addressed by their unique
+        # names below
+        df.columns = self.names
+
+        dtypes = tuple(df.dtypes)
+        try:
+            casts, conversions = self._pandas_plans[dtypes]
+        except KeyError:
+            casts, conversions = self._plan_pandas_conversion(dtypes)
+            if len(self._pandas_plans) >= _MAX_PANDAS_PLANS:
+                self._pandas_plans.clear()
+            self._pandas_plans[dtypes] = casts, conversions
+        except TypeError:
+            # unhashable extension dtypes
+            casts, conversions = self._plan_pandas_conversion(dtypes)
+
+        columns = {}
+        for pandas_dtype, names in casts:
+            try:
+                # columns sharing their dtypes are cast block-wise
+                columns.update(df[list(names)].astype(pandas_dtype).items())
+            except Exception:  # noqa: BLE001
+                # let the conversion rules handle the failing columns
+                conversions += tuple((name, self[name]) for name in names)
+        for name, dtype in conversions:
+            col = df[name]
+            columns[name] = convert(col.dtype, dtype, col)
+
+        set_column = getattr(df, "isetitem", None)
+        # replacing the trailing columns of a block first splits off less of it
+        for name in sorted(columns, key=self._name_locs.__getitem__, reverse=True):
+            if set_column is None:
+                df[name] = columns[name]
+            else:
+                # avoids the alignment and consolidation done by `__setitem__`
+                set_column(self._name_locs[name], columns[name])
+        return df
 
-            col = df[column]
-            col_dtype = col.dtype
+    def _plan_pandas_conversion(self, dtypes: tuple) -> tuple[tuple, tuple]:
+        """Compute the conversions of the columns of a DataFrame with `dtypes`.
 
+        Columns that already have the right dtype are left out. Columns only
+        needing an `astype` are grouped by their target dtype so that they can
+        be cast together, the others are converted one by one.
+        """
+        import pandas as pd
+
+        import ibis.formats.pandas  # noqa: F401, registers the conversion rules
+
+        generic = convert.dispatch(object, dt.DataType, pd.Series)
+
+        casts, conversions = defaultdict(list), []
+        for name, dtype, col_dtype in zip(self.names, self.types, dtypes):
+            pandas_dtype = dtype.to_pandas()
             try:
                 not_equal = pandas_dtype != col_dtype
             except TypeError:
@@ -319,16 +374,16 @@ class Schema(Concrete, Coercible, MapSet):
                 # assume not equal
                 not_equal = True
 
-            if not_equal or not dtype.is_primitive():
-                new_col = convert(col_dtype, dtype, col)
+            if not not_equal and dtype.is_primitive():
+                continue
+            elif convert.dispatch(type(col_dtype), type(dtype), pd.Series) is generic:
+                casts[pandas_dtype].append(name)
             else:
-                new_col = col
-            df[column] = new_col
-
-        # return data with the schema's columns which may be different than the
-        # input columns
-        df.columns = schema_names
-        return df
+                conversions.append((name, dtype))
+        casts = tuple(
+            (pandas_dtype, tuple(names)) for pandas_dtype, names in casts.items()
+        )
+        return casts, tuple(conversions)
 
 
 @lazy_singledispatch
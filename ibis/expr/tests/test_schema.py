@@ -193,6 +193,40 @@ def test_apply_to_column_order(df):
     tm.assert_frame_equal(new_df, expected)
 
 
+def test_apply_to_skips_matching_columns():
+    df = pd.DataFrame(
+        {
+            "a": np.arange(3, dtype="int64"),
+            "b": np.arange(3, dtype="int32"),
+            "c": ["1", "2", "3"],
+        }
+    )
+    a = df["a"].values
+    schema = sch.Schema({"a": "int64", "b": "int64", "c": "string"})
+
+    result = schema.apply_to(df)
+    assert np.shares_memory(result["a"].values, a)
+    assert result.dtypes.tolist() == [np.int64, np.int64, object]
+
+    # the conversions are planned once per combination of input dtypes
+    assert list(schema._pandas_plans) == [
+        (np.dtype("int64"), np.dtype("int32"), np.dtype("O"))
+    ]
+    casts, conversions = next(iter(schema._pandas_plans.values()))
+    assert casts == ((np.dtype("int64"), ("b",)),)
+    assert conversions == (("c", dt.string),)
+
+
+def test_apply_to_failing_cast():
+    df = pd.DataFrame({"a": ["1", "x"], "b": np.arange(2, dtype="int8")})
+    schema = sch.Schema({"a": "float64", "b": "int16"})
+
+    result = schema.apply_to(df)
+    # columns which can't be cast keep their values
+    assert result["a"].tolist() == ["1", "x"]
+    assert result["b"].dtype == np.int16
+
+
 def test_api_accepts_schema_objects():
     s1 = sch.schema(dict(a="int", b="str"))
     s2 = sch.schema(s1)
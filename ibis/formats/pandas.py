@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
+import json.scanner
 import warnings
 from uuid import UUID
 
 import numpy as np
 import pandas as pd
 import pandas.api.types as pdt
+import pyarrow as pa
+import pyarrow.types as pat
 from dateutil.parser import parse as date_parse
 
 import ibis.expr.datatypes as dt
@@ -23,6 +26,9 @@ if not _has_arrow_dtype:
         "Install pandas >= 1.5.0 for interop with pandas and arrow dtype support"
     )
 
+# scans a single JSON value starting at a given index of a string
+_scan_json = json.scanner.make_scanner(json.JSONDecoder())
+
 
 def dtype_to_pandas(dtype: dt.DataType):
     """Convert ibis dtype to the pandas / numpy alternative."""
@@ -54,6 +60,115 @@ def dtype_from_pandas(typ, nullable=True):
         return dtype_from_numpy(typ, nullable=nullable)
 
 
+def to_arrow_dtypes(df: pd.DataFrame, schema: sch.Schema | None = None) -> pd.DataFrame:
+    """Convert the columns of `df` to pyarrow backed `pd.ArrowDtype` columns.
+
+    Columns already backed by pyarrow are reused without copying and columns
+    pyarrow cannot represent, like ones mixing arbitrary Python objects, keep
+    their dtype.
+
+    Parameters
+    ----------
+    df
+        Input DataFrame, left unchanged
+    schema
+        Optional schema to cast the columns to, its names replace the column
+        names of `df`
+
+    Returns
+    -------
+    DataFrame
+        DataFrame with pyarrow backed columns
+    """
+    if not _has_arrow_dtype:
+        raise NotImplementedError(
+            f"pyarrow backed columns require pandas>=1.5, got {pd.__version__}"
+        )
+    if schema is None:
+        names, types = df.columns, [None] * len(df.columns)
+    else:
+        names, types = schema.names, schema.types
+
+    columns = {
+        name: _to_arrow_array(df.iloc[:, i], dtype)
+        for i, (name, dtype) in enumerate(zip(names, types))
+    }
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def _to_arrow_array(column: pd.Series, dtype: dt.DataType | None):
+    values = column.array
+    try:
+        arrow_type = None if dtype is None else dtype.to_pyarrow()
+        if _has_arrow_dtype and isinstance(column.dtype, pd.ArrowDtype):
+            if arrow_type is None or column.dtype.pyarrow_dtype == arrow_type:
+                return values
+            array = pa.array(values).cast(arrow_type)
+        else:
+            array = pa.array(values, type=arrow_type, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, TypeError):
+        return values
+    return pd.arrays.ArrowExtensionArray(array)
+
+
+def pyarrow_to_pylist(values: pa.Array | pa.ChunkedArray) -> list:
+    """Convert `values` to a list of Python objects.
+
+    Nested values are assembled from the flat child arrays, which is much
+    faster than `to_pylist` for lists, structs and maps. Maps are converted
+    to dictionaries instead of lists of key-value tuples.
+
+    Parameters
+    ----------
+    values
+        Arrow data to convert
+
+    Returns
+    -------
+    list
+        Python objects, nulls are `None`
+    """
+    if isinstance(values, pa.ChunkedArray):
+        return [value for chunk in values.chunks for value in pyarrow_to_pylist(chunk)]
+
+    typ = values.type
+    if pat.is_map(typ):
+        offsets = values.offsets.to_numpy().tolist()
+        keys = pyarrow_to_pylist(values.keys)
+        items = pyarrow_to_pylist(values.items)
+        result = [
+            dict(zip(keys[start:stop], items[start:stop]))
+            for start, stop in zip(offsets, offsets[1:])
+        ]
+    elif pat.is_list(typ) or pat.is_large_list(typ):
+        # the offsets of sliced arrays index into the unsliced values
+        offsets = values.offsets.to_numpy().tolist()
+        flat = pyarrow_to_pylist(values.values)
+        result = [flat[start:stop] for start, stop in zip(offsets, offsets[1:])]
+    elif pat.is_struct(typ):
+        names = [field.name for field in typ]
+        fields = [pyarrow_to_pylist(values.field(i)) for i in range(len(names))]
+        result = [dict(zip(names, row)) for row in zip(*fields)]
+    elif pat.is_integer(typ):
+        # NumPy would turn integers with nulls into floats
+        result = values.fill_null(0).to_numpy().tolist()
+    elif (
+        pat.is_floating(typ)
+        or pat.is_boolean(typ)
+        or pat.is_string(typ)
+        or pat.is_large_string(typ)
+    ):
+        result = values.to_numpy(zero_copy_only=False).tolist()
+    else:
+        return values.to_pylist()
+
+    if values.null_count:
+        nulls = values.is_null().to_numpy(zero_copy_only=False)
+        for i in np.flatnonzero(nulls).tolist():
+            result[i] = None
+    return result
+
+
 def schema_to_pandas(schema):
     pandas_types = map(dtype_to_pandas, schema.types)
     return list(zip(schema.names, pandas_types))
@@ -172,14 +287,41 @@ def convert_struct_to_dict(_, out_dtype, column):
     return column.map(convert_element)
 
 
+def _convert_elements(column: pd.Series, convert_element) -> pd.Series:
+    return pd.Series(
+        list(map(convert_element, column)),
+        index=column.index,
+        name=column.name,
+        dtype=object,
+    )
+
+
+def _convert_array_element(value):
+    # check the common types first, `util.is_iterable` is comparatively slow
+    if value is None or type(value) is list:
+        return value
+    elif isinstance(value, np.ndarray):
+        # keep the NumPy scalars, their types are more precise than Python's
+        return list(value)
+    return list(value) if util.is_iterable(value) else value
+
+
+def _convert_map_element(value):
+    if value is None or type(value) is dict:
+        return value
+    elif type(value) is list:
+        return dict(value)
+    return dict(value) if util.is_iterable(value) else value
+
+
 @sch.convert.register(np.dtype, dt.Array, pd.Series)
 def convert_array_to_series(in_dtype, out_dtype, column):
-    return column.map(lambda x: list(x) if util.is_iterable(x) else x)
+    return _convert_elements(column, _convert_array_element)
 
 
 @sch.convert.register(np.dtype, dt.Map, pd.Series)
 def convert_map_to_series(in_dtype, out_dtype, column):
-    return column.map(lambda x: dict(x) if util.is_iterable(x) else x)
+    return _convert_elements(column, _convert_map_element)
 
 
 @sch.convert.register(np.dtype, dt.JSON, pd.Series)
@@ -192,4 +334,17 @@ def convert_json_to_series(in_, out, col: pd.Series):
         except (TypeError, json.JSONDecodeError):
             return x
 
-    return pd.Series(list(map(try_json, col)), dtype="object")
+    def parse(x):
+        # scanning with the decoder's scanner skips the per call overhead of
+        # `json.loads`, a document is valid only if its value spans all of it
+        if isinstance(x, str):
+            try:
+                value, end = _scan_json(x, 0)
+            except (StopIteration, json.JSONDecodeError):
+                pass
+            else:
+                if end == len(x):
+                    return value
+        return try_json(x)
+
+    return pd.Series(list(map(parse, col)), dtype="object")
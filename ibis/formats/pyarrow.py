@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 import pyarrow as pa
 
 import ibis.expr.datatypes as dt
@@ -164,6 +166,21 @@ def schema_to_pyarrow(schema: Schema) -> pa.Schema:
     return pa.schema(fields)
 
 
+def record_batch_from_rows(
+    rows: Sequence[Sequence], schema: pa.Schema
+) -> pa.RecordBatch:
+    """Construct a record batch with `schema` from a sequence of rows.
+
+    The rows are converted in a single pass as a struct array whose field
+    types are taken from `schema`, so no type inference happens. This is
+    measurably faster than transposing the rows and converting each column
+    separately, see the `to_pyarrow_batches` benchmarks.
+    """
+    struct = pa.struct(list(schema))
+    array = pa.array(map(tuple, rows), type=struct)
+    return pa.RecordBatch.from_struct_array(array)
+
+
 def _infer_array_dtype(x):
     try:
         pyarrow_type = pa.array(x, from_pandas=True).type
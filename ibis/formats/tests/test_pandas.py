@@ -3,6 +3,7 @@ from decimal import Decimal
 
 import numpy as np
 import pandas as pd
+import pandas.testing as tm
 import pyarrow as pa
 import pytest
 from pytest import param
@@ -12,9 +13,11 @@ import ibis.expr.schema as sch
 from ibis.formats.pandas import (
     dtype_from_pandas,
     dtype_to_pandas,
+    pyarrow_to_pylist,
     schema_from_pandas,
     schema_from_pandas_dataframe,
     schema_to_pandas,
+    to_arrow_dtypes,
 )
 
 
@@ -421,3 +424,94 @@ def test_schema_from_various_dataframes(col_data, schema_type):
     inferred = schema_from_pandas_dataframe(df)
     expected = sch.Schema({'col': schema_type})
     assert inferred == expected
+
+
+def test_to_arrow_dtypes():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, None],
+            "b": ["x", None, "z"],
+            "c": pd.Categorical(["x", "y", "x"]),
+            "d": [1, "a", 2.0],
+        }
+    )
+    schema = sch.Schema(dict(a="int64", b="string", c="string", d="string"))
+
+    result = to_arrow_dtypes(df, schema)
+    assert result.dtypes.tolist() == [
+        pd.ArrowDtype(pa.int64()),
+        pd.ArrowDtype(pa.string()),
+        pd.ArrowDtype(pa.string()),
+        np.dtype(object),
+    ]
+    assert result.a.tolist() == [1, 2, pd.NA]
+    # pyarrow backed columns are reused
+    assert to_arrow_dtypes(result).b.array is result.b.array
+
+
+@pytest.mark.parametrize(
+    ("values", "typ"),
+    [
+        param([[1, None], None, [], [3]], pa.list_(pa.int64()), id="list"),
+        param(
+            [{"a": 1, "b": ["x"]}, None, {"a": None, "b": None}],
+            pa.struct([("a", pa.int64()), ("b", pa.list_(pa.string()))]),
+            id="struct",
+        ),
+        param(
+            [[("a", 1.5)], None, [], [("b", None), ("c", 2.0)]],
+            pa.map_(pa.string(), pa.float64()),
+            id="map",
+        ),
+        param(
+            [[True], [None, False], None], pa.large_list(pa.bool_()), id="large_list"
+        ),
+    ],
+)
+def test_pyarrow_to_pylist(values, typ):
+    array = pa.array(values, type=typ)
+
+    def expected(array):
+        result = array.to_pylist()
+        if pa.types.is_map(typ):
+            return [None if value is None else dict(value) for value in result]
+        return result
+
+    assert pyarrow_to_pylist(array) == expected(array)
+    assert pyarrow_to_pylist(array.slice(1)) == expected(array.slice(1))
+
+    chunked = pa.chunked_array([array, array.slice(2)])
+    assert pyarrow_to_pylist(chunked) == expected(chunked)
+
+
+def test_pyarrow_to_pylist_keeps_integers():
+    array = pa.array([{"a": 1}, None], type=pa.struct([("a", pa.int64())]))
+    (result, _) = pyarrow_to_pylist(array)
+    assert type(result["a"]) is int
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        param(['{"a": 1}', None, "[1, 2]"], [{"a": 1}, None, [1, 2]], id="valid"),
+        param(['{"a": 1}', "not json", ""], [{"a": 1}, "not json", ""], id="invalid"),
+        param(["1, 2", "3"], ["1, 2", 3], id="multiple_values"),
+        param(["[1", "2]", "3,4"], ["[1", "2]", "3,4"], id="split_document"),
+        param(['{"a": 1}', np.nan], [{"a": 1}, np.nan], id="nan"),
+        param([' {"a": 1}\n', "  "], [{"a": 1}, "  "], id="whitespace"),
+    ],
+)
+def test_convert_json(data, expected):
+    column = pd.Series(data, dtype=object)
+    result = sch.convert(column.dtype, dt.json, column)
+    tm.assert_series_equal(result, pd.Series(expected, dtype=object))
+
+
+def test_convert_nested_elements():
+    arrays = pd.Series([np.array([1, 2]), None, (3,), [4]], dtype=object)
+    result = sch.convert(arrays.dtype, dt.Array(dt.int64), arrays)
+    assert result.tolist() == [[1, 2], None, [3], [4]]
+
+    maps = pd.Series([[("a", 1)], None, {"b": 2}, (("c", 3),)], dtype=object)
+    result = sch.convert(maps.dtype, dt.Map(dt.string, dt.int64), maps)
+    assert result.tolist() == [{"a": 1}, None, {"b": 2}, {"c": 3}]
@@ -9,6 +9,7 @@ from ibis.common.exceptions import IntegrityError
 from ibis.formats.pyarrow import (
     dtype_from_pyarrow,
     dtype_to_pyarrow,
+    record_batch_from_rows,
     schema_from_pyarrow,
     schema_to_pyarrow,
 )
@@ -158,3 +159,30 @@ def test_schema_roundtrip(pyarrow_schema):
 
 def test_unknown_dtype_gets_converted_to_string():
     assert dtype_to_pyarrow(dt.unknown) == pa.string()
+
+
+def test_record_batch_from_rows():
+    schema = pa.schema(
+        [
+            pa.field('a', pa.int64()),
+            pa.field('b', pa.string()),
+            pa.field('c', pa.list_(pa.float64())),
+        ]
+    )
+    rows = [(1, 'x', [1.0]), (None, None, None), (3, 'z', [])]
+
+    batch = record_batch_from_rows(rows, schema)
+
+    assert batch.schema.equals(schema)
+    assert batch.to_pylist() == [
+        dict(a=1, b='x', c=[1.0]),
+        dict(a=None, b=None, c=None),
+        dict(a=3, b='z', c=[]),
+    ]
+
+
+def test_record_batch_from_no_rows():
+    schema = pa.schema([pa.field('a', pa.int64()), pa.field('b', pa.string())])
+    batch = record_batch_from_rows([], schema)
+    assert batch.schema.equals(schema)
+    assert batch.num_rows == 0
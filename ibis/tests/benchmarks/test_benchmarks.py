@@ -2,8 +2,10 @@ import copy
 import functools
 import inspect
 import itertools
+import os
 import string
 import tempfile
+import tracemalloc
 from pathlib import Path
 
 import numpy as np
@@ -16,7 +18,11 @@ import ibis
 import ibis.expr.datatypes as dt
 import ibis.expr.types as ir
 from ibis.backends.base import _get_backend_names
+from ibis.backends.base.sql.alchemy import BaseAlchemyBackend
 from ibis.backends.pandas.udf import udf
+from ibis.common.grounds import interning
+from ibis.expr.datatypes.parse import _parse
+from ibis.formats.pyarrow import record_batch_from_rows
 
 pytestmark = pytest.mark.benchmark
 
@@ -195,6 +201,122 @@ def test_compile(benchmark, module, expr_fn, t, base, large_expr):
             pytest.skip(str(e))
 
 
+@pytest.mark.benchmark(group="compilation")
+@pytest.mark.parametrize("cache_size", [None, 128], ids=["uncached", "cached"])
+def test_compile_cache(benchmark, cache_size, large_expr):
+    pytest.importorskip("duckdb")
+    pytest.importorskip("duckdb_engine")
+
+    con = ibis.duckdb.connect()
+    with ibis.config.option_context("sql.compile_cache_size", cache_size):
+        benchmark(con.compile, large_expr)
+
+
+@pytest.fixture(scope="module")
+def nested_arrays():
+    pa = pytest.importorskip("pyarrow")
+
+    n = 1_000_000
+    return {
+        "array": pa.array(
+            [list(range(i % 5)) if i % 10 else None for i in range(n)],
+            type=pa.list_(pa.int64()),
+        ),
+        "struct": pa.array(
+            [{"a": i, "b": str(i)} if i % 10 else None for i in range(n)],
+            type=pa.struct([("a", pa.int64()), ("b", pa.string())]),
+        ),
+        "map": pa.array(
+            [[("k", i), ("j", i + 1)] if i % 10 else None for i in range(n)],
+            type=pa.map_(pa.string(), pa.int64()),
+        ),
+    }
+
+
+@pytest.mark.benchmark(group="nested_to_pandas")
+@pytest.mark.parametrize("kind", ["array", "struct", "map"])
+@pytest.mark.parametrize("method", ["to_pylist", "pyarrow_to_pylist"])
+def test_nested_to_pylist(benchmark, nested_arrays, kind, method):
+    from ibis.formats.pandas import pyarrow_to_pylist
+
+    values = nested_arrays[kind]
+    func = pyarrow_to_pylist if method == "pyarrow_to_pylist" else values.to_pylist
+    args = (values,) if method == "pyarrow_to_pylist" else ()
+    result = benchmark.pedantic(func, args=args, rounds=3)
+    assert len(result) == len(values)
+
+
+@pytest.mark.benchmark(group="nested_to_pandas")
+def test_convert_json(benchmark):
+    import ibis.expr.schema as sch
+
+    column = pd.Series(
+        [f'{{"a": {i:d}, "b": [1, 2]}}' if i % 10 else None for i in range(1_000_000)]
+    )
+    result = benchmark.pedantic(
+        sch.convert, args=(column.dtype, dt.json, column), rounds=3
+    )
+    assert len(result) == len(column)
+
+
+@pytest.mark.benchmark(group="apply_schema")
+@pytest.mark.parametrize("cast", ["none", "half", "all"])
+def test_apply_to_wide(benchmark, cast):
+    num_columns = 1_000
+    schema = ibis.schema({f"c{i:d}": "int64" for i in range(num_columns)})
+    ncast = {"none": 0, "half": num_columns // 2, "all": num_columns}[cast]
+
+    def setup():
+        df = pd.DataFrame(
+            {
+                name: np.arange(10_000, dtype="int32" if i < ncast else "int64")
+                for i, name in enumerate(schema.names)
+            }
+        )
+        return (df,), {}
+
+    result = benchmark.pedantic(schema.apply_to, setup=setup, rounds=5)
+    assert (result.dtypes == np.int64).all()
+
+
+@pytest.fixture(scope="module")
+def wide_rows():
+    pa = pytest.importorskip("pyarrow")
+
+    nrows, ncols = 10_000, 50
+    schema = pa.schema(
+        [
+            pa.field(f"c{i:d}", pa.int64() if i % 2 else pa.string())
+            for i in range(ncols)
+        ]
+    )
+    rows = [tuple(i if j % 2 else str(i) for j in range(ncols)) for i in range(nrows)]
+    return rows, schema
+
+
+def _columnar_record_batch(rows, schema):
+    import pyarrow as pa
+
+    arrays = [
+        pa.array(column, type=field.type) for column, field in zip(zip(*rows), schema)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+@pytest.mark.benchmark(group="to_pyarrow_batches")
+@pytest.mark.parametrize(
+    "build",
+    [
+        pytest.param(record_batch_from_rows, id="struct"),
+        pytest.param(_columnar_record_batch, id="columnar"),
+    ],
+)
+def test_record_batch_from_rows(benchmark, build, wide_rows):
+    rows, schema = wide_rows
+    batch = benchmark(build, rows, schema)
+    assert batch.num_rows == len(rows)
+
+
 @pytest.fixture(scope="module")
 def pt():
     n = 60_000
@@ -325,6 +447,19 @@ def high_card_grouped_rolling_udf_wm(t):
     return my_wm(t.value, t.value).over(low_card_rolling_window(t))
 
 
+@udf.reduction(['double', 'double'], 'double', vectorized=True)
+def my_vectorized_wm(v, w):
+    return np.average(v, weights=w, axis=-1)
+
+
+def low_card_grouped_rolling_vectorized_udf_wm(t):
+    return my_vectorized_wm(t.value, t.value).over(low_card_rolling_window(t))
+
+
+def high_card_grouped_rolling_vectorized_udf_wm(t):
+    return my_vectorized_wm(t.value, t.value).over(high_card_rolling_window(t))
+
+
 broken_pandas_grouped_rolling = pytest.mark.xfail(
     condition=vparse("1.4") <= vparse(pd.__version__) < vparse("1.4.2"),
     raises=ValueError,
@@ -378,6 +513,16 @@ broken_pandas_grouped_rolling = pytest.mark.xfail(
             id="high_card_grouped_rolling_udf_wm",
             marks=[broken_pandas_grouped_rolling],
         ),
+        pytest.param(
+            low_card_grouped_rolling_vectorized_udf_wm,
+            id="low_card_grouped_rolling_vectorized_udf_wm",
+            marks=[broken_pandas_grouped_rolling],
+        ),
+        pytest.param(
+            high_card_grouped_rolling_vectorized_udf_wm,
+            id="high_card_grouped_rolling_vectorized_udf_wm",
+            marks=[broken_pandas_grouped_rolling],
+        ),
     ],
 )
 def test_execute(benchmark, expression_fn, pt):
@@ -385,6 +530,98 @@ def test_execute(benchmark, expression_fn, pt):
     benchmark(expr.execute)
 
 
+def shared_subexpressions(t):
+    shared = (t.value - t.value.mean()) / t.value.std()
+    return t.filter(shared.abs() < 2).select(
+        key=t.key,
+        zscore=shared,
+        clipped=shared.clip(-1, 1),
+        squared=shared * shared,
+        positive=shared > 0,
+    )
+
+
+@pytest.mark.benchmark(group="execution")
+@pytest.mark.parametrize("planned", [True, False], ids=["planned", "unplanned"])
+def test_execute_shared_subexpressions(benchmark, monkeypatch, pt, planned):
+    from ibis.backends.pandas.execution import selection
+
+    if not planned:
+        monkeypatch.setattr(
+            selection,
+            "execute_shared_subexpressions",
+            lambda op, data, scope, timecontext, **kwargs: scope,
+        )
+
+    expr = shared_subexpressions(pt)
+    # warm up so that the measurement excludes one-off allocations
+    expr.execute()
+
+    tracemalloc.start()
+    try:
+        expr.execute()
+        _, benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    benchmark(expr.execute)
+
+
+def string_ops(t):
+    strings = t.timestamp_strings
+    return t.select(
+        upper=strings.upper(),
+        length=strings.length(),
+        prefix=strings.substr(0, 10),
+        matches=strings.re_search(":5[0-9]$"),
+        year=t.timestamps.year(),
+    )
+
+
+@pytest.mark.benchmark(group="execution")
+@pytest.mark.parametrize("dtype_backend", ["numpy", "pyarrow"])
+def test_execute_dtype_backend(benchmark, pt, dtype_backend):
+    expr = string_ops(pt)
+    with ibis.config.option_context("pandas.dtype_backend", dtype_backend):
+        benchmark(expr.execute)
+
+
+@pytest.fixture(scope="module")
+def small_pt():
+    df = pd.DataFrame({"key": list("abcab"), "value": np.arange(5.0)})
+    return ibis.pandas.connect(dict(df=df)).table("df")
+
+
+@pytest.mark.benchmark(group="small_execution")
+@pytest.mark.parametrize("tracked", [True, False], ids=["tracked", "untracked"])
+def test_execute_small_scope_tracking(benchmark, monkeypatch, small_pt, tracked):
+    from ibis.backends.base.df.scope import ScopeTracker
+    from ibis.backends.pandas import core
+
+    if not tracked:
+
+        class UntrackedScope(ScopeTracker):
+            def __init__(self, node, cache, measure=False):
+                pass
+
+            def enter(self):
+                return 0
+
+            def exit(self, frame, node, value):
+                pass
+
+        monkeypatch.setattr(core, "ScopeTracker", UntrackedScope)
+
+    t = small_pt
+    expr = (
+        t.filter(t.value > 0)
+        .group_by("key")
+        .aggregate(total=t.value.sum(), n=t.count())
+        .order_by("key")
+    )
+    benchmark(expr.execute)
+
+
 @pytest.fixture(scope="module")
 def part():
     return ibis.table(
@@ -439,8 +676,7 @@ def region():
     return ibis.table(dict(r_regionkey="int64", r_name="string"), name="region")
 
 
-@pytest.fixture(scope="module")
-def tpc_h02(part, supplier, partsupp, nation, region):
+def make_tpc_h02(part, supplier, partsupp, nation, region):
     REGION = "EUROPE"
     SIZE = 25
     TYPE = "BRASS"
@@ -493,6 +729,11 @@ def tpc_h02(part, supplier, partsupp, nation, region):
     ).limit(100)
 
 
+@pytest.fixture(scope="module")
+def tpc_h02(part, supplier, partsupp, nation, region):
+    return make_tpc_h02(part, supplier, partsupp, nation, region)
+
+
 @pytest.mark.benchmark(group="repr")
 def test_repr_tpc_h02(benchmark, tpc_h02):
     benchmark(repr, tpc_h02)
@@ -542,6 +783,40 @@ def test_complex_datatype_parse(benchmark):
     benchmark(dt.parse, type_str)
 
 
+_WIDE_SCHEMA_TYPES = {
+    "primitive": ["int64", "float64", "string", "boolean", "date", "timestamp"],
+    "complex": [
+        f"array<struct<a{i}: array<string>, b: map<string, array<int64>>>>"
+        for i in range(50)
+    ],
+}
+_WIDE_SCHEMA_TYPES["mixed"] = [
+    *_WIDE_SCHEMA_TYPES["primitive"],
+    *_WIDE_SCHEMA_TYPES["complex"][:10],
+]
+
+
+@pytest.fixture(scope="module", params=sorted(_WIDE_SCHEMA_TYPES))
+def wide_string_schema(request):
+    types = _WIDE_SCHEMA_TYPES[request.param]
+    return {f"col{i:d}": types[i % len(types)] for i in range(1_000)}
+
+
+@pytest.mark.benchmark(group="datatype")
+@pytest.mark.parametrize("cache", ["warm", "cold"])
+def test_wide_schema_from_strings(benchmark, wide_string_schema, cache):
+    if cache == "warm":
+        ibis.schema(wide_string_schema)
+        benchmark(ibis.schema, wide_string_schema)
+    else:
+        benchmark.pedantic(
+            ibis.schema,
+            args=(wide_string_schema,),
+            setup=_parse.cache_clear,
+            rounds=5,
+        )
+
+
 @pytest.mark.benchmark(group="datatype")
 @pytest.mark.parametrize("func", [str, hash])
 def test_complex_datatype_builtins(benchmark, func):
@@ -556,6 +831,32 @@ def test_large_expr_equals(benchmark, tpc_h02):
     benchmark(ir.Expr.equals, tpc_h02, copy.deepcopy(tpc_h02))
 
 
+@pytest.mark.benchmark(group="equality")
+@pytest.mark.parametrize("interned", [False, True], ids=["plain", "interned"])
+def test_large_expr_equals_separately_built(
+    benchmark, part, supplier, partsupp, nation, region, interned
+):
+    tables = part, supplier, partsupp, nation, region
+    with interning(interned):
+        left = make_tpc_h02(*tables)
+        right = make_tpc_h02(*tables)
+    benchmark(ir.Expr.equals, left, right)
+
+
+@pytest.mark.benchmark(group="traversal")
+@pytest.mark.parametrize("expr_name", ["large_expr", "tpc_h02"])
+def test_find_backends(benchmark, request, expr_name):
+    expr = request.getfixturevalue(expr_name)
+    benchmark(expr._find_backends)
+
+
+@pytest.mark.benchmark(group="traversal")
+@pytest.mark.parametrize("expr_name", ["large_expr", "tpc_h02"])
+def test_replace(benchmark, request, expr_name):
+    node = request.getfixturevalue(expr_name).op()
+    benchmark(node.replace, {})
+
+
 @pytest.mark.benchmark(group="datatype")
 @pytest.mark.parametrize(
     "dtypes",
@@ -710,17 +1011,60 @@ def test_repr_join(benchmark, customers, orders, orders_items, products):
     benchmark(repr, op)
 
 
+@pytest.fixture(scope="module")
+def insert_data():
+    n_rows = int(1e4)
+    schema = ibis.schema(dict(a="int64", b="int64", c="int64"))
+    return ibis.memtable(dict.fromkeys(list("abc"), range(n_rows)), schema=schema)
+
+
+def _use_executemany(monkeypatch, con):
+    # route DataFrame inserts through the generic chunked executemany path
+    monkeypatch.setattr(
+        con,
+        "_insert_dataframe",
+        functools.partial(BaseAlchemyBackend._insert_dataframe, con),
+    )
+    monkeypatch.setattr(
+        con, "_bulk_insert", functools.partial(BaseAlchemyBackend._bulk_insert, con)
+    )
+
+
+@pytest.mark.parametrize("strategy", ["native", "executemany"])
 @pytest.mark.parametrize("overwrite", [True, False], ids=["overwrite", "no_overwrite"])
-def test_insert_duckdb(benchmark, overwrite):
+def test_insert_duckdb(benchmark, monkeypatch, insert_data, overwrite, strategy):
     pytest.importorskip("duckdb")
     pytest.importorskip("duckdb_engine")
 
-    n_rows = int(1e4)
     table_name = "t"
-    schema = ibis.schema(dict(a="int64", b="int64", c="int64"))
-    t = ibis.memtable(dict.fromkeys(list("abc"), range(n_rows)), schema=schema)
 
     with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as d:
         con = ibis.duckdb.connect(Path(d, "test_insert.ddb"))
-        con.create_table(table_name, schema=schema)
-        benchmark(con.insert, table_name, t, overwrite=overwrite)
+        con.create_table(table_name, schema=insert_data.schema())
+        if strategy == "executemany":
+            _use_executemany(monkeypatch, con)
+        benchmark(con.insert, table_name, insert_data, overwrite=overwrite)
+
+
+@pytest.mark.parametrize("strategy", ["copy", "executemany"])
+def test_insert_postgres(benchmark, monkeypatch, insert_data, strategy):
+    pytest.importorskip("psycopg2")
+
+    try:
+        con = ibis.postgres.connect(
+            host=os.environ.get("IBIS_TEST_POSTGRES_HOST", "localhost"),
+            user=os.environ.get("IBIS_TEST_POSTGRES_USER", "postgres"),
+            password=os.environ.get("IBIS_TEST_POSTGRES_PASSWORD", "postgres"),
+            database=os.environ.get("IBIS_TEST_POSTGRES_DATABASE", "ibis_testing"),
+        )
+    except sa.exc.OperationalError as e:
+        pytest.skip(str(e))
+
+    table_name = ibis.util.gen_name("bench_insert")
+    con.create_table(table_name, schema=insert_data.schema())
+    if strategy == "executemany":
+        _use_executemany(monkeypatch, con)
+    try:
+        benchmark(con.insert, table_name, insert_data, overwrite=True)
+    finally:
+        con.drop_table(table_name)
@@ -1644,6 +1644,38 @@ def test_memtable_filter():
     assert expr.columns == ["x", "y"]
 
 
+def test_memtable_fingerprint():
+    pa = pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": list("xyz")})
+
+    def name(data, **kwargs):
+        return ibis.memtable(data, **kwargs).op().name
+
+    # fresh names unless enabled
+    assert name(df) != name(df)
+
+    with ibis.config.option_context("memtable_fingerprint", True):
+        assert name(df) == name(df.copy())
+        assert name(df) != name(df.head(2))
+        assert name(df) != name(df, schema=dict(a="int32", b="string"))
+        assert name(df, name="t") == "t"
+
+        table = pa.Table.from_pandas(df)
+        assert name(table) == name(pa.Table.from_pandas(df))
+        assert name(table) != name(df)
+        # slices share their buffers
+        assert name(table.slice(0, 1)) != name(table.slice(1, 1))
+
+        nested = pa.table({"s": [{"x": 1}, {"x": 2}]})
+        assert name(nested) == name(pa.table({"s": [{"x": 1}, {"x": 2}]}))
+        assert name(nested.slice(0, 1)) != name(nested.slice(1, 1))
+
+        # unhashable values get a fresh name
+        lists = pd.DataFrame({"a": [[1], [2]]})
+        assert name(lists) != name(lists)
+
+
 def test_default_backend_with_unbound_table():
     t = ibis.table(dict(a="int"), name="t")
     expr = t.a.sum()
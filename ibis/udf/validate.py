@@ -70,3 +70,12 @@ def validate_output_type(output_type: Any) -> None:
 
     if isinstance(output_type, list):
         raise com.IbisTypeError('The output type of a UDF must be a single datatype.')
+
+
+def validate_vectorized_output_type(output_type: DataType) -> None:
+    """Check that a vectorized UDF returns a single value per window."""
+    if output_type.is_struct() or output_type.is_array():
+        raise com.IbisTypeError(
+            'Vectorized UDFs must return scalar values, '
+            f'got output type {output_type}'
+        )
@@ -188,7 +188,7 @@ class UserDefinedFunction:
     UDF.
     """
 
-    def __init__(self, func, func_type, input_type, output_type):
+    def __init__(self, func, func_type, input_type, output_type, vectorized=False):
         v.validate_input_type(input_type, func)
         v.validate_output_type(output_type)
 
@@ -196,6 +196,9 @@ class UserDefinedFunction:
         self.func_type = func_type
         self.input_type = list(map(dt.dtype, input_type))
         self.output_type = dt.dtype(output_type)
+        if vectorized:
+            v.validate_vectorized_output_type(self.output_type)
+        self.vectorized = vectorized
         self.coercion_fn = self._get_coercion_function()
 
     def _get_coercion_function(self):
@@ -240,6 +243,9 @@ class UserDefinedFunction:
                 result = self.coercion_fn(result, self.output_type, saved_index)
             return result
 
+        # backends may call vectorized functions with batches of inputs
+        func.vectorized = self.vectorized
+
         op = self.func_type(
             func=func,
             func_args=args,
@@ -250,9 +256,9 @@ class UserDefinedFunction:
         return op.to_expr()
 
 
-def _udf_decorator(node_type, input_type, output_type):
+def _udf_decorator(node_type, input_type, output_type, **kwargs):
     def wrapper(func):
-        return UserDefinedFunction(func, node_type, input_type, output_type)
+        return UserDefinedFunction(func, node_type, input_type, output_type, **kwargs)
 
     return wrapper
 
@@ -340,7 +346,7 @@ def elementwise(input_type, output_type):
     return _udf_decorator(ElementWiseVectorizedUDF, input_type, output_type)
 
 
-def reduction(input_type, output_type):
+def reduction(input_type, output_type, *, vectorized=False):
     """Define a UDF reduction function that produces 1 row of output for N rows of input.
 
     Parameters
@@ -351,6 +357,12 @@ def reduction(input_type, output_type):
         function. Variadic arguments are not yet supported.
     output_type : ibis.expr.datatypes.DataType
         The return type of the function.
+    vectorized : bool
+        Whether the function reduces along the last axis of its inputs. When
+        evaluating it over a window the pandas backend then passes two
+        dimensional arrays holding one window per row and expects one value
+        per row, instead of calling the function once per window. Struct and
+        array output types can't be vectorized.
 
     Examples
     --------
@@ -374,5 +386,18 @@ def reduction(input_type, output_type):
     >>> table = table.group_by('key').aggregate(  # doctest: +SKIP
     ...     mean_and_std(table['v']).destructure()
     ... )
+
+    Define a reduction that can be evaluated over many windows at once:
+
+    >>> import numpy as np
+    >>> @reduction(
+    ...     input_type=[dt.double, dt.double],
+    ...     output_type=dt.double,
+    ...     vectorized=True,
+    ... )
+    ... def weighted_mean(v, w):
+    ...     return np.average(v, weights=w, axis=-1)
     """
-    return _udf_decorator(ReductionVectorizedUDF, input_type, output_type)
+    return _udf_decorator(
+        ReductionVectorizedUDF, input_type, output_type, vectorized=vectorized
+    )